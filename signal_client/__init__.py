@@ -1,7 +1,15 @@
 """Public package surface for signal-client."""
 
 from .app import Application, SignalClient
-from .core import Command, CommandError, Context, Settings, command
+from .core import (
+    BatchCommand,
+    Command,
+    CommandError,
+    Context,
+    Settings,
+    batch_command,
+    command,
+)
 from .exceptions import (
     AuthenticationError,
     ConfigurationError,
@@ -16,6 +24,7 @@ from .exceptions import (
 __all__ = [
     "Application",
     "AuthenticationError",
+    "BatchCommand",
     "Command",
     "CommandError",
     "ConfigurationError",
@@ -28,5 +37,6 @@ __all__ = [
     "SignalAPIError",
     "SignalClient",
     "UnsupportedMessageError",
+    "batch_command",
     "command",
 ]
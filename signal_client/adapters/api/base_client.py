@@ -12,6 +12,7 @@ import aiohttp
 import structlog
 from yarl import URL
 
+from signal_client.core import serialization
 from signal_client.core.exceptions import (
     AuthenticationError,
     GroupNotFoundError,
@@ -129,7 +130,7 @@ class BaseClient:
             await self._raise_for_status(response)
 
         if response.content_type == "application/json":
-            return await response.json()
+            return await response.json(loads=serialization.loads)
         return await response.read()
 
     async def _raise_for_status(self, response: aiohttp.ClientResponse) -> None:
@@ -166,14 +167,14 @@ class BaseClient:
         try:
             error_body: dict[str, Any] | str
             if response.content_type == "application/json":
-                error_body = await response.json()
+                error_body = await response.json(loads=serialization.loads)
             else:
                 error_body = await response.text()
 
             if isinstance(error_body, dict):
                 message = (
                     f"API Error: {response.status} {response.reason}\n"
-                    f"{json.dumps(error_body)}"
+                    f"{serialization.dumps(error_body)}"
                 )
             else:
                 message = (
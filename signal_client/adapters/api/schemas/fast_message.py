@@ -0,0 +1,398 @@
+"""Lightweight message models built straight from decoded envelopes.
+
+`FastMessage` exposes the same public attributes and helpers as `Message`
+(`recipient()`, `is_group()`, `get_target_chat()`, ...) but is a plain
+`__slots__` class filled in one pass over the raw payload, without pydantic
+validation or intermediate dict rewriting. Attachments, the quote and mentions
+are only built from the payload when first accessed, so text traffic never
+pays for them. Values of the wrong type are dropped to None instead of failing
+the whole message; a payload without a string source or an integer timestamp
+yields no message.
+"""
+
+from __future__ import annotations
+
+import uuid
+from typing import Any, cast
+
+from .message import Message, MessageType
+
+_UNSET = object()
+
+
+class FastAttachment:
+    """Slots counterpart of `AttachmentPointer`."""
+
+    __slots__ = ("content_type", "filename", "id", "size")
+
+    def __init__(
+        self,
+        id: str,  # noqa: A002
+        content_type: str | None = None,
+        filename: str | None = None,
+        size: int | None = None,
+    ) -> None:
+        """Store attachment fields."""
+        self.id = id
+        self.content_type = content_type
+        self.filename = filename
+        self.size = size
+
+    @classmethod
+    def from_raw(cls, raw: object) -> FastAttachment | None:
+        """Build an attachment from a raw dict; None when it has no string id."""
+        if not isinstance(raw, dict):
+            return None
+        attachment_id = raw.get("id")
+        if not isinstance(attachment_id, str):
+            return None
+        content_type = raw.get("contentType") or raw.get("content_type")
+        filename = raw.get("filename")
+        return cls(
+            attachment_id,
+            content_type if isinstance(content_type, str) else None,
+            filename if isinstance(filename, str) else None,
+            _size(raw.get("size")),
+        )
+
+    def __repr__(self) -> str:
+        """Return a debug representation."""
+        return (
+            f"FastAttachment(id={self.id!r}, content_type={self.content_type!r}, "
+            f"filename={self.filename!r}, size={self.size!r})"
+        )
+
+
+class FastQuote:
+    """Slots counterpart of `Quote`."""
+
+    __slots__ = ("attachments", "author", "id", "text")
+
+    def __init__(
+        self,
+        id: int,  # noqa: A002
+        author: str,
+        text: str | None = None,
+        attachments: list[FastAttachment] | None = None,
+    ) -> None:
+        """Store quote fields."""
+        self.id = id
+        self.author = author
+        self.text = text
+        self.attachments = attachments
+
+    @classmethod
+    def from_raw(cls, raw: object) -> FastQuote | None:
+        """Build a quote from a raw dict; None when id or author is missing."""
+        if not isinstance(raw, dict):
+            return None
+        quote_id = raw.get("id")
+        author = raw.get("author")
+        if type(quote_id) is not int or not isinstance(author, str):
+            return None
+        text = raw.get("text")
+        return cls(
+            quote_id,
+            author,
+            text if isinstance(text, str) else None,
+            _attachments(raw.get("attachments")),
+        )
+
+    def __repr__(self) -> str:
+        """Return a debug representation."""
+        return f"FastQuote(id={self.id!r}, author={self.author!r}, text={self.text!r})"
+
+
+class FastMessage:
+    """Slots counterpart of `Message` with the same public interface."""
+
+    __slots__ = (
+        "_attachments",
+        "_attachments_local_filenames",
+        "_id",
+        "_mentions",
+        "_payload",
+        "_quote",
+        "destination",
+        "group",
+        "message",
+        "reaction_emoji",
+        "reaction_target_author",
+        "reaction_target_timestamp",
+        "remote_delete_timestamp",
+        "source",
+        "target_sent_timestamp",
+        "timestamp",
+        "type",
+    )
+
+    normalize_number = staticmethod(Message.normalize_number)
+
+    def __init__(
+        self,
+        *,
+        source: str,
+        timestamp: int,
+        type: MessageType,  # noqa: A002
+        id: uuid.UUID | None = None,  # noqa: A002
+    ) -> None:
+        """Create a message with its required fields; optional ones start None."""
+        self._id = id
+        self.source = source
+        self.timestamp = timestamp
+        self.type = type
+        self.message: str | None = None
+        self.destination: str | None = None
+        self.group: dict | None = None
+        self.reaction_emoji: str | None = None
+        self.target_sent_timestamp: int | None = None
+        self.remote_delete_timestamp: int | None = None
+        self.reaction_target_author: str | None = None
+        self.reaction_target_timestamp: int | None = None
+        # Sub-structures start unset and are built from `_payload` on access.
+        self._payload: dict[str, Any] = {}
+        self._attachments: object = _UNSET
+        self._attachments_local_filenames: object = _UNSET
+        self._mentions: object = _UNSET
+        self._quote: object = _UNSET
+
+    @property
+    def id(self) -> uuid.UUID:
+        """Return the message id, generating a random one on first access."""
+        if self._id is None:
+            self._id = uuid.uuid4()
+        return self._id
+
+    @property
+    def attachments(self) -> list[FastAttachment] | None:
+        """Return the attachments, building them on first access."""
+        if self._attachments is _UNSET:
+            self._attachments = _attachments(self._payload.get("attachments"))
+        return cast("list[FastAttachment] | None", self._attachments)
+
+    @attachments.setter
+    def attachments(self, value: list[FastAttachment] | None) -> None:
+        self._attachments = value
+
+    @property
+    def attachments_local_filenames(self) -> list[str] | None:
+        """Return the attachment file names, collecting them on first access."""
+        if self._attachments_local_filenames is _UNSET:
+            raw = self._payload.get("attachments")
+            filenames = (
+                [
+                    item["filename"]
+                    for item in raw
+                    if isinstance(item, dict) and isinstance(item.get("filename"), str)
+                ]
+                if isinstance(raw, list)
+                else None
+            )
+            self._attachments_local_filenames = filenames or None
+        return cast("list[str] | None", self._attachments_local_filenames)
+
+    @attachments_local_filenames.setter
+    def attachments_local_filenames(self, value: list[str] | None) -> None:
+        self._attachments_local_filenames = value
+
+    @property
+    def mentions(self) -> list[str] | None:
+        """Return the mentioned numbers, collecting them on first access."""
+        if self._mentions is _UNSET:
+            raw = self._payload.get("mentions")
+            self._mentions = (
+                [
+                    mention["number"]
+                    for mention in raw
+                    if isinstance(mention, dict)
+                    and isinstance(mention.get("number"), str)
+                ]
+                if isinstance(raw, list)
+                else None
+            )
+        return cast("list[str] | None", self._mentions)
+
+    @mentions.setter
+    def mentions(self, value: list[str] | None) -> None:
+        self._mentions = value
+
+    @property
+    def quote(self) -> FastQuote | None:
+        """Return the quoted message, building it on first access."""
+        if self._quote is _UNSET:
+            self._quote = FastQuote.from_raw(self._payload.get("quote"))
+        return cast("FastQuote | None", self._quote)
+
+    @quote.setter
+    def quote(self, value: FastQuote | None) -> None:
+        self._quote = value
+
+    @classmethod
+    def from_envelope(cls, envelope: dict[str, Any]) -> FastMessage | None:
+        """Build a message from a decoded envelope, mirroring `MessageParser`.
+
+        Returns None when the envelope carries no chat message or lacks a
+        string source or integer timestamp.
+        """
+        source = envelope.get("source")
+        timestamp = envelope.get("timestamp")
+        if not isinstance(source, str) or type(timestamp) is not int:
+            return None
+        payload, message_type, edit_info = _chat_payload(envelope)
+        if payload is None:
+            return None
+
+        message = cls(
+            source=source,
+            timestamp=timestamp,
+            type=message_type,
+            id=_message_id(payload.get("id")),
+        )
+        if edit_info is not None:
+            message.target_sent_timestamp = _int(edit_info.get("targetSentTimestamp"))
+        elif message_type is MessageType.DELETE_MESSAGE:
+            remote_delete = payload.get("remoteDelete")
+            if isinstance(remote_delete, dict):
+                message.remote_delete_timestamp = _int(remote_delete.get("timestamp"))
+
+        message.message = _str(payload.get("message"))
+        message.destination = _str(payload.get("destination"))
+        group = payload.get("groupInfo") or payload.get("group")
+        message.group = group if isinstance(group, dict) else None
+
+        reaction = payload.get("reaction")
+        if isinstance(reaction, dict):
+            message.reaction_emoji = _str(reaction.get("emoji"))
+            message.reaction_target_author = _str(reaction.get("targetAuthor"))
+            message.reaction_target_timestamp = _int(
+                reaction.get("targetSentTimestamp")
+            )
+
+        message._payload = payload
+        return message
+
+    def recipient(self) -> str:
+        """Return the group id, the destination, or the sender."""
+        if self.is_group() and self.group:
+            return self.group["groupId"]
+        if self.destination and self.destination != self.source:
+            return self.destination
+        return self.source
+
+    def is_group(self) -> bool:
+        """Return True for group messages."""
+        return self.group is not None
+
+    def is_private(self) -> bool:
+        """Return True for one-to-one messages."""
+        return not self.is_group()
+
+    @property
+    def is_sync(self) -> bool:
+        """Return True for messages sent from another device of this account."""
+        return self.type == MessageType.SYNC_MESSAGE
+
+    def is_self(self, own_number: str) -> bool:
+        """Return True when this account sent the message."""
+        own_norm = self.normalize_number(own_number)
+        src_norm = self.normalize_number(self.source)
+        return src_norm == own_norm or self.is_sync
+
+    def is_reply_to(self, number: str) -> bool:
+        """Return True when the message quotes a message by `number`."""
+        if not self.quote:
+            return False
+        return self.normalize_number(self.quote.author) == self.normalize_number(number)
+
+    def get_target_chat(self, own_number: str) -> str:
+        """Return the chat a reply should go to (see `Message.get_target_chat`)."""
+        own_norm = self.normalize_number(own_number) or own_number
+        if self.is_group():
+            return self.recipient()
+        if self.is_self(own_number):
+            dest_norm = self.normalize_number(self.destination)
+            return dest_norm if dest_norm and dest_norm != own_norm else own_norm
+        return self.normalize_number(self.source) or self.source
+
+    def get_history_key(self, own_number: str) -> str:
+        """Alias for get_target_chat to provide a stable conversation key."""
+        return self.get_target_chat(own_number)
+
+    def __repr__(self) -> str:
+        """Return a debug representation."""
+        return (
+            f"FastMessage(source={self.source!r}, timestamp={self.timestamp!r}, "
+            f"type={self.type!r}, message={self.message!r})"
+        )
+
+
+def _chat_payload(
+    envelope: dict[str, Any],
+) -> tuple[dict[str, Any] | None, MessageType, dict[str, Any] | None]:
+    """Return the message body, its type, and the edit wrapper for edits."""
+    payload: object = None
+    message_type = MessageType.DATA_MESSAGE
+    if "syncMessage" in envelope:
+        sync_message = envelope["syncMessage"]
+        if isinstance(sync_message, dict):
+            payload = sync_message.get("sentMessage")
+        message_type = MessageType.SYNC_MESSAGE
+    elif "dataMessage" in envelope:
+        payload = envelope["dataMessage"]
+    if not isinstance(payload, dict) or not payload:
+        return None, message_type, None
+
+    if "editMessage" in payload:
+        edit_info = payload["editMessage"]
+        if not isinstance(edit_info, dict):
+            return None, message_type, None
+        replacement = edit_info.get("dataMessage")
+        edited = replacement if isinstance(replacement, dict) else {}
+        return edited, MessageType.EDIT_MESSAGE, edit_info
+    if "remoteDelete" in payload:
+        return payload, MessageType.DELETE_MESSAGE, None
+    return payload, message_type, None
+
+
+def _attachments(raw: object) -> list[FastAttachment] | None:
+    if not isinstance(raw, list):
+        return None
+    attachments = []
+    for item in raw:
+        attachment = FastAttachment.from_raw(item)
+        if attachment is not None:
+            attachments.append(attachment)
+    return attachments
+
+
+def _message_id(raw: object) -> uuid.UUID | None:
+    if isinstance(raw, uuid.UUID):
+        return raw
+    if isinstance(raw, str):
+        try:
+            return uuid.UUID(raw)
+        except ValueError:
+            return None
+    return None
+
+
+def _size(value: object) -> int | None:
+    if type(value) is int:
+        return value
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            return None
+    return None
+
+
+def _int(value: object) -> int | None:
+    return value if type(value) is int else None
+
+
+def _str(value: object) -> str | None:
+    return value if isinstance(value, str) else None
+
+
+__all__ = ["FastAttachment", "FastMessage", "FastQuote"]
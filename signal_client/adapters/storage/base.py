@@ -1,8 +1,16 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from typing import Any
 
 
 class Storage(ABC):
+    """Append-only record lists addressed by key.
+
+    Only `append`, `read_all` and `delete_all` are required. The bulk
+    operations have generic fallbacks built on those three; backends override
+    them with native batched implementations.
+    """
+
     @abstractmethod
     async def close(self) -> None:
         pass
@@ -11,6 +19,11 @@ class Storage(ABC):
     async def append(self, key: str, data: dict[str, Any]) -> None:
         pass
 
+    async def append_many(self, key: str, records: Sequence[dict[str, Any]]) -> None:
+        """Append several records in order; backends override to batch the write."""
+        for record in records:
+            await self.append(key, record)
+
     @abstractmethod
     async def read_all(self, key: str) -> list[dict[str, Any]]:
         pass
@@ -19,6 +32,38 @@ class Storage(ABC):
     async def delete_all(self, key: str) -> None:
         pass
 
+    async def read_range(
+        self, key: str, start: int, count: int
+    ) -> list[dict[str, Any]]:
+        """Return up to `count` records starting at index `start`, oldest first."""
+        if count <= 0 or start < 0:
+            return []
+        return (await self.read_all(key))[start : start + count]
+
+    async def length(self, key: str) -> int:
+        """Return the number of records stored under a key."""
+        return len(await self.read_all(key))
+
+    async def trim_to_last(self, key: str, count: int) -> None:
+        """Keep only the newest `count` records for a key."""
+        records = await self.read_all(key)
+        if len(records) <= count:
+            return
+        await self.delete_all(key)
+        if count > 0:
+            await self.append_many(key, records[-count:])
+
+    async def pop_front(self, key: str, count: int) -> list[dict[str, Any]]:
+        """Remove and return up to `count` of the oldest records for a key."""
+        if count <= 0:
+            return []
+        records = await self.read_all(key)
+        if not records:
+            return []
+        await self.delete_all(key)
+        await self.append_many(key, records[count:])
+        return records[:count]
+
 
 class StorageError(Exception):
     pass
@@ -0,0 +1,126 @@
+"""Record codecs for storage backends that persist opaque values.
+
+`json` is the default and matches what earlier releases wrote; it encodes with
+the process-wide backend from `signal_client.core.serialization`. `orjson` emits
+the same JSON text faster, so it can read and write existing data. `msgpack`
+uses a different wire format and only suits fresh keys. `auto` picks orjson
+when it is installed and falls back to json otherwise.
+"""
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Callable
+from typing import Any, Protocol
+
+from signal_client.core import serialization
+
+CODEC_NAMES = ("auto", "json", "orjson", "msgpack")
+
+
+class StorageCodec(Protocol):
+    """Turns storage records into wire values and back."""
+
+    name: str
+
+    def encode(self, record: dict[str, Any]) -> str | bytes:
+        """Serialize a record."""
+        ...
+
+    def decode(self, value: str | bytes) -> Any:  # noqa: ANN401
+        """Deserialize a value produced by `encode`."""
+        ...
+
+
+class JsonCodec:
+    """Codec writing JSON text through the active serialization backend."""
+
+    name = "json"
+
+    def encode(self, record: dict[str, Any]) -> str:
+        """Serialize a record to JSON text."""
+        return serialization.dumps(record)
+
+    def decode(self, value: str | bytes) -> Any:  # noqa: ANN401
+        """Parse JSON text or UTF-8 bytes."""
+        return serialization.loads(value)
+
+
+class OrjsonCodec:
+    """Codec backed by `orjson`; wire-compatible with `JsonCodec`."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        """Import orjson, raising ImportError when it is not installed."""
+        self._orjson = importlib.import_module("orjson")
+
+    def encode(self, record: dict[str, Any]) -> bytes:
+        """Serialize a record to UTF-8 JSON bytes."""
+        return self._orjson.dumps(record)
+
+    def decode(self, value: str | bytes) -> Any:  # noqa: ANN401
+        """Parse JSON text or UTF-8 bytes."""
+        return self._orjson.loads(value)
+
+
+class MsgpackCodec:
+    """Codec backed by `msgpack`; not compatible with JSON-encoded data."""
+
+    name = "msgpack"
+
+    def __init__(self) -> None:
+        """Import msgpack, raising ImportError when it is not installed."""
+        self._msgpack = importlib.import_module("msgpack")
+
+    def encode(self, record: dict[str, Any]) -> bytes:
+        """Serialize a record to MessagePack bytes."""
+        return self._msgpack.packb(record, use_bin_type=True)
+
+    def decode(self, value: str | bytes) -> Any:  # noqa: ANN401
+        """Parse MessagePack bytes."""
+        if isinstance(value, str):
+            value = value.encode("utf-8")
+        return self._msgpack.unpackb(value, raw=False)
+
+
+def resolve_codec(codec: str | StorageCodec = "json") -> StorageCodec:
+    """Return a codec instance for a codec name, or the codec itself.
+
+    Raises:
+        ValueError: If the name is unknown or its package is not installed.
+
+    """
+    if not isinstance(codec, str):
+        return codec
+    name = codec.lower()
+    if name == "json":
+        return JsonCodec()
+    if name == "auto":
+        try:
+            return OrjsonCodec()
+        except ImportError:
+            return JsonCodec()
+    factories: dict[str, Callable[[], StorageCodec]] = {
+        "orjson": OrjsonCodec,
+        "msgpack": MsgpackCodec,
+    }
+    factory = factories.get(name)
+    if factory is None:
+        message = f"Unknown storage codec '{codec}'."
+        raise ValueError(message)
+    try:
+        return factory()
+    except ImportError as exc:
+        message = f"Storage codec '{name}' requires the '{name}' package."
+        raise ValueError(message) from exc
+
+
+__all__ = [
+    "CODEC_NAMES",
+    "JsonCodec",
+    "MsgpackCodec",
+    "OrjsonCodec",
+    "StorageCodec",
+    "resolve_codec",
+]
@@ -1,6 +1,8 @@
 """In-memory storage implementation for the Signal client."""
 
-from collections import defaultdict
+from collections import defaultdict, deque
+from collections.abc import Sequence
+from itertools import islice
 from typing import Any
 
 from .base import Storage
@@ -11,7 +13,7 @@ class MemoryStorage(Storage):
 
     def __init__(self) -> None:
         """Initialize the in-memory storage."""
-        self._store: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
+        self._store: defaultdict[str, deque[dict[str, Any]]] = defaultdict(deque)
 
     async def close(self) -> None:
         """Clears the in-memory store."""
@@ -21,11 +23,45 @@ class MemoryStorage(Storage):
         """Appends data to a key's list."""
         self._store[key].append(data)
 
+    async def append_many(self, key: str, records: Sequence[dict[str, Any]]) -> None:
+        """Appends several records to a key's list."""
+        self._store[key].extend(records)
+
     async def read_all(self, key: str) -> list[dict[str, Any]]:
         """Reads all data for a key."""
-        return self._store.get(key, [])
+        return list(self._store.get(key, ()))
+
+    async def read_range(
+        self, key: str, start: int, count: int
+    ) -> list[dict[str, Any]]:
+        """Reads up to `count` records for a key starting at index `start`."""
+        if count <= 0 or start < 0:
+            return []
+        return list(islice(self._store.get(key, ()), start, start + count))
 
     async def delete_all(self, key: str) -> None:
         """Deletes all data for a key."""
         if key in self._store:
             del self._store[key]
+
+    async def length(self, key: str) -> int:
+        """Returns the number of records stored for a key."""
+        return len(self._store.get(key, ()))
+
+    async def trim_to_last(self, key: str, count: int) -> None:
+        """Keeps only the newest `count` records for a key."""
+        records = self._store.get(key)
+        if records is None:
+            return
+        if count <= 0:
+            del self._store[key]
+            return
+        while len(records) > count:
+            records.popleft()
+
+    async def pop_front(self, key: str, count: int) -> list[dict[str, Any]]:
+        """Removes and returns up to `count` of the oldest records for a key."""
+        records = self._store.get(key)
+        if not records or count <= 0:
+            return []
+        return [records.popleft() for _ in range(min(count, len(records)))]
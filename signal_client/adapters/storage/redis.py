@@ -1,42 +1,156 @@
-import json
+from collections.abc import Sequence
 from typing import Any
 
 import redis.asyncio as redis
 
 from .base import Storage, StorageError
+from .codecs import StorageCodec, resolve_codec
 
 
 class RedisStorage(Storage):
-    def __init__(self, host: str, port: int) -> None:
-        self._redis: redis.Redis = redis.Redis(host=host, port=port, db=0)
+    def __init__(  # noqa: PLR0913
+        self,
+        host: str,
+        port: int,
+        *,
+        db: int = 0,
+        password: str | None = None,
+        ssl: bool = False,
+        max_connections: int | None = None,
+        codec: str | StorageCodec = "json",
+        page_size: int = 1000,
+    ) -> None:
+        """Initialize the RedisStorage.
+
+        Args:
+            host: Redis host.
+            port: Redis port.
+            db: Redis database number.
+            password: Optional password for AUTH.
+            ssl: Connect over TLS.
+            max_connections: Upper bound for the client's connection pool;
+                None leaves it unbounded.
+            codec: Codec name (see `codecs.CODEC_NAMES`) or codec instance used
+                to serialize records.
+            page_size: Number of list entries fetched per LRANGE by `read_all`
+                and per RPUSH by `append_many`.
+
+        """
+        self._redis: redis.Redis = redis.Redis(
+            host=host,
+            port=port,
+            db=db,
+            password=password,
+            ssl=ssl,
+            max_connections=max_connections,
+        )
+        self._codec = resolve_codec(codec)
+        self._page_size = max(1, page_size)
 
     @property
     def client(self) -> redis.Redis:
         """Expose the underlying Redis client for testing purposes."""
         return self._redis
 
+    @property
+    def codec(self) -> StorageCodec:
+        """Return the codec used to serialize records."""
+        return self._codec
+
     async def close(self) -> None:
         await self._redis.close()
 
     async def append(self, key: str, data: dict[str, Any]) -> None:
         try:
-            object_str = json.dumps(data)
-            await self._redis.rpush(key, object_str)  # type: ignore[misc]
+            await self._redis.rpush(key, self._codec.encode(data))  # type: ignore[misc]
         except (redis.RedisError, TypeError) as e:
             msg = f"Redis append failed: {e}"
             raise StorageError(msg) from e
 
-    async def read_all(self, key: str) -> list[dict[str, Any]]:
+    async def append_many(self, key: str, records: Sequence[dict[str, Any]]) -> None:
+        if not records:
+            return
         try:
-            result_bytes = await self._redis.lrange(key, 0, -1)  # type: ignore[misc]
-            return [json.loads(item.decode("utf-8")) for item in result_bytes]
-        except (redis.RedisError, TypeError, json.JSONDecodeError) as e:
-            msg = f"Redis read_all failed: {e}"
+            values = [self._codec.encode(record) for record in records]
+            if len(values) <= self._page_size:
+                await self._redis.rpush(key, *values)  # type: ignore[misc]
+                return
+            # Large batches go out as several bounded RPUSH commands in one
+            # MULTI/EXEC round trip.
+            async with self._redis.pipeline(transaction=True) as pipe:
+                for start in range(0, len(values), self._page_size):
+                    pipe.rpush(key, *values[start : start + self._page_size])
+                await pipe.execute()
+        except (redis.RedisError, TypeError) as e:
+            msg = f"Redis append_many failed: {e}"
             raise StorageError(msg) from e
 
+    async def read_all(self, key: str) -> list[dict[str, Any]]:
+        """Read a list in LRANGE pages of `page_size` entries.
+
+        Pages are separate commands, so writers may interleave between them.
+        """
+        records: list[dict[str, Any]] = []
+        start = 0
+        while True:
+            page = await self._read_page(key, start, self._page_size, "read_all")
+            records.extend(page)
+            if len(page) < self._page_size:
+                return records
+            start += self._page_size
+
+    async def read_range(
+        self, key: str, start: int, count: int
+    ) -> list[dict[str, Any]]:
+        if count <= 0 or start < 0:
+            return []
+        return await self._read_page(key, start, count, "read_range")
+
     async def delete_all(self, key: str) -> None:
         try:
             await self._redis.delete(key)
         except redis.RedisError as e:
             msg = f"Redis delete_all failed: {e}"
             raise StorageError(msg) from e
+
+    async def length(self, key: str) -> int:
+        try:
+            return int(await self._redis.llen(key))  # type: ignore[misc]
+        except redis.RedisError as e:
+            msg = f"Redis length failed: {e}"
+            raise StorageError(msg) from e
+
+    async def trim_to_last(self, key: str, count: int) -> None:
+        if count <= 0:
+            await self.delete_all(key)
+            return
+        try:
+            await self._redis.ltrim(key, -count, -1)  # type: ignore[misc]
+        except redis.RedisError as e:
+            msg = f"Redis trim_to_last failed: {e}"
+            raise StorageError(msg) from e
+
+    async def pop_front(self, key: str, count: int) -> list[dict[str, Any]]:
+        if count <= 0:
+            return []
+        try:
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.lrange(key, 0, count - 1)
+                pipe.ltrim(key, count, -1)
+                values, _ = await pipe.execute()
+            return [self._codec.decode(value) for value in values]
+        except (redis.RedisError, TypeError, ValueError) as e:
+            msg = f"Redis pop_front failed: {e}"
+            raise StorageError(msg) from e
+
+    async def _read_page(
+        self, key: str, start: int, count: int, operation: str
+    ) -> list[dict[str, Any]]:
+        try:
+            values = await self._redis.lrange(  # type: ignore[misc]
+                key, start, start + count - 1
+            )
+            return [self._codec.decode(value) for value in values]
+        except (redis.RedisError, TypeError, ValueError) as e:
+            msg = f"Redis {operation} failed: {e}"
+            raise StorageError(msg) from e
@@ -1,76 +1,253 @@
 """SQLite storage implementation for the Signal client."""
 
+import asyncio
 import json
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager
 from typing import Any
 
 import aiosqlite
 
+from signal_client.core import serialization
+
 from .base import Storage, StorageError
 
+JOURNAL_MODES = frozenset({"delete", "truncate", "persist", "memory", "wal", "off"})
+SYNCHRONOUS_LEVELS = frozenset({"off", "normal", "full", "extra"})
+
+# Each entry upgrades the schema by one version; `PRAGMA user_version` records
+# how many have been applied to a database file.
+_MIGRATIONS: tuple[tuple[str, ...], ...] = (
+    ("CREATE TABLE IF NOT EXISTS signal_client_dlq (key TEXT, value TEXT)",),
+    # Every index implicitly ends with the rowid, so this serves lookups by key
+    # in insertion order without a separate sort.
+    (
+        (
+            "CREATE INDEX IF NOT EXISTS signal_client_dlq_key_idx "
+            "ON signal_client_dlq (key)"
+        ),
+    ),
+)
+SCHEMA_VERSION = len(_MIGRATIONS)
+
+# Statements are kept as constants so the sqlite3 statement cache reuses the
+# prepared statement across calls.
+_INSERT = "INSERT INTO signal_client_dlq (key, value) VALUES (?, ?)"
+_SELECT_ALL = "SELECT value FROM signal_client_dlq WHERE key = ? ORDER BY rowid ASC"
+_SELECT_RANGE = (
+    "SELECT value FROM signal_client_dlq WHERE key = ? "
+    "ORDER BY rowid ASC LIMIT ? OFFSET ?"
+)
+_SELECT_HEAD = (
+    "SELECT rowid, value FROM signal_client_dlq WHERE key = ? "
+    "ORDER BY rowid ASC LIMIT ?"
+)
+_COUNT = "SELECT COUNT(*) FROM signal_client_dlq WHERE key = ?"
+_DELETE_ALL = "DELETE FROM signal_client_dlq WHERE key = ?"
+_DELETE_THROUGH = "DELETE FROM signal_client_dlq WHERE key = ? AND rowid <= ?"
+_DELETE_BEFORE_LAST = (
+    "DELETE FROM signal_client_dlq WHERE key = ? AND rowid <= ("
+    "SELECT rowid FROM signal_client_dlq WHERE key = ? "
+    "ORDER BY rowid DESC LIMIT 1 OFFSET ?)"
+)
+
 
 class SQLiteStorage(Storage):
-    """SQLite-backed storage implementation."""
+    """SQLite-backed storage implementation.
+
+    Writes run inside explicit transactions serialized on the connection, so
+    multi-statement operations such as `pop_front` are atomic. The schema is
+    versioned with `PRAGMA user_version` and upgraded when the connection opens.
+    """
 
-    def __init__(self, database: str = ":memory:", **kwargs: Any) -> None:  # noqa: ANN401
+    def __init__(
+        self,
+        database: str = ":memory:",
+        *,
+        journal_mode: str | None = "wal",
+        synchronous: str | None = "normal",
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
         """Initialize the SQLiteStorage.
 
         Args:
             database: The path to the SQLite database file.
                 Defaults to an in-memory database.
+            journal_mode: `PRAGMA journal_mode` applied on connect, or None to
+                keep the database default.
+            synchronous: `PRAGMA synchronous` applied on connect, or None to keep
+                the SQLite default (FULL).
             **kwargs: Additional keyword arguments for `aiosqlite.connect`.
 
+        Raises:
+            ValueError: If the journal mode or synchronous level is unknown.
+
         """
+        if journal_mode is not None and journal_mode.lower() not in JOURNAL_MODES:
+            msg = f"Unsupported SQLite journal_mode '{journal_mode}'."
+            raise ValueError(msg)
+        if synchronous is not None and synchronous.lower() not in SYNCHRONOUS_LEVELS:
+            msg = f"Unsupported SQLite synchronous level '{synchronous}'."
+            raise ValueError(msg)
         self._database = database
+        self._journal_mode = journal_mode.lower() if journal_mode else None
+        self._synchronous = synchronous.lower() if synchronous else None
         self._kwargs: dict[str, Any] = dict(kwargs)
         self._db: aiosqlite.Connection | None = None
+        self._connect_lock = asyncio.Lock()
+        self._write_lock = asyncio.Lock()
 
     async def _get_db(self) -> aiosqlite.Connection:
-        if self._db is None:
-            self._db = await aiosqlite.connect(self._database, **self._kwargs)
-            await self._db.execute(
-                "CREATE TABLE IF NOT EXISTS signal_client_dlq (key TEXT, value TEXT)"
-            )
+        if self._db is not None:
+            return self._db
+        async with self._connect_lock:
+            if self._db is None:
+                db = await aiosqlite.connect(self._database, **self._kwargs)
+                try:
+                    await self._configure(db)
+                    await self._migrate(db)
+                except aiosqlite.Error:
+                    await db.close()
+                    raise
+                self._db = db
         return self._db
 
+    async def _configure(self, db: aiosqlite.Connection) -> None:
+        if self._journal_mode is not None:
+            await db.execute(f"PRAGMA journal_mode={self._journal_mode}")
+        if self._synchronous is not None:
+            await db.execute(f"PRAGMA synchronous={self._synchronous}")
+
+    @staticmethod
+    async def _migrate(db: aiosqlite.Connection) -> None:
+        async with db.execute("PRAGMA user_version") as cursor:
+            row = await cursor.fetchone()
+        version = int(row[0]) if row else 0
+        if version >= SCHEMA_VERSION:
+            return
+        await db.execute("BEGIN IMMEDIATE")
+        try:
+            for statements in _MIGRATIONS[version:]:
+                for statement in statements:
+                    await db.execute(statement)
+            # PRAGMA arguments cannot be bound parameters.
+            await db.execute(f"PRAGMA user_version={SCHEMA_VERSION:d}")
+        except aiosqlite.Error:
+            await db.rollback()
+            raise
+        await db.commit()
+
+    @asynccontextmanager
+    async def _transaction(self) -> AsyncIterator[aiosqlite.Connection]:
+        db = await self._get_db()
+        async with self._write_lock:
+            await db.execute("BEGIN IMMEDIATE")
+            try:
+                yield db
+            except BaseException:
+                await db.rollback()
+                raise
+            await db.commit()
+
     async def close(self) -> None:
         """Close the database connection."""
-        if self._db is not None:
-            await self._db.close()
+        # Detach first: concurrent shutdown paths may both call close, and a
+        # second aiosqlite close on the same connection never completes.
+        db, self._db = self._db, None
+        if db is not None:
+            await db.close()
 
     async def append(self, key: str, data: dict[str, Any]) -> None:
         """Append data to a list associated with a key."""
         try:
-            db = await self._get_db()
-            value = json.dumps(data)
-            await db.execute(
-                "INSERT INTO signal_client_dlq (key, value) VALUES (?, ?)",
-                [key, value],
-            )
-            await db.commit()
+            value = serialization.dumps(data)
+            async with self._transaction() as db:
+                await db.execute(_INSERT, [key, value])
         except (aiosqlite.Error, TypeError) as e:
             msg = f"SQLite append failed: {e}"
             raise StorageError(msg) from e
 
+    async def append_many(self, key: str, records: Sequence[dict[str, Any]]) -> None:
+        """Append several records in a single transaction."""
+        if not records:
+            return
+        try:
+            values = [(key, serialization.dumps(record)) for record in records]
+            async with self._transaction() as db:
+                await db.executemany(_INSERT, values)
+        except (aiosqlite.Error, TypeError) as e:
+            msg = f"SQLite append_many failed: {e}"
+            raise StorageError(msg) from e
+
     async def read_all(self, key: str) -> list[dict[str, Any]]:
         """Read all data associated with a key."""
         try:
             db = await self._get_db()
-            async with db.execute(
-                "SELECT value FROM signal_client_dlq WHERE key = ? ORDER BY rowid ASC",
-                [key],
-            ) as cursor:
+            async with db.execute(_SELECT_ALL, [key]) as cursor:
                 results = await cursor.fetchall()
-                return [json.loads(row[0]) for row in results]
+                return [serialization.loads(row[0]) for row in results]
         except (aiosqlite.Error, TypeError, json.JSONDecodeError) as e:
             msg = f"SQLite read_all failed: {e}"
             raise StorageError(msg) from e
 
+    async def read_range(
+        self, key: str, start: int, count: int
+    ) -> list[dict[str, Any]]:
+        """Read up to `count` records for a key starting at index `start`."""
+        if count <= 0 or start < 0:
+            return []
+        try:
+            db = await self._get_db()
+            async with db.execute(_SELECT_RANGE, [key, count, start]) as cursor:
+                results = await cursor.fetchall()
+                return [serialization.loads(row[0]) for row in results]
+        except (aiosqlite.Error, TypeError, json.JSONDecodeError) as e:
+            msg = f"SQLite read_range failed: {e}"
+            raise StorageError(msg) from e
+
     async def delete_all(self, key: str) -> None:
         """Delete all data associated with a key."""
         try:
-            db = await self._get_db()
-            await db.execute("DELETE FROM signal_client_dlq WHERE key = ?", [key])
-            await db.commit()
+            async with self._transaction() as db:
+                await db.execute(_DELETE_ALL, [key])
         except aiosqlite.Error as e:
             msg = f"SQLite delete_all failed: {e}"
             raise StorageError(msg) from e
+
+    async def length(self, key: str) -> int:
+        """Return the number of records associated with a key."""
+        try:
+            db = await self._get_db()
+            async with db.execute(_COUNT, [key]) as cursor:
+                row = await cursor.fetchone()
+                return int(row[0]) if row else 0
+        except aiosqlite.Error as e:
+            msg = f"SQLite length failed: {e}"
+            raise StorageError(msg) from e
+
+    async def trim_to_last(self, key: str, count: int) -> None:
+        """Keep only the newest `count` records associated with a key."""
+        if count <= 0:
+            await self.delete_all(key)
+            return
+        try:
+            async with self._transaction() as db:
+                await db.execute(_DELETE_BEFORE_LAST, [key, key, count])
+        except aiosqlite.Error as e:
+            msg = f"SQLite trim_to_last failed: {e}"
+            raise StorageError(msg) from e
+
+    async def pop_front(self, key: str, count: int) -> list[dict[str, Any]]:
+        """Remove and return up to `count` of the oldest records for a key."""
+        if count <= 0:
+            return []
+        try:
+            async with self._transaction() as db:
+                async with db.execute(_SELECT_HEAD, [key, count]) as cursor:
+                    rows = list(await cursor.fetchall())
+                if rows:
+                    await db.execute(_DELETE_THROUGH, [key, rows[-1][0]])
+            return [serialization.loads(row[1]) for row in rows]
+        except (aiosqlite.Error, TypeError, json.JSONDecodeError) as e:
+            msg = f"SQLite pop_front failed: {e}"
+            raise StorageError(msg) from e
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Callable
+from contextlib import suppress
 from dataclasses import dataclass
 from functools import partial
 
@@ -32,12 +33,14 @@ from signal_client.adapters.storage.memory import MemoryStorage
 from signal_client.adapters.storage.redis import RedisStorage
 from signal_client.adapters.storage.sqlite import SQLiteStorage
 from signal_client.adapters.transport.websocket_client import WebSocketClient
+from signal_client.core import serialization
 from signal_client.core.config import Settings
 from signal_client.core.context import Context
 from signal_client.core.context_deps import ContextDependencies
 from signal_client.observability.logging import ensure_structlog_configured, safe_log
 from signal_client.runtime.listener import BackpressurePolicy, MessageService
 from signal_client.runtime.models import QueuedMessage
+from signal_client.runtime.services.autoscaler import AutoscaleConfig
 from signal_client.runtime.services.checkpoint_store import IngestCheckpointStore
 from signal_client.runtime.services.circuit_breaker import (
     CircuitBreaker,
@@ -47,8 +50,18 @@ from signal_client.runtime.services.dead_letter_queue import DeadLetterQueue
 from signal_client.runtime.services.intake_controller import IntakeController
 from signal_client.runtime.services.lock_manager import LockManager
 from signal_client.runtime.services.message_parser import MessageParser
-from signal_client.runtime.services.persistent_queue import PersistentQueue
+from signal_client.runtime.services.persistent_queue import (
+    PersistentQueue,
+    PersistentQueuedMessage,
+)
+from signal_client.runtime.services.process_executor import ProcessCommandExecutor
 from signal_client.runtime.services.rate_limiter import RateLimiter
+from signal_client.runtime.services.stream_fanout import (
+    RedisStreamConsumer,
+    RedisStreamPublisher,
+    StreamConfig,
+)
+from signal_client.runtime.services.write_behind import WriteBehindConfig
 from signal_client.runtime.worker_pool import WorkerPool
 
 log = structlog.get_logger()
@@ -114,6 +127,7 @@ class Application:
         self.settings = settings
         self._header_provider = header_provider
         self.session: aiohttp.ClientSession | None = None
+        serialization.set_backend(settings.json_backend)
         self.rate_limiter = RateLimiter(
             rate_limit=settings.rate_limit, period=settings.rate_limit_period
         )
@@ -139,14 +153,18 @@ class Application:
         self.websocket_client: WebSocketClient | None = None
         self.dead_letter_queue: DeadLetterQueue | None = None
         self.persistent_queue: PersistentQueue | None = None
+        self._replay_task: asyncio.Task[None] | None = None
+        self._replay_drained: asyncio.Event | None = None
         self.ingest_checkpoint_store: IngestCheckpointStore | None = None
         self.intake_controller: IntakeController | None = None
-        self.message_parser = MessageParser()
+        self.message_parser = MessageParser(fast_models=settings.fast_models_enabled)
         self.lock_manager: LockManager | None = None
         self.context_dependencies: ContextDependencies | None = None
         self.context_factory: Callable[[Message], Context] | None = None
         self.message_service: MessageService | None = None
         self.worker_pool: WorkerPool | None = None
+        self.stream_publisher: RedisStreamPublisher | None = None
+        self.stream_consumer: RedisStreamConsumer | None = None
         self._circuit_state_lock: asyncio.Lock | None = None
         self._open_circuit_endpoints: set[str] = set()
 
@@ -168,21 +186,28 @@ class Application:
         if self.queue is not None:
             return
 
-        self.session = aiohttp.ClientSession()
+        self.session = aiohttp.ClientSession(json_serialize=serialization.dumps)
         self.api_clients = self._create_api_clients(self.session)
 
         self.queue = asyncio.Queue(maxsize=self.settings.queue_size)
+        write_behind = self._write_behind_config()
         if self.settings.durable_queue_enabled:
             self.persistent_queue = PersistentQueue(
                 storage=self.storage,
                 key=self.settings.ingest_queue_name,
                 max_length=self.settings.durable_queue_max_length,
+                write_behind=write_behind,
+                compaction_interval=self.settings.durable_queue_compaction_interval,
             )
         self.ingest_checkpoint_store = IngestCheckpointStore(
             storage=self.storage,
             key=self.settings.ingest_checkpoint_key,
             window_size=self.settings.ingest_checkpoint_window,
+            incremental=self.settings.ingest_checkpoint_incremental,
+            compaction_interval=self.settings.ingest_checkpoint_compaction_interval,
+            write_behind=write_behind,
         )
+        self.ingest_checkpoint_store.start()
         self.intake_controller = IntakeController(
             default_pause_seconds=self.settings.ingest_pause_seconds
         )
@@ -227,6 +252,31 @@ class Application:
             settings=self.settings,
         )
         self.context_factory = partial(Context, dependencies=self.context_dependencies)
+        self.circuit_breaker.register_state_listener(self._handle_circuit_state_change)
+        self.worker_pool = WorkerPool(
+            context_factory=self.context_factory,
+            queue=self.queue,
+            message_parser=self.message_parser,
+            dead_letter_queue=self.dead_letter_queue,
+            checkpoint_store=self.ingest_checkpoint_store,
+            pool_size=self.settings.worker_pool_size,
+            shard_count=self.settings.worker_shard_count,
+            lock_manager=self.lock_manager,
+            prefilter_commands=self.settings.command_prefilter_enabled,
+            batch_size=self.settings.worker_batch_size,
+            direct_enqueue=self.settings.direct_shard_enqueue,
+            work_stealing=self.settings.worker_work_stealing,
+            max_inflight=self.settings.worker_max_inflight,
+            conversation_max_inflight=self.settings.worker_conversation_max_inflight,
+            autoscale=self._autoscale_config(),
+            process_executor=ProcessCommandExecutor(
+                max_workers=self.settings.command_process_pool_size,
+                timeout=self.settings.command_process_timeout,
+            ),
+        )
+        if self.persistent_queue and self.settings.durable_queue_streaming_replay:
+            # Live messages wait for the backlog so a conversation stays in order.
+            self._replay_drained = asyncio.Event()
         self.message_service = MessageService(
             websocket_client=self.websocket_client,
             queue=self.queue,
@@ -239,32 +289,101 @@ class Application:
                 if self.settings.queue_drop_oldest_on_timeout
                 else BackpressurePolicy.FAIL_FAST
             ),
+            queue_selector=(
+                self.worker_pool.select_queue
+                if self.worker_pool.direct_enqueue
+                else None
+            ),
+            queue_depth_getter=self.worker_pool.queue_depth,
+            dispatch_gate=self._replay_drained,
         )
-        self.circuit_breaker.register_state_listener(self._handle_circuit_state_change)
-        self.worker_pool = WorkerPool(
-            context_factory=self.context_factory,
-            queue=self.queue,
-            message_parser=self.message_parser,
-            dead_letter_queue=self.dead_letter_queue,
-            checkpoint_store=self.ingest_checkpoint_store,
-            pool_size=self.settings.worker_pool_size,
-            shard_count=self.settings.worker_shard_count,
-            lock_manager=self.lock_manager,
-        )
-        if self.persistent_queue:
+        self._create_stream_fanout()
+        if self.persistent_queue and self.settings.durable_queue_streaming_replay:
+            # Snapshot the backlog before ingest starts appending live messages.
+            backlog = await self.persistent_queue.begin_replay()
+            self._replay_task = asyncio.create_task(
+                self._stream_persistent_replay(backlog)
+            )
+            self.persistent_queue.start()
+        elif self.persistent_queue:
             replay = await self.persistent_queue.replay()
-            for item in replay:
-                queued = QueuedMessage(raw=item.raw, enqueued_at=item.enqueued_at)
+            for index, item in enumerate(replay):
+                queued = QueuedMessage(
+                    raw=item.raw,
+                    enqueued_at=item.enqueued_at,
+                    ack=self._persistent_ack(item),
+                )
+                target = self.worker_pool.select_queue(queued)
                 try:
-                    self.queue.put_nowait(queued)
+                    target.put_nowait(queued)
                 except asyncio.QueueFull:
                     self._log_warning(
                         "persistent_queue.replay_dropped",
                         reason="queue_full",
-                        queue_depth=self.queue.qsize(),
-                        queue_maxsize=self.queue.maxsize,
+                        dropped=len(replay) - index,
+                        queue_depth=target.qsize(),
+                        queue_maxsize=target.maxsize,
                     )
+                    # Dropped messages are acknowledged so they do not pin the
+                    # low-watermark and block compaction of everything after them.
+                    for dropped in replay[index:]:
+                        ack = self._persistent_ack(dropped)
+                        if ack is not None:
+                            ack()
                     break
+            self.persistent_queue.start()
+
+    async def _stream_persistent_replay(self, backlog: range) -> None:
+        """Feed the durable backlog into the queue, waiting for free space.
+
+        Live dispatch is held until this returns, however the replay ends.
+        """
+        try:
+            await self._replay_backlog(backlog)
+        finally:
+            if self._replay_drained is not None:
+                self._replay_drained.set()
+
+    async def _replay_backlog(self, backlog: range) -> None:
+        if self.persistent_queue is None or self.worker_pool is None:
+            return
+        replayed = 0
+        remaining = backlog
+        try:
+            async for item in self.persistent_queue.replay_stream(
+                page_size=self.settings.durable_queue_replay_page_size,
+                backlog=backlog,
+            ):
+                queued = QueuedMessage(
+                    raw=item.raw,
+                    enqueued_at=item.enqueued_at,
+                    ack=self._persistent_ack(item),
+                )
+                await self.worker_pool.select_queue(queued).put(queued)
+                replayed += 1
+                if item.seq is not None:
+                    remaining = range(item.seq + 1, backlog.stop)
+        except asyncio.CancelledError:
+            # Messages that were not replayed stay unacknowledged and persisted.
+            safe_log(
+                self._log,
+                "info",
+                "persistent_queue.replay_cancelled",
+                replayed=replayed,
+            )
+            raise
+        except Exception:  # noqa: BLE001 - replay must not take down the app
+            self._log_warning("persistent_queue.replay_failed", replayed=replayed)
+            # Unreplayed messages would otherwise pin the watermark forever.
+            self.persistent_queue.release(remaining)
+
+    def _persistent_ack(
+        self, item: PersistentQueuedMessage
+    ) -> Callable[[], None] | None:
+        """Return the acknowledgement callback for a replayed durable message."""
+        if self.persistent_queue is None or item.seq is None:
+            return None
+        return partial(self.persistent_queue.ack, item.seq)
 
     def _create_storage(self) -> Storage:
         """Create and return the appropriate storage backend based on settings.
@@ -279,11 +398,78 @@ class Application:
             return RedisStorage(
                 host=self.settings.redis_host,
                 port=self.settings.redis_port,
+                db=self.settings.redis_db,
+                password=self.settings.redis_password,
+                ssl=self.settings.redis_ssl,
+                max_connections=self.settings.redis_max_connections,
+                codec=self.settings.redis_codec,
+                page_size=self.settings.redis_page_size,
             )
         if storage_type == "sqlite":
-            return SQLiteStorage(database=self.settings.sqlite_database)
+            return SQLiteStorage(
+                database=self.settings.sqlite_database,
+                journal_mode=self.settings.sqlite_journal_mode,
+                synchronous=self.settings.sqlite_synchronous,
+            )
         return MemoryStorage()
 
+    def _write_behind_config(self) -> WriteBehindConfig | None:
+        """Return write-behind flush bounds when buffering is enabled."""
+        if not self.settings.write_behind_enabled:
+            return None
+        return WriteBehindConfig(
+            max_records=self.settings.write_behind_max_records,
+            max_delay=self.settings.write_behind_max_delay_ms / 1000,
+        )
+
+    def _autoscale_config(self) -> AutoscaleConfig | None:
+        """Return worker autoscaling bounds when autoscaling is enabled."""
+        if not self.settings.worker_autoscale_enabled:
+            return None
+        return AutoscaleConfig(
+            max_workers=self.settings.worker_autoscale_max_pool_size,
+            interval=self.settings.worker_autoscale_interval,
+            target_latency=self.settings.worker_autoscale_target_latency_ms / 1000,
+            target_queue_depth=self.settings.worker_autoscale_target_queue_depth,
+        )
+
+    def _stream_config(self) -> StreamConfig:
+        """Return the layout of the ingest streams shared between processes."""
+        return StreamConfig(
+            prefix=self.settings.ingest_stream_prefix,
+            partitions=self.settings.ingest_stream_partitions,
+            group=self.settings.ingest_stream_group,
+            consumer=self.settings.ingest_stream_consumer,
+            worker_index=self.settings.ingest_worker_index,
+            worker_count=self.settings.ingest_worker_count,
+            claim_idle_ms=self.settings.ingest_stream_claim_idle_ms,
+        )
+
+    def _create_stream_fanout(self) -> None:
+        """Create the stream publisher or consumer for split-process roles."""
+        role = self.settings.ingest_role.lower()
+        if role == "all" or self.worker_pool is None:
+            return
+        if not isinstance(self.storage, RedisStorage):
+            message = f"ingest_role '{role}' requires Redis storage."
+            raise TypeError(message)
+        if role == "ingest":
+            self.stream_publisher = RedisStreamPublisher(
+                self.storage.client,
+                self._stream_config(),
+                self.message_parser,
+                dead_letter_queue=self.dead_letter_queue,
+            )
+            return
+        worker_pool = self.worker_pool
+
+        async def enqueue(queued_message: QueuedMessage) -> None:
+            await worker_pool.select_queue(queued_message).put(queued_message)
+
+        self.stream_consumer = RedisStreamConsumer(
+            self.storage.client, self._stream_config(), enqueue
+        )
+
     def _create_api_clients(self, session: aiohttp.ClientSession) -> APIClients:
         """Create and return a collection of API clients.
 
@@ -342,10 +528,23 @@ class Application:
 
     async def shutdown(self) -> None:
         """Shut down the application gracefully."""
+        replay_task = self._replay_task
+        self._replay_task = None
+        if replay_task is not None and not replay_task.done():
+            replay_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await replay_task
         if self.websocket_client is not None:
             await self.websocket_client.close()
         if self.session is not None:
             await self.session.close()
+        if self.persistent_queue is not None:
+            await self.persistent_queue.close()
+        if self.ingest_checkpoint_store is not None:
+            await self.ingest_checkpoint_store.close()
+        if self.stream_consumer is not None:
+            self.stream_consumer.stop()
+            await self.stream_consumer.flush_acks()
         close_storage = getattr(self.storage, "close", None)
         if close_storage is not None:
             await close_storage()
@@ -159,41 +159,46 @@ class SignalClient:
         for middleware in self._middleware:
             worker_pool.register_middleware(middleware)
 
-        worker_pool.start()
+        role = self.app.settings.ingest_role.lower()
+        if role == "ingest" and self.app.stream_publisher is not None:
+            # Messages are handled by worker processes reading the streams.
+            runners = [
+                message_service.listen(),
+                self.app.stream_publisher.forward(self.queue),
+            ]
+        elif role == "worker" and self.app.stream_consumer is not None:
+            worker_pool.start()
+            runners = [self.app.stream_consumer.run(), worker_pool.join()]
+        else:
+            worker_pool.start()
+            runners = [message_service.listen(), worker_pool.join()]
 
         try:
-            await asyncio.gather(
-                message_service.listen(),
-                worker_pool.join(),
-            )
+            await asyncio.gather(*runners)
         finally:
             await self.shutdown()
 
     async def shutdown(self) -> None:
         """Shut down the SignalClient gracefully.
 
-        This involves closing the websocket, waiting for queues to empty,
-        stopping workers, and closing the aiohttp session.
+        This involves closing the websocket, draining queued messages for up to
+        `worker_drain_timeout` seconds, stopping workers, and closing the
+        aiohttp session.
         """
         # 1. Stop accepting new messages
         if self.app.websocket_client is not None:
             await self.app.websocket_client.close()
 
-        # 2. Wait for the queue to be empty
-        if self.app.queue is not None:
+        # 2. Drain the queue within the deadline and stop the workers
+        if self.app.worker_pool is not None:
+            await self.app.worker_pool.shutdown(
+                drain_timeout=self.app.settings.worker_drain_timeout
+            )
+        elif self.app.queue is not None:
             await self.app.queue.join()
 
-        # 3. Stop the workers
-        if self.app.worker_pool is not None:
-            self.app.worker_pool.stop()
-            await self.app.worker_pool.join()
-
-        # 4. Close the session and shutdown resources
-        if self.app.session is not None:
-            await self.app.session.close()
-        close_storage = getattr(self.app.storage, "close", None)
-        if close_storage is not None:
-            await close_storage()
+        # 3. Close the session, flush durable state and shutdown resources
+        await self.app.shutdown()
 
     def _register_with_worker_pool(self, command: Command) -> None:
         """Register a command with the worker pool if not already present.
@@ -2,7 +2,14 @@
 
 from importlib import import_module
 
-from .command import Command, CommandError, CommandMetadata, command
+from .command import (
+    BatchCommand,
+    Command,
+    CommandError,
+    CommandMetadata,
+    batch_command,
+    command,
+)
 from .compatibility import check_supported_versions
 from .config import Settings
 from .exceptions import (
@@ -17,6 +24,7 @@ from .exceptions import (
 
 __all__ = [
     "AuthenticationError",
+    "BatchCommand",
     "Command",
     "CommandError",
     "CommandMetadata",
@@ -29,6 +37,7 @@ __all__ = [
     "Settings",
     "SignalAPIError",
     "UnsupportedMessageError",
+    "batch_command",
     "check_supported_versions",
     "command",
 ]
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import functools
 import inspect
 from collections.abc import Awaitable, Callable, Sequence
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 if TYPE_CHECKING:
     import re
@@ -14,6 +15,8 @@ if TYPE_CHECKING:
 
 _COMMAND_HANDLER_NOT_SET = "Command handler has not been set."
 
+COMMAND_EXECUTORS = ("inline", "process")
+
 
 @dataclass(slots=True)
 class CommandMetadata:
@@ -39,13 +42,15 @@ class Command:
     executes the command's logic.
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         triggers: list[str | re.Pattern],
         whitelisted: list[str] | None = None,
         *,
         case_sensitive: bool = False,
         metadata: CommandMetadata | None = None,
+        executor: str = "inline",
+        timeout: float | None = None,
     ) -> None:
         """Initialize a Command instance.
 
@@ -58,8 +63,20 @@ class Command:
             case_sensitive: If True, string triggers will be matched case-sensitively.
                             Defaults to False.
             metadata: Optional CommandMetadata to provide name, description, and usage.
+            executor: "inline" runs the handler on the event loop. "process"
+                      runs it in the worker process pool with a
+                      `ProcessContext`; the handler must be defined at module
+                      level.
+            timeout: Seconds a process handler may run, overriding the
+                     configured default.
+
+        Raises:
+            ValueError: If the executor is unknown.
 
         """
+        if executor not in COMMAND_EXECUTORS:
+            message = f"Unknown command executor '{executor}'."
+            raise ValueError(message)
         self.triggers = triggers
         self.whitelisted = whitelisted or []
         self.case_sensitive = case_sensitive
@@ -67,6 +84,8 @@ class Command:
         self.name = meta.name
         self.description = meta.description
         self.usage = meta.usage
+        self.executor = executor
+        self.timeout = timeout
         self.handle: Callable[[Context], Awaitable[None]] | None = None
 
     def with_handler(self, handler: Callable[[Context], Awaitable[None]]) -> Command:
@@ -82,7 +101,16 @@ class Command:
         Returns:
             The Command instance with the handler assigned.
 
+        Raises:
+            ValueError: If a process handler is not defined at module level.
+
         """
+        if self.executor == "process" and "<locals>" in handler.__qualname__:
+            message = (
+                f"Process command handler '{handler.__qualname__}' must be "
+                "defined at module level so worker processes can import it."
+            )
+            raise ValueError(message)
         self.handle = handler
         if self.name is None:
             self.name = handler.__name__
@@ -107,17 +135,86 @@ class Command:
         await self.handle(context)
 
 
+class BatchCommand(Command):
+    """A command whose handler receives a list of contexts.
+
+    When workers run in batch mode (`worker_batch_size` greater than 1), the
+    matching messages of one drained batch are handed to a single handler call
+    and checkpointed together. Outside batch mode each message arrives as a
+    one-item list, so the same handler works in both modes.
+    """
+
+    def __init__(
+        self,
+        triggers: list[str | re.Pattern],
+        whitelisted: list[str] | None = None,
+        *,
+        case_sensitive: bool = False,
+        metadata: CommandMetadata | None = None,
+    ) -> None:
+        """Initialize a BatchCommand instance.
+
+        Args:
+            triggers: Strings or regular expressions that trigger this command.
+            whitelisted: Optional sender IDs allowed to execute this command.
+            case_sensitive: If True, string triggers are matched case-sensitively.
+            metadata: Optional CommandMetadata to provide name, description, and usage.
+
+        """
+        super().__init__(
+            triggers,
+            whitelisted,
+            case_sensitive=case_sensitive,
+            metadata=metadata,
+        )
+        self.handle_batch: Callable[[list[Context]], Awaitable[None]] | None = None
+
+    def with_batch_handler(
+        self, handler: Callable[[list[Context]], Awaitable[None]]
+    ) -> BatchCommand:
+        """Assign a handler that receives a list of contexts.
+
+        `handle` is set to a wrapper passing a one-item list, so the command can
+        also be dispatched one message at a time.
+
+        Returns:
+            The BatchCommand instance with the handler assigned.
+
+        """
+        self.handle_batch = handler
+
+        @functools.wraps(handler)
+        async def handle_single(context: Context) -> None:
+            await handler([context])
+
+        return cast("BatchCommand", self.with_handler(handle_single))
+
+    async def call_batch(self, contexts: list[Context]) -> None:
+        """Execute the batch handler with several contexts.
+
+        Raises:
+            CommandError: If no handler has been assigned to the command.
+
+        """
+        if self.handle_batch is None:
+            message = _COMMAND_HANDLER_NOT_SET
+            raise CommandError(message)
+        await self.handle_batch(contexts)
+
+
 class CommandError(Exception):
     """Exception raised for errors specific to command execution."""
 
 
-def command(
+def command(  # noqa: PLR0913
     *triggers: str | re.Pattern,
     whitelisted: Sequence[str] | None = None,
     case_sensitive: bool = False,
     name: str | None = None,
     description: str | None = None,
     usage: str | None = None,
+    executor: str = "inline",
+    timeout: float | None = None,
 ) -> Callable[[Callable[[Context], Awaitable[None]]], Command]:
     """Define a new command via decorator.
 
@@ -134,17 +231,23 @@ def command(
         name: An optional name for the command.
         description: An optional description for the command.
         usage: Optional usage instructions for the command.
+        executor: "inline" (default) or "process" to run the handler in the
+                  process pool.
+        timeout: Seconds a process handler may run before it fails.
 
     Returns:
         A decorator that transforms an asynchronous function into a Command object.
 
     Raises:
-        ValueError: If no triggers are provided.
+        ValueError: If no triggers are provided or the executor is unknown.
 
     """
     if not triggers:
         message = "At least one trigger must be provided."
         raise ValueError(message)
+    if executor not in COMMAND_EXECUTORS:
+        message = f"Unknown command executor '{executor}'."
+        raise ValueError(message)
 
     metadata = CommandMetadata(name=name, description=description, usage=usage)
 
@@ -154,7 +257,49 @@ def command(
             whitelisted=list(whitelisted) if whitelisted is not None else None,
             case_sensitive=case_sensitive,
             metadata=metadata,
+            executor=executor,
+            timeout=timeout,
         )
         return cmd.with_handler(handler)
 
     return decorator
+
+
+def batch_command(
+    *triggers: str | re.Pattern,
+    whitelisted: Sequence[str] | None = None,
+    case_sensitive: bool = False,
+    name: str | None = None,
+    description: str | None = None,
+    usage: str | None = None,
+) -> Callable[[Callable[[list[Context]], Awaitable[None]]], BatchCommand]:
+    """Define a batch command via decorator.
+
+    Takes the same arguments as `command`; the decorated function receives a
+    list of Context objects instead of a single one.
+
+    Returns:
+        A decorator that transforms an asynchronous function into a BatchCommand.
+
+    Raises:
+        ValueError: If no triggers are provided.
+
+    """
+    if not triggers:
+        message = "At least one trigger must be provided."
+        raise ValueError(message)
+
+    metadata = CommandMetadata(name=name, description=description, usage=usage)
+
+    def decorator(
+        handler: Callable[[list[Context]], Awaitable[None]],
+    ) -> BatchCommand:
+        cmd = BatchCommand(
+            triggers=list(triggers),
+            whitelisted=list(whitelisted) if whitelisted is not None else None,
+            case_sensitive=case_sensitive,
+            metadata=metadata,
+        )
+        return cmd.with_batch_handler(handler)
+
+    return decorator
@@ -10,7 +10,12 @@ from typing import Any, Self
 from pydantic import Field, ValidationError, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from signal_client.adapters.storage import codecs, sqlite
+
 from .exceptions import ConfigurationError
+from .serialization import JSON_BACKENDS
+
+INGEST_ROLES = ("all", "ingest", "worker")
 
 
 class Settings(BaseSettings):
@@ -65,6 +70,117 @@ class Settings(BaseSettings):
         description="Number of shards for worker pool. "
         "Defaults to worker_pool_size if 0.",
     )
+    worker_batch_size: int = Field(
+        1,
+        description="Maximum number of ready messages a worker drains and "
+        "processes as one batch. 1 processes messages one at a time.",
+    )
+    worker_drain_timeout: float = Field(
+        30.0,
+        description="Seconds to wait at shutdown for queued messages to be "
+        "processed before workers stop. 0 stops without draining.",
+    )
+    direct_shard_enqueue: bool = Field(
+        default=False,
+        description="Enqueue incoming messages straight into the worker shard "
+        "queues instead of routing them through a central distributor task.",
+    )
+    worker_work_stealing: bool = Field(
+        default=False,
+        description="Let idle workers take whole conversations from busier "
+        "shards. Messages of one conversation are still processed in order. "
+        "Cannot be combined with direct_shard_enqueue.",
+    )
+    worker_max_inflight: int = Field(
+        1,
+        description="Handlers each worker runs concurrently. Above 1, messages "
+        "of different conversations overlap and ordering is kept per "
+        "conversation only.",
+    )
+    worker_conversation_max_inflight: int = Field(
+        1,
+        description="Handlers of one conversation a worker runs concurrently. "
+        "1 processes each conversation in order.",
+    )
+    worker_autoscale_enabled: bool = Field(
+        default=False,
+        description="Add and retire workers between worker_pool_size and "
+        "worker_autoscale_max_pool_size based on queue latency and depth.",
+    )
+    worker_autoscale_max_pool_size: int = Field(
+        16, description="Maximum number of workers when autoscaling."
+    )
+    worker_autoscale_interval: float = Field(
+        1.0, description="Interval (in seconds) between autoscaling decisions."
+    )
+    worker_autoscale_target_latency_ms: int = Field(
+        250,
+        description="Mean queue latency (in milliseconds) above which the "
+        "autoscaler adds workers.",
+    )
+    worker_autoscale_target_queue_depth: int = Field(
+        10,
+        description="Queued messages per worker above which the autoscaler "
+        "adds workers.",
+    )
+    command_process_pool_size: int = Field(
+        0,
+        description="Worker processes for commands declared with "
+        'executor="process". 0 uses the CPU count.',
+    )
+    command_process_timeout: float = Field(
+        30.0,
+        description="Default time (in seconds) a process command handler may "
+        "run. 0 disables the limit.",
+    )
+    ingest_role: str = Field(
+        "all",
+        description="Process role: 'all' listens and handles messages in one "
+        "process, 'ingest' only listens and publishes to Redis streams, "
+        "'worker' only handles messages read from them. 'ingest' and 'worker' "
+        "require the 'redis' storage type.",
+    )
+    ingest_stream_prefix: str = Field(
+        "signal_client:ingest",
+        description="Key prefix of the Redis streams shared by ingest and "
+        "worker processes.",
+    )
+    ingest_stream_partitions: int = Field(
+        16,
+        description="Number of Redis streams conversations are hashed onto. "
+        "Use the same value in every process.",
+    )
+    ingest_stream_group: str = Field(
+        "signal_client_workers",
+        description="Consumer group the worker processes read the streams with.",
+    )
+    ingest_stream_consumer: str = Field(
+        "",
+        description="Consumer name of this worker process. Defaults to "
+        "'<hostname>-<pid>'; set a stable name to resume pending entries after "
+        "a restart.",
+    )
+    ingest_worker_index: int = Field(
+        0, description="Index of this worker process, from 0."
+    )
+    ingest_worker_count: int = Field(
+        1, description="Number of worker processes splitting the streams."
+    )
+    ingest_stream_claim_idle_ms: int = Field(
+        30000,
+        description="Idle time (in milliseconds) after which a worker reclaims "
+        "entries another consumer read but never acknowledged.",
+    )
+    command_prefilter_enabled: bool = Field(
+        default=False,
+        description="Checkpoint chat messages whose text matches no command "
+        "without fully parsing them.",
+    )
+    fast_models_enabled: bool = Field(
+        default=False,
+        description="Build chat messages as lightweight slots objects instead of "
+        "validated pydantic models.",
+    )
     queue_put_timeout: float = Field(
         1.0, description="Timeout (in seconds) for putting messages into the queue."
     )
@@ -78,9 +194,49 @@ class Settings(BaseSettings):
     durable_queue_max_length: int = Field(
         10000, description="Maximum length of the durable queue."
     )
+    durable_queue_compaction_interval: float = Field(
+        1.0,
+        description="Interval (in seconds) between background removals of "
+        "acknowledged messages from the durable queue.",
+    )
+    durable_queue_streaming_replay: bool = Field(
+        default=False,
+        description="Replay the durable queue at startup from a background task "
+        "that reads it page by page and waits for queue space instead of dropping "
+        "messages once the queue is full. Live messages are persisted meanwhile "
+        "but dispatched only after the backlog, keeping each conversation in order.",
+    )
+    durable_queue_replay_page_size: int = Field(
+        500,
+        description="Number of durable queue records read per page during "
+        "streaming replay.",
+    )
     ingest_checkpoint_window: int = Field(
         5000, description="Number of messages after which to save ingest checkpoint."
     )
+    ingest_checkpoint_incremental: bool = Field(
+        default=False,
+        description="Persist ingest checkpoints as an append-only log "
+        "instead of rewriting the whole window on every message.",
+    )
+    ingest_checkpoint_compaction_interval: float = Field(
+        30.0,
+        description="Interval (in seconds) between background compactions of the "
+        "incremental checkpoint log.",
+    )
+    write_behind_enabled: bool = Field(
+        default=False,
+        description="Buffer durable queue appends and incremental checkpoints in "
+        "memory and flush them to storage in batches.",
+    )
+    write_behind_max_records: int = Field(
+        100, description="Flush buffered writes once this many records are pending."
+    )
+    write_behind_max_delay_ms: int = Field(
+        50,
+        description="Maximum time (in milliseconds) a buffered write may wait "
+        "before it is flushed.",
+    )
     ingest_queue_name: str = Field(
         "signal_client_ingest",
         description="Name of the ingest queue in persistent storage.",
@@ -131,10 +287,37 @@ class Settings(BaseSettings):
         "localhost", description="Redis host for 'redis' storage type."
     )
     redis_port: int = Field(6379, description="Redis port for 'redis' storage type.")
+    redis_db: int = Field(0, description="Redis database number.")
+    redis_password: str | None = Field(
+        default=None, description="Password for Redis AUTH."
+    )
+    redis_ssl: bool = Field(default=False, description="Connect to Redis over TLS.")
+    redis_max_connections: int | None = Field(
+        default=None,
+        description="Maximum connections in the Redis connection pool "
+        "(unbounded when unset).",
+    )
+    redis_codec: str = Field(
+        "json",
+        description="Record codec for Redis storage: 'json', 'orjson', 'msgpack' "
+        "or 'auto' (orjson when installed, else json).",
+    )
+    redis_page_size: int = Field(
+        1000,
+        description="List entries fetched per LRANGE page and pushed per RPUSH.",
+    )
     sqlite_database: str = Field(
         "signal_client.db",
         description="SQLite database file for 'sqlite' storage type.",
     )
+    sqlite_journal_mode: str = Field(
+        "wal",
+        description="SQLite journal mode (e.g. 'wal', 'delete') applied on connect.",
+    )
+    sqlite_synchronous: str = Field(
+        "normal",
+        description="SQLite synchronous level: 'off', 'normal', 'full' or 'extra'.",
+    )
 
     dlq_name: str = Field(
         "signal_client_dlq",
@@ -144,6 +327,12 @@ class Settings(BaseSettings):
         5, description="Maximum number of retries for messages in the DLQ."
     )
 
+    json_backend: str = Field(
+        "json",
+        description="JSON backend for parsing, storage and API payloads: 'json', "
+        "'orjson', 'msgspec' or 'auto' (the fastest installed, else json).",
+    )
+
     log_redaction_enabled: bool = Field(
         default=True, description="Enable or disable PII redaction in logs."
     )
@@ -172,11 +361,20 @@ class Settings(BaseSettings):
         """
         self._validate_storage_type()
         self._validate_queue_limits()
+        self._validate_worker_limits()
+        self._validate_autoscale()
+        self._validate_ingest_role()
         self._normalize_worker_shards()
         self._validate_endpoint_timeouts()
         self._ensure_idempotency_header()
+        self._validate_json_backend()
         return self
 
+    def _validate_json_backend(self) -> None:
+        if self.json_backend.lower() not in JSON_BACKENDS:
+            message = f"Unsupported json_backend '{self.json_backend}'."
+            raise ValueError(message)
+
     def _validate_storage_type(self) -> None:
         storage_type = self.storage_type.lower()
         validators = {
@@ -200,19 +398,52 @@ class Settings(BaseSettings):
         if isinstance(self.redis_port, int) and self.redis_port <= 0:
             message = "'redis_port' must be a positive integer."
             raise ValueError(message)
+        if self.redis_db < 0:
+            message = "'redis_db' must not be negative."
+            raise ValueError(message)
+        if self.redis_max_connections is not None and self.redis_max_connections <= 0:
+            message = "'redis_max_connections' must be positive."
+            raise ValueError(message)
+        if self.redis_codec.lower() not in codecs.CODEC_NAMES:
+            message = f"Unsupported redis_codec '{self.redis_codec}'."
+            raise ValueError(message)
+        if self.redis_page_size <= 0:
+            message = "'redis_page_size' must be positive."
+            raise ValueError(message)
 
     def _validate_sqlite_storage(self) -> None:
         if not self.sqlite_database:
             message = "SQLite storage requires 'sqlite_database'."
             raise ValueError(message)
+        if self.sqlite_journal_mode.lower() not in sqlite.JOURNAL_MODES:
+            message = f"Unsupported sqlite_journal_mode '{self.sqlite_journal_mode}'."
+            raise ValueError(message)
+        if self.sqlite_synchronous.lower() not in sqlite.SYNCHRONOUS_LEVELS:
+            message = f"Unsupported sqlite_synchronous '{self.sqlite_synchronous}'."
+            raise ValueError(message)
 
     def _validate_queue_limits(self) -> None:
         if self.durable_queue_max_length <= 0:
             message = "'durable_queue_max_length' must be positive."
             raise ValueError(message)
+        if self.durable_queue_compaction_interval <= 0:
+            message = "'durable_queue_compaction_interval' must be positive."
+            raise ValueError(message)
+        if self.durable_queue_replay_page_size <= 0:
+            message = "'durable_queue_replay_page_size' must be positive."
+            raise ValueError(message)
         if self.ingest_checkpoint_window <= 0:
             message = "'ingest_checkpoint_window' must be positive."
             raise ValueError(message)
+        if self.ingest_checkpoint_compaction_interval <= 0:
+            message = "'ingest_checkpoint_compaction_interval' must be positive."
+            raise ValueError(message)
+        if self.write_behind_max_records <= 0:
+            message = "'write_behind_max_records' must be positive."
+            raise ValueError(message)
+        if self.write_behind_max_delay_ms < 0:
+            message = "'write_behind_max_delay_ms' must be non-negative."
+            raise ValueError(message)
         if self.ingest_pause_seconds < 0:
             message = "'ingest_pause_seconds' must be non-negative."
             raise ValueError(message)
@@ -220,6 +451,78 @@ class Settings(BaseSettings):
             message = "'distributed_lock_timeout' must be positive."
             raise ValueError(message)
 
+    def _validate_worker_limits(self) -> None:
+        if self.worker_batch_size <= 0:
+            message = "'worker_batch_size' must be positive."
+            raise ValueError(message)
+        if self.worker_drain_timeout < 0:
+            message = "'worker_drain_timeout' must be non-negative."
+            raise ValueError(message)
+        if self.worker_work_stealing and self.direct_shard_enqueue:
+            message = (
+                "'worker_work_stealing' cannot be combined with 'direct_shard_enqueue'."
+            )
+            raise ValueError(message)
+        if self.worker_max_inflight <= 0 or self.worker_conversation_max_inflight <= 0:
+            message = (
+                "'worker_max_inflight' and 'worker_conversation_max_inflight' "
+                "must be positive."
+            )
+            raise ValueError(message)
+        if self.command_process_pool_size < 0 or self.command_process_timeout < 0:
+            message = (
+                "'command_process_pool_size' and 'command_process_timeout' "
+                "must be non-negative."
+            )
+            raise ValueError(message)
+        if self.worker_max_inflight > 1 and self.worker_batch_size > 1:
+            message = (
+                "'worker_max_inflight' cannot be combined with 'worker_batch_size'."
+            )
+            raise ValueError(message)
+
+    def _validate_autoscale(self) -> None:
+        if not self.worker_autoscale_enabled:
+            return
+        if self.worker_autoscale_max_pool_size < self.worker_pool_size:
+            message = "'worker_autoscale_max_pool_size' must be >= 'worker_pool_size'."
+            raise ValueError(message)
+        if (
+            self.worker_autoscale_interval <= 0
+            or self.worker_autoscale_target_latency_ms <= 0
+            or self.worker_autoscale_target_queue_depth <= 0
+        ):
+            message = (
+                "'worker_autoscale_interval', 'worker_autoscale_target_latency_ms' "
+                "and 'worker_autoscale_target_queue_depth' must be positive."
+            )
+            raise ValueError(message)
+
+    def _validate_ingest_role(self) -> None:
+        role = self.ingest_role.lower()
+        if role not in INGEST_ROLES:
+            message = f"Unsupported ingest_role '{self.ingest_role}'."
+            raise ValueError(message)
+        if role == "all":
+            return
+        if self.storage_type.lower() != "redis":
+            message = f"ingest_role '{role}' requires the 'redis' storage type."
+            raise ValueError(message)
+        if role == "ingest" and self.direct_shard_enqueue:
+            message = (
+                "ingest_role 'ingest' cannot be combined with 'direct_shard_enqueue'."
+            )
+            raise ValueError(message)
+        if self.ingest_stream_partitions <= 0 or self.ingest_stream_claim_idle_ms <= 0:
+            message = (
+                "'ingest_stream_partitions' and 'ingest_stream_claim_idle_ms' "
+                "must be positive."
+            )
+            raise ValueError(message)
+        if not 0 <= self.ingest_worker_index < self.ingest_worker_count:
+            message = "'ingest_worker_index' must be in [0, ingest_worker_count)."
+            raise ValueError(message)
+
     def _normalize_worker_shards(self) -> None:
         if (
             self.worker_shard_count <= 0
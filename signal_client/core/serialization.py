@@ -0,0 +1,198 @@
+"""Process-wide JSON encoding with a pluggable backend.
+
+Ingest parsing, storage, and the HTTP clients encode and decode JSON through
+`loads`, `dumps`, and `dumps_bytes`, which delegate to the active backend.
+`json` (the standard library) is the default. `orjson` and `msgspec` produce
+equivalent documents faster, with compact separators and non-ASCII text left
+unescaped, so existing data stays readable either way. `auto` picks the
+first one installed and falls back to `json`. Every backend raises
+`json.JSONDecodeError` for malformed input, so callers handle a single error
+type regardless of the backend.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+from collections.abc import Callable
+from typing import Any, Protocol
+
+JSON_BACKENDS = ("auto", "json", "orjson", "msgspec")
+
+
+class JsonBackend(Protocol):
+    """Encodes Python objects to JSON and back."""
+
+    name: str
+
+    def loads(self, data: str | bytes) -> Any:  # noqa: ANN401
+        """Parse a JSON document."""
+        ...
+
+    def dumps(self, obj: object) -> str:
+        """Serialize an object to JSON text."""
+        ...
+
+    def dumps_bytes(self, obj: object) -> bytes:
+        """Serialize an object to UTF-8 encoded JSON."""
+        ...
+
+
+class StdlibJsonBackend:
+    """Backend backed by the standard library `json` module."""
+
+    name = "json"
+
+    def loads(self, data: str | bytes) -> Any:  # noqa: ANN401
+        """Parse JSON text or UTF-8 bytes."""
+        return json.loads(data)
+
+    def dumps(self, obj: object) -> str:
+        """Serialize an object to JSON text."""
+        return json.dumps(obj)
+
+    def dumps_bytes(self, obj: object) -> bytes:
+        """Serialize an object to UTF-8 encoded JSON."""
+        return json.dumps(obj).encode("utf-8")
+
+
+class OrjsonBackend:
+    """Backend backed by `orjson`."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        """Import orjson, raising ImportError when it is not installed."""
+        self._orjson = importlib.import_module("orjson")
+        # The standard library turns int/float dict keys into strings; keep
+        # accepting the same objects.
+        self._options = self._orjson.OPT_NON_STR_KEYS
+
+    def loads(self, data: str | bytes) -> Any:  # noqa: ANN401
+        """Parse JSON text or UTF-8 bytes."""
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError.
+        return self._orjson.loads(data)
+
+    def dumps(self, obj: object) -> str:
+        """Serialize an object to JSON text."""
+        return self.dumps_bytes(obj).decode("utf-8")
+
+    def dumps_bytes(self, obj: object) -> bytes:
+        """Serialize an object to UTF-8 encoded JSON."""
+        return self._orjson.dumps(obj, option=self._options)
+
+
+class MsgspecBackend:
+    """Backend backed by `msgspec.json`."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        """Import msgspec, raising ImportError when it is not installed."""
+        msgspec = importlib.import_module("msgspec")
+        self._decode_error: type[Exception] = msgspec.DecodeError
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def loads(self, data: str | bytes) -> Any:  # noqa: ANN401
+        """Parse JSON text or UTF-8 bytes."""
+        try:
+            return self._decoder.decode(data)
+        except self._decode_error as exc:
+            document = (
+                data if isinstance(data, str) else data.decode("utf-8", "replace")
+            )
+            raise json.JSONDecodeError(str(exc), document, 0) from exc
+
+    def dumps(self, obj: object) -> str:
+        """Serialize an object to JSON text."""
+        return self.dumps_bytes(obj).decode("utf-8")
+
+    def dumps_bytes(self, obj: object) -> bytes:
+        """Serialize an object to UTF-8 encoded JSON."""
+        return self._encoder.encode(obj)
+
+
+_FACTORIES: dict[str, Callable[[], JsonBackend]] = {
+    "json": StdlibJsonBackend,
+    "orjson": OrjsonBackend,
+    "msgspec": MsgspecBackend,
+}
+
+
+def resolve_backend(backend: str | JsonBackend = "json") -> JsonBackend:
+    """Return a backend instance for a backend name, or the backend itself.
+
+    Raises:
+        ValueError: If the name is unknown or its package is not installed.
+
+    """
+    if not isinstance(backend, str):
+        return backend
+    name = backend.lower()
+    if name == "auto":
+        for candidate in ("orjson", "msgspec"):
+            try:
+                return _FACTORIES[candidate]()
+            except ImportError:
+                continue
+        return StdlibJsonBackend()
+    factory = _FACTORIES.get(name)
+    if factory is None:
+        message = f"Unknown JSON backend '{backend}'."
+        raise ValueError(message)
+    try:
+        return factory()
+    except ImportError as exc:
+        message = f"JSON backend '{name}' requires the '{name}' package."
+        raise ValueError(message) from exc
+
+
+_backend: JsonBackend = StdlibJsonBackend()
+
+
+def get_backend() -> JsonBackend:
+    """Return the active backend."""
+    return _backend
+
+
+def set_backend(backend: str | JsonBackend) -> JsonBackend:
+    """Activate a backend for the whole process and return it.
+
+    Raises:
+        ValueError: If the name is unknown or its package is not installed.
+
+    """
+    global _backend  # noqa: PLW0603
+    _backend = resolve_backend(backend)
+    return _backend
+
+
+def loads(data: str | bytes) -> Any:  # noqa: ANN401
+    """Parse a JSON document with the active backend."""
+    return _backend.loads(data)
+
+
+def dumps(obj: object) -> str:
+    """Serialize an object to JSON text with the active backend."""
+    return _backend.dumps(obj)
+
+
+def dumps_bytes(obj: object) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON with the active backend."""
+    return _backend.dumps_bytes(obj)
+
+
+__all__ = [
+    "JSON_BACKENDS",
+    "JsonBackend",
+    "MsgspecBackend",
+    "OrjsonBackend",
+    "StdlibJsonBackend",
+    "dumps",
+    "dumps_bytes",
+    "get_backend",
+    "loads",
+    "resolve_backend",
+    "set_backend",
+]
@@ -76,6 +76,24 @@ SHARD_QUEUE_DEPTH = Gauge(
     "Current depth of each shard queue",
     labelnames=("shard",),
 )
+CONVERSATION_STEALS = Counter(
+    "conversation_steals_total",
+    "Conversations claimed by a worker from another shard's ready queue",
+)
+CONVERSATION_BACKLOG = Histogram(
+    "conversation_backlog_messages",
+    "Messages waiting in a conversation mailbox when a worker claims it",
+    buckets=(1, 2, 5, 10, 25, 50, 100, 250, 1000),
+)
+WORKER_POOL_SIZE = Gauge(
+    "worker_pool_size",
+    "Number of running worker tasks",
+)
+WORKER_SCALING_EVENTS = Counter(
+    "worker_scaling_events_total",
+    "Autoscaler decisions that added or retired workers",
+    labelnames=("direction",),
+)
 
 
 def render_metrics(registry: CollectorRegistry | None = None) -> bytes:
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import re
 from collections.abc import Iterable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import structlog
 
@@ -19,13 +19,190 @@ class _LiteralRegistration:
     trigger_lower: str
 
 
+@dataclass(slots=True)
+class _TrieNode:
+    children: dict[str, _TrieNode] = field(default_factory=dict)
+    # Lowest registration index of a trigger ending at this node.
+    index: int | None = None
+
+    def insert(self, trigger: str, index: int) -> None:
+        node = self
+        for char in trigger:
+            node = node.children.setdefault(char, _TrieNode())
+        if node.index is None or index < node.index:
+            node.index = index
+
+    def first_prefix_match(self, text: str) -> int | None:
+        """Return the lowest index among triggers that are prefixes of `text`."""
+        best = self.index
+        node = self
+        for char in text:
+            child = node.children.get(char)
+            if child is None:
+                break
+            node = child
+            if node.index is not None and (best is None or node.index < best):
+                best = node.index
+        return best
+
+
+class _LiteralIndex:
+    """Prefix tries over literal triggers, one per case sensitivity."""
+
+    __slots__ = ("_insensitive", "_registrations", "_sensitive")
+
+    def __init__(self, registrations: list[_LiteralRegistration]) -> None:
+        self._registrations = tuple(registrations)
+        self._sensitive: _TrieNode | None = None
+        self._insensitive: _TrieNode | None = None
+        for index, registration in enumerate(self._registrations):
+            if registration.case_sensitive:
+                if self._sensitive is None:
+                    self._sensitive = _TrieNode()
+                self._sensitive.insert(registration.trigger, index)
+            else:
+                if self._insensitive is None:
+                    self._insensitive = _TrieNode()
+                self._insensitive.insert(registration.trigger_lower, index)
+
+    def match(self, text: str) -> _LiteralRegistration | None:
+        best: int | None = None
+        if self._sensitive is not None:
+            best = self._sensitive.first_prefix_match(text)
+        if self._insensitive is not None:
+            lowered = self._insensitive.first_prefix_match(text.lower())
+            if lowered is not None and (best is None or lowered < best):
+                best = lowered
+        return None if best is None else self._registrations[best]
+
+
+_NAMED_GROUP = re.compile(r"(?<!\\)\(\?P<(\w+)>")
+_NAMED_BACKREF = re.compile(r"(?<!\\)\(\?P=(\w+)\)")
+# Numbered backreferences and conditionals depend on group numbers, which shift
+# once the pattern is embedded in the alternation.
+_GROUP_NUMBER_DEPENDENT = re.compile(r"\\[1-9]|\(\?\(")
+# Global inline flags such as "(?x)" would apply to every branch once embedded
+# (Python 3.10 only warns about them mid-pattern).
+_GLOBAL_INLINE_FLAGS = re.compile(r"(?<!\\)\(\?[aiLmsux]+\)")
+_SCOPED_FLAGS = (
+    (re.IGNORECASE, "i"),
+    (re.MULTILINE, "m"),
+    (re.DOTALL, "s"),
+    (re.VERBOSE, "x"),
+    (re.ASCII, "a"),
+)
+
+
+class _RegexIndex:
+    """One alternation over the regex triggers, used as a prefilter.
+
+    Each eligible pattern becomes a named branch with its flags scoped to the
+    branch and its named groups prefixed so branches cannot collide. A single
+    search finds the leftmost match; patterns registered before the matching
+    branch may still match further right, so they are checked individually,
+    as are patterns that could not be embedded.
+    """
+
+    __slots__ = ("_branches", "_combined", "_commands", "_eligible")
+
+    def __init__(self, commands: list[tuple[re.Pattern[str], Command]]) -> None:
+        self._commands = tuple(commands)
+        self._eligible = [False] * len(self._commands)
+        self._branches: dict[int, int] = {}
+        self._combined: re.Pattern[str] | None = None
+        parts: list[str] = []
+        for index, (pattern, _command) in enumerate(self._commands):
+            branch = self._branch_source(index, pattern)
+            if branch is not None:
+                parts.append(branch)
+                self._eligible[index] = True
+        if not parts:
+            return
+        try:
+            combined = re.compile("|".join(parts))
+        except re.error:
+            self._eligible = [False] * len(self._commands)
+            return
+        self._combined = combined
+        self._branches = {
+            combined.groupindex[f"_r{index}"]: index
+            for index, eligible in enumerate(self._eligible)
+            if eligible
+        }
+
+    @staticmethod
+    def _branch_source(index: int, pattern: re.Pattern[str]) -> str | None:
+        source = pattern.pattern
+        if (
+            not isinstance(source, str)
+            or _GROUP_NUMBER_DEPENDENT.search(source)
+            or _GLOBAL_INLINE_FLAGS.search(source)
+        ):
+            return None
+        prefix = f"_r{index}_"
+        source = _NAMED_GROUP.sub(lambda m: f"(?P<{prefix}{m.group(1)}>", source)
+        source = _NAMED_BACKREF.sub(lambda m: f"(?P={prefix}{m.group(1)})", source)
+        flags = "".join(
+            letter for flag, letter in _SCOPED_FLAGS if pattern.flags & flag
+        )
+        # A trailing newline ends a verbose-mode comment before the group closes.
+        body = f"{source}\n" if pattern.flags & re.VERBOSE else source
+        branch = f"(?P<_r{index}>(?{flags}:{body}))"
+        try:
+            compiled = re.compile(branch)
+        except re.error:
+            return None
+        expected = {f"_r{index}", *(prefix + name for name in pattern.groupindex)}
+        if set(compiled.groupindex) != expected:
+            return None
+        return branch
+
+    def match(self, text: str) -> tuple[re.Pattern[str], Command] | None:
+        candidate: int | None = None
+        if self._combined is not None:
+            found = self._combined.search(text)
+            if found is not None and found.lastindex is not None:
+                candidate = self._branches.get(found.lastindex)
+        limit = len(self._commands) if candidate is None else candidate
+        for index in range(limit):
+            if candidate is None and self._eligible[index]:
+                continue
+            pattern, command = self._commands[index]
+            if pattern.search(text):
+                return pattern, command
+        if candidate is None:
+            return None
+        pattern, command = self._commands[candidate]
+        if pattern.search(text):
+            return pattern, command
+        # The branch and the original disagree; fall back to a plain scan.
+        return next(
+            (
+                (pattern, command)
+                for pattern, command in self._commands[candidate + 1 :]
+                if pattern.search(text)
+            ),
+            None,
+        )
+
+
 class CommandRouter:
-    """Deterministic command matcher that preserves registration order."""
+    """Deterministic command matcher that preserves registration order.
+
+    Literal triggers are matched through prefix tries built on first use after
+    a registration, so a lookup walks the message text once (lowercased once for
+    case-insensitive triggers) instead of testing every trigger. Among all
+    triggers that prefix the text, the earliest registered one wins. Regex
+    triggers are prefiltered with one combined alternation (see `_RegexIndex`)
+    and still resolve to the earliest registered pattern that matches.
+    """
 
     def __init__(self) -> None:
         self._literal_triggers: list[_LiteralRegistration] = []
         self._regex_commands: list[tuple[re.Pattern[str], Command]] = []
         self._registered_regex: set[tuple[int, str, int]] = set()
+        self._literal_index: _LiteralIndex | None = None
+        self._regex_index: _RegexIndex | None = None
 
     @property
     def regex_commands(self) -> Iterable[tuple[re.Pattern[str], Command]]:
@@ -46,18 +223,28 @@ class CommandRouter:
 
     def match(self, text: str) -> tuple[Command | None, str | None]:
         """Return the first matching command based on registration order."""
-        for registration in self._literal_triggers:
-            if registration.case_sensitive:
-                if text.startswith(registration.trigger):
-                    return registration.command, registration.trigger
-            elif text.lower().startswith(registration.trigger_lower):
-                return registration.command, registration.trigger
+        literal_index = self._literal_index
+        if literal_index is None:
+            literal_index = self._literal_index = _LiteralIndex(self._literal_triggers)
+        registration = literal_index.match(text)
+        if registration is not None:
+            return registration.command, registration.trigger
 
-        for pattern, command in self._regex_commands:
-            if pattern.search(text):
-                return command, pattern.pattern
+        if not self._regex_commands:
+            return None, None
+        regex_index = self._regex_index
+        if regex_index is None:
+            regex_index = self._regex_index = _RegexIndex(self._regex_commands)
+        matched = regex_index.match(text)
+        if matched is None:
+            return None, None
+        pattern, command = matched
+        return command, pattern.pattern
 
-        return None, None
+    def could_match(self, text: str) -> bool:
+        """Return True when some registered trigger matches the text."""
+        command, _ = self.match(text)
+        return command is not None
 
     def _register_literal(
         self, trigger: str, command: Command, *, case_sensitive: bool
@@ -81,6 +268,7 @@ class CommandRouter:
                 trigger_lower=trigger.lower(),
             )
         )
+        self._literal_index = None
 
     def _register_regex(self, pattern: re.Pattern[str], command: Command) -> None:
         key = (id(command), pattern.pattern, pattern.flags)
@@ -88,6 +276,7 @@ class CommandRouter:
             return
         self._regex_commands.append((pattern, command))
         self._registered_regex.add(key)
+        self._regex_index = None
 
 
 __all__ = ["CommandRouter"]
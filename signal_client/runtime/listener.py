@@ -3,11 +3,14 @@ from __future__ import annotations
 import asyncio
 import json
 import time
+from collections.abc import Callable
 from enum import Enum
+from functools import partial
 
 import structlog
 
 from signal_client.adapters.transport.websocket_client import WebSocketClient
+from signal_client.core import serialization
 from signal_client.observability.logging import safe_log
 from signal_client.observability.metrics import MESSAGE_QUEUE_DEPTH
 from signal_client.runtime.models import QueuedMessage
@@ -38,9 +41,26 @@ class MessageService:
         *,
         enqueue_timeout: float = 1.0,
         backpressure_policy: BackpressurePolicy = BackpressurePolicy.DROP_OLDEST,
+        queue_selector: Callable[[QueuedMessage], asyncio.Queue[QueuedMessage]]
+        | None = None,
+        queue_depth_getter: Callable[[], int] | None = None,
+        dispatch_gate: asyncio.Event | None = None,
     ) -> None:
+        """Create a message service.
+
+        `queue_selector` picks the queue for each message (for example
+        `WorkerPool.select_queue` to enqueue straight into worker shards); by
+        default every message goes to `queue`. Backpressure applies to the
+        selected queue. `queue_depth_getter` reports the total depth for the
+        queue depth metric when messages are spread over several queues.
+        While `dispatch_gate` is unset, live messages are persisted but not
+        enqueued, so a backlog replayed in the background is dispatched first.
+        """
         self._websocket_client = websocket_client
         self._queue = queue
+        self._queue_selector = queue_selector
+        self._queue_depth_getter = queue_depth_getter
+        self._dispatch_gate = dispatch_gate
         self._dead_letter_queue = dead_letter_queue
         self._persistent_queue = persistent_queue
         self._intake_controller = intake_controller
@@ -62,9 +82,12 @@ class MessageService:
             )
             try:
                 if self._persistent_queue:
-                    await self._persistent_queue.append(
+                    seq = await self._persistent_queue.append(
                         raw_message, enqueued_at=queued_message.enqueued_at
                     )
+                    queued_message.ack = partial(self._persistent_queue.ack, seq)
+                if self._dispatch_gate is not None:
+                    await self._dispatch_gate.wait()
                 enqueued = await self._enqueue_with_backpressure(queued_message)
             except Exception:
                 log.exception("message_service.enqueue_failed")
@@ -74,10 +97,15 @@ class MessageService:
                 self._update_queue_depth_metric()
                 continue
 
+            # The message leaves the pipeline here (it goes to the DLQ, if any), so
+            # it must not hold back the durable queue's low-watermark.
+            self._acknowledge(queued_message)
+
+            queue = self._select_queue(queued_message)
             self._warn(
                 "message_service.queue_full",
-                queue_depth=self._queue.qsize(),
-                queue_maxsize=self._queue.maxsize,
+                queue_depth=queue.qsize(),
+                queue_maxsize=queue.maxsize,
                 backpressure_policy=self._backpressure_policy.value,
             )
             if self._dead_letter_queue:
@@ -88,59 +116,83 @@ class MessageService:
                     reason="backpressure", duration=self._enqueue_timeout
                 )
 
+    def _select_queue(
+        self, queued_message: QueuedMessage
+    ) -> asyncio.Queue[QueuedMessage]:
+        if self._queue_selector is None:
+            return self._queue
+        return self._queue_selector(queued_message)
+
     async def _enqueue_with_backpressure(self, queued_message: QueuedMessage) -> bool:
+        queue = self._select_queue(queued_message)
         try:
             await asyncio.wait_for(
-                self._queue.put(queued_message),
+                queue.put(queued_message),
                 timeout=self._enqueue_timeout,
             )
         except asyncio.TimeoutError:
-            return await self._handle_enqueue_timeout(queued_message)
+            return await self._handle_enqueue_timeout(queue, queued_message)
         return True
 
-    async def _handle_enqueue_timeout(self, queued_message: QueuedMessage) -> bool:
+    async def _handle_enqueue_timeout(
+        self, queue: asyncio.Queue[QueuedMessage], queued_message: QueuedMessage
+    ) -> bool:
         if self._backpressure_policy is BackpressurePolicy.FAIL_FAST:
             return False
 
         try:
-            _ = self._queue.get_nowait()
+            dropped = queue.get_nowait()
         except asyncio.QueueEmpty:
             return False
 
-        self._queue.task_done()
+        queue.task_done()
+        self._acknowledge(dropped)
         self._warn(
             "message_service.dropped_oldest",
-            queue_depth=self._queue.qsize(),
-            queue_maxsize=self._queue.maxsize,
+            queue_depth=queue.qsize(),
+            queue_maxsize=queue.maxsize,
         )
         self._update_queue_depth_metric()
 
         try:
             await asyncio.wait_for(
-                self._queue.put(queued_message),
+                queue.put(queued_message),
                 timeout=self._enqueue_timeout,
             )
         except asyncio.TimeoutError:
             self._update_queue_depth_metric()
             self._warn(
                 "message_service.queue_full_after_drop",
-                queue_depth=self._queue.qsize(),
-                queue_maxsize=self._queue.maxsize,
+                queue_depth=queue.qsize(),
+                queue_maxsize=queue.maxsize,
             )
             return False
 
         self._update_queue_depth_metric()
         return True
 
+    def _acknowledge(self, queued_message: QueuedMessage) -> None:
+        ack = queued_message.ack
+        if ack is None:
+            return
+        try:
+            ack()
+        except Exception:  # noqa: BLE001 - never let acks break ingest
+            self._warn("message_service.ack_failed")
+
     @staticmethod
     def _parse_for_dlq(raw_message: str) -> dict | str:
         try:
-            return json.loads(raw_message)
+            return serialization.loads(raw_message)
         except json.JSONDecodeError:
             return {"raw": raw_message}
 
     def _update_queue_depth_metric(self) -> None:
-        MESSAGE_QUEUE_DEPTH.set(self._queue.qsize())
+        MESSAGE_QUEUE_DEPTH.set(
+            self._queue_depth_getter()
+            if self._queue_depth_getter
+            else self._queue.qsize()
+        )
 
     def _warn(self, event: str, **kwargs: object) -> None:
         """Emit warnings defensively when backpressure handling triggers."""
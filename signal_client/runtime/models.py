@@ -15,6 +15,7 @@ class QueuedMessage:
     enqueued_at: float
     recipient: str | None = None
     message: Message | None = None
+    decoded: DecodedEnvelope | None = None
     ack: Callable[[], None] | None = None
 
 
@@ -22,3 +23,4 @@ __all__ = ["QueuedMessage"]
 
 if TYPE_CHECKING:  # pragma: no cover - circular import guard
     from signal_client.adapters.api.schemas.message import Message
+    from signal_client.runtime.services.message_parser import DecodedEnvelope
@@ -0,0 +1,176 @@
+"""Queue-driven autoscaling of worker tasks.
+
+The autoscaler samples the queue latency reported by workers and the pool's
+queue depth once per interval. It grows the pool when messages wait longer
+than the target latency or the backlog per worker exceeds the target depth,
+sizing the step so the backlog is spread over enough workers. It retires one
+worker at a time after several consecutive idle intervals, never going below
+the configured minimum.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import structlog
+
+from signal_client.observability.logging import safe_log
+from signal_client.observability.metrics import WORKER_POOL_SIZE, WORKER_SCALING_EVENTS
+
+log = structlog.get_logger()
+
+
+@dataclass(frozen=True, slots=True)
+class AutoscaleConfig:
+    """Bounds and targets for worker autoscaling.
+
+    Attributes:
+        max_workers: Upper bound on the number of workers. The pool's initial
+            size is the lower bound.
+        interval: Seconds between scaling decisions.
+        target_latency: Mean queue latency, in seconds, above which workers
+            are added.
+        target_queue_depth: Queued messages per worker above which workers
+            are added.
+        scale_down_after: Consecutive idle intervals before a worker is
+            retired.
+
+    """
+
+    max_workers: int
+    interval: float = 1.0
+    target_latency: float = 0.25
+    target_queue_depth: int = 10
+    scale_down_after: int = 3
+
+
+class WorkerAutoscaler:
+    """Periodically resizes a worker pool from its latency and backlog."""
+
+    def __init__(
+        self,
+        config: AutoscaleConfig,
+        *,
+        min_workers: int,
+        worker_count: Callable[[], int],
+        queue_depth: Callable[[], int],
+        resize: Callable[[int], None],
+    ) -> None:
+        """Initialize the autoscaler.
+
+        Args:
+            config: Scaling bounds and targets.
+            min_workers: Lower bound on the number of workers.
+            worker_count: Returns the number of running workers.
+            queue_depth: Returns the number of queued messages.
+            resize: Starts or retires workers to reach the given count.
+
+        """
+        self._min_workers = max(1, min_workers)
+        self._max_workers = max(self._min_workers, config.max_workers)
+        self._interval = max(0.01, config.interval)
+        self._target_latency = config.target_latency
+        self._target_queue_depth = max(1, config.target_queue_depth)
+        self._scale_down_after = max(1, config.scale_down_after)
+        self._worker_count = worker_count
+        self._queue_depth = queue_depth
+        self._resize = resize
+        self._latency_total = 0.0
+        self._latency_samples = 0
+        self._idle_intervals = 0
+        self._task: asyncio.Task[None] | None = None
+
+    def observe_latency(self, latency: float) -> None:
+        """Record the queue latency of one processed message."""
+        self._latency_total += latency
+        self._latency_samples += 1
+
+    def start(self) -> None:
+        """Start making scaling decisions in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        """Stop making scaling decisions."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+
+    def evaluate(self) -> int:
+        """Apply one scaling decision and return the resulting worker count."""
+        workers = self._worker_count()
+        depth = self._queue_depth()
+        latency = (
+            self._latency_total / self._latency_samples
+            if self._latency_samples
+            else None
+        )
+        self._latency_total = 0.0
+        self._latency_samples = 0
+        WORKER_POOL_SIZE.set(workers)
+
+        overloaded = depth > self._target_queue_depth * workers or (
+            latency is not None and latency > self._target_latency
+        )
+        if overloaded:
+            self._idle_intervals = 0
+            if workers >= self._max_workers:
+                return workers
+            wanted = math.ceil(depth / self._target_queue_depth)
+            target = min(self._max_workers, max(workers + 1, wanted))
+            return self._scale("up", workers, target, depth, latency)
+
+        idle = depth == 0 and (latency is None or latency < self._target_latency / 2)
+        if not idle or workers <= self._min_workers:
+            self._idle_intervals = 0
+            return workers
+        self._idle_intervals += 1
+        if self._idle_intervals < self._scale_down_after:
+            return workers
+        self._idle_intervals = 0
+        return self._scale("down", workers, workers - 1, depth, latency)
+
+    def _scale(
+        self,
+        direction: str,
+        workers: int,
+        target: int,
+        depth: int,
+        latency: float | None,
+    ) -> int:
+        self._resize(target)
+        WORKER_SCALING_EVENTS.labels(direction=direction).inc()
+        WORKER_POOL_SIZE.set(target)
+        event = (
+            "worker_pool.scaled_up: Added workers"
+            if direction == "up"
+            else "worker_pool.scaled_down: Retired a worker"
+        )
+        safe_log(
+            log,
+            "info",
+            event,
+            workers=target,
+            previous_workers=workers,
+            queue_depth=depth,
+            queue_latency=latency,
+        )
+        return target
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                self.evaluate()
+            except Exception:  # noqa: BLE001 - keep scaling on transient errors
+                safe_log(
+                    log,
+                    "exception",
+                    "worker_pool.autoscale_failed: Scaling decision failed",
+                )
+
+
+__all__ = ["AutoscaleConfig", "WorkerAutoscaler"]
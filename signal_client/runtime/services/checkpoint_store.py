@@ -3,18 +3,32 @@
 This module provides an IngestCheckpointStore for persisting a sliding window
 of recently processed (source, timestamp) pairs, used for deduplication
 and resuming after restarts.
+
+Two persistence modes are supported. The default snapshot mode rewrites the whole
+window on every checkpoint. The incremental mode appends one record per checkpoint
+to an append-only log and trims the log back to the window from a periodic
+background compaction task, so the per-message cost does not depend on the
+window size.
 """
 
 from __future__ import annotations
 
 import asyncio
 import time
+from collections import deque
+from collections.abc import Iterable
+from contextlib import suppress
 from dataclasses import dataclass
 from typing import Any
 
 import structlog
 
 from signal_client.adapters.storage.base import Storage
+from signal_client.observability.logging import safe_log
+from signal_client.runtime.services.write_behind import (
+    WriteBehindBuffer,
+    WriteBehindConfig,
+)
 
 log = structlog.get_logger()
 
@@ -35,14 +49,26 @@ class IngestCheckpointStore:
     This is intentionally coarse but sufficient to dedupe Signal replayed
     envelopes after reconnects or process crashes. The window bounds growth so
     SQLite-backed bots remain lightweight.
+
+    In incremental mode each checkpoint is a single append to the persisted log.
+    The log may temporarily hold more than ``window_size`` records; `compact`
+    (run periodically once `start` is called) rewrites it back to the window.
+    With a write-behind config those appends are buffered and written in batches.
+
+    Duplicate lookups go through a hash index keyed on ``(source, timestamp)``
+    that is kept in sync with the ordered window as records are evicted, so
+    `is_duplicate` is O(1) and does not contend on the store lock.
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         storage: Storage,
         key: str,
         *,
         window_size: int = 5000,
+        incremental: bool = False,
+        compaction_interval: float = 30.0,
+        write_behind: WriteBehindConfig | None = None,
     ) -> None:
         """Initialize an IngestCheckpointStore instance.
 
@@ -50,14 +76,60 @@ class IngestCheckpointStore:
             storage: The storage backend to use for persistence.
             key: The key under which to store checkpoint records.
             window_size: The maximum number of records to keep in the sliding window.
+            incremental: Append one record per checkpoint instead of rewriting the
+                whole window.
+            compaction_interval: Seconds between background compactions of the
+                incremental log.
+            write_behind: Optional flush bounds for batching incremental appends.
 
         """
         self._storage = storage
         self._key = key
         self._window_size = max(1, window_size)
-        self._records: list[CheckpointRecord] = []
+        self._incremental = incremental
+        self._compaction_interval = max(0.0, compaction_interval)
+        self._records: deque[CheckpointRecord] = deque()
+        self._index: dict[tuple[str, int], int] = {}
         self._lock = asyncio.Lock()
         self._loaded = False
+        self._persisted_count = 0
+        self._compaction_task: asyncio.Task[None] | None = None
+        self._write_buffer = (
+            WriteBehindBuffer(
+                self._flush_records, write_behind, name=f"checkpoint:{key}"
+            )
+            if incremental and write_behind is not None
+            else None
+        )
+
+    @property
+    def incremental(self) -> bool:
+        """Return True when checkpoints are persisted as an append-only log."""
+        return self._incremental
+
+    def start(self) -> None:
+        """Start background compaction of the incremental checkpoint log."""
+        if not self._incremental or self._compaction_task is not None:
+            return
+        self._compaction_task = asyncio.create_task(self._run_compaction())
+
+    async def flush(self) -> None:
+        """Write any buffered checkpoints to storage."""
+        if self._write_buffer is not None:
+            await self._write_buffer.flush()
+
+    async def close(self) -> None:
+        """Stop background work, flush buffered checkpoints and trim the log."""
+        task = self._compaction_task
+        self._compaction_task = None
+        if task is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+        if self._write_buffer is not None:
+            await self._write_buffer.close()
+        if self._incremental and self._loaded:
+            await self.compact()
 
     async def load(self) -> None:
         """Load the last persisted window from storage."""
@@ -71,7 +143,8 @@ class IngestCheckpointStore:
                     for record in records
                     if isinstance(record, dict)
                 ]
-                self._records = [rec for rec in parsed if rec is not None]
+                self._replace_records(rec for rec in parsed if rec is not None)
+                self._persisted_count = len(records)
                 log.info(
                     "ingest_checkpoint.loaded",
                     key=self._key,
@@ -87,27 +160,51 @@ class IngestCheckpointStore:
         enqueued_at: float | None = None,
     ) -> None:
         """Persist the processed message for deduplication."""
-        await self.load()
+        if not self._loaded:
+            await self.load()
         record = CheckpointRecord(
             source=source,
             timestamp=timestamp,
             enqueued_at=enqueued_at or time.time(),
         )
         async with self._lock:
-            self._records.append(record)
-            if len(self._records) > self._window_size:
-                overflow = len(self._records) - self._window_size
-                del self._records[0:overflow]
-            await self._persist_locked()
+            self._add_record(record)
+            if not self._incremental:
+                await self._persist_locked()
+                return
+            if self._write_buffer is None:
+                await self._storage.append(self._key, self._serialize(record))
+                self._persisted_count += 1
+                return
+        await self._write_buffer.add(self._serialize(record))
+
+    async def mark_processed_many(self, records: Iterable[CheckpointRecord]) -> None:
+        """Persist several processed messages with one storage write."""
+        batch = list(records)
+        if not batch:
+            return
+        if not self._loaded:
+            await self.load()
+        async with self._lock:
+            for record in batch:
+                self._add_record(record)
+            if not self._incremental:
+                await self._persist_locked()
+                return
+            if self._write_buffer is None:
+                await self._storage.append_many(
+                    self._key, [self._serialize(record) for record in batch]
+                )
+                self._persisted_count += len(batch)
+                return
+        for record in batch:
+            await self._write_buffer.add(self._serialize(record))
 
     async def is_duplicate(self, source: str, timestamp: int) -> bool:
         """Return True if the message was processed recently."""
-        await self.load()
-        async with self._lock:
-            for record in reversed(self._records):
-                if record.source == source and record.timestamp == timestamp:
-                    return True
-        return False
+        if not self._loaded:
+            await self.load()
+        return (source, timestamp) in self._index
 
     async def compact_before(self, cutoff_timestamp: int) -> None:
         """Drop checkpoints older than the cutoff to prevent unbounded growth."""
@@ -120,13 +217,66 @@ class IngestCheckpointStore:
             ]
             if len(retained) == len(self._records):
                 return
-            self._records = retained
+            self._replace_records(retained)
             await self._persist_locked()
 
+    async def compact(self) -> None:
+        """Trim the incremental log back to the in-memory window."""
+        await self.load()
+        await self.flush()
+        async with self._lock:
+            retained = len(self._records)
+            if self._persisted_count <= retained:
+                return
+            await self._storage.trim_to_last(self._key, retained)
+            self._persisted_count = min(self._persisted_count, retained)
+            safe_log(
+                log,
+                "debug",
+                "ingest_checkpoint.compacted",
+                key=self._key,
+                count=self._persisted_count,
+            )
+
+    async def _flush_records(self, records: list[dict[str, Any]]) -> None:
+        async with self._lock:
+            await self._storage.append_many(self._key, records)
+            self._persisted_count += len(records)
+
+    async def _run_compaction(self) -> None:
+        while True:
+            await asyncio.sleep(self._compaction_interval)
+            try:
+                await self.compact()
+            except Exception:  # noqa: BLE001 - keep compacting on transient errors
+                safe_log(
+                    log, "warning", "ingest_checkpoint.compaction_failed", key=self._key
+                )
+
+    def _add_record(self, record: CheckpointRecord) -> None:
+        self._records.append(record)
+        key = (record.source, record.timestamp)
+        self._index[key] = self._index.get(key, 0) + 1
+        while len(self._records) > self._window_size:
+            evicted = self._records.popleft()
+            evicted_key = (evicted.source, evicted.timestamp)
+            remaining = self._index[evicted_key] - 1
+            if remaining:
+                self._index[evicted_key] = remaining
+            else:
+                del self._index[evicted_key]
+
+    def _replace_records(self, records: Iterable[CheckpointRecord]) -> None:
+        self._records = deque()
+        self._index = {}
+        for record in records:
+            self._add_record(record)
+
     async def _persist_locked(self) -> None:
+        records = [self._serialize(record) for record in self._records]
         await self._storage.delete_all(self._key)
-        for record in self._records:
-            await self._storage.append(self._key, self._serialize(record))
+        await self._storage.append_many(self._key, records)
+        self._persisted_count = len(records)
         log.debug(
             "ingest_checkpoint.persisted",
             key=self._key,
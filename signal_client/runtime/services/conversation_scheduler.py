@@ -0,0 +1,298 @@
+"""Per-conversation mailboxes with work stealing across worker shards.
+
+Every conversation gets a FIFO mailbox and a home shard (the same crc32 shard
+the worker pool uses). A mailbox with messages waiting sits in its home
+shard's ready queue until a worker claims it. While a worker holds the claim,
+or still has a message of that conversation in flight, no other worker may
+take messages from it, so each conversation is processed in order.
+
+Workers claim from their own shard's ready queue first. When it is empty, they
+steal the conversation that has waited longest on the shard with the most
+ready conversations. As a result, one busy chat keeps a single worker busy
+instead of backing up every conversation hashed onto the same shard. A worker
+gives a conversation back after `quantum` consecutive messages, so other
+conversations on its shard are not starved.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+
+from signal_client.observability.metrics import (
+    CONVERSATION_BACKLOG,
+    CONVERSATION_STEALS,
+)
+from signal_client.runtime.models import QueuedMessage
+
+
+@dataclass(slots=True, eq=False)
+class _Mailbox:
+    key: str
+    home: int
+    messages: deque[QueuedMessage] = field(default_factory=deque)
+    owner: ConversationLane | None = None
+    inflight: int = 0
+    ready: bool = False
+
+
+class ConversationScheduler:
+    """Hands out queued messages to shard workers one conversation at a time."""
+
+    def __init__(
+        self, shard_count: int, *, maxsize: int = 0, quantum: int = 16
+    ) -> None:
+        """Create a scheduler.
+
+        Args:
+            shard_count: Number of home shards (and ready queues).
+            maxsize: Maximum number of waiting messages; `put` blocks while the
+                scheduler is full. 0 means unbounded.
+            quantum: Messages a worker takes from one conversation before it
+                hands the conversation back.
+
+        """
+        self._shard_count = max(1, shard_count)
+        self._maxsize = max(0, maxsize)
+        self._quantum = max(1, quantum)
+        self._mailboxes: dict[str, _Mailbox] = {}
+        self._ready: list[deque[_Mailbox]] = [deque() for _ in range(self._shard_count)]
+        self._pending = [0] * self._shard_count
+        self._size = 0
+        self._unfinished = 0
+        self._finished = asyncio.Event()
+        self._finished.set()
+        self._putters: deque[asyncio.Future[None]] = deque()
+        self._waiters: deque[tuple[int, asyncio.Future[None]]] = deque()
+
+    @property
+    def maxsize(self) -> int:
+        """Return the capacity; 0 means unbounded."""
+        return self._maxsize
+
+    def qsize(self, shard: int | None = None) -> int:
+        """Return the number of waiting messages, overall or for a home shard."""
+        return self._size if shard is None else self._pending[shard]
+
+    def full(self) -> bool:
+        """Return True when `put` would block."""
+        return 0 < self._maxsize <= self._size
+
+    def lane(self, shard: int) -> ConversationLane:
+        """Return a consumer bound to a home shard, for one worker."""
+        return ConversationLane(self, shard % self._shard_count)
+
+    async def put(self, queued_message: QueuedMessage, shard: int) -> None:
+        """Add a message to its conversation's mailbox, waiting for capacity."""
+        while self.full():
+            putter = asyncio.get_running_loop().create_future()
+            self._putters.append(putter)
+            try:
+                await putter
+            except asyncio.CancelledError:
+                if putter in self._putters:
+                    self._putters.remove(putter)
+                elif not self.full():
+                    self._wake_putter()
+                raise
+        self.put_nowait(queued_message, shard)
+
+    def put_nowait(self, queued_message: QueuedMessage, shard: int) -> None:
+        """Add a message without waiting.
+
+        Raises:
+            asyncio.QueueFull: If the scheduler is at capacity.
+
+        """
+        if self.full():
+            raise asyncio.QueueFull
+        key = queued_message.recipient or ""
+        mailbox = self._mailboxes.get(key)
+        if mailbox is None:
+            mailbox = _Mailbox(key, shard % self._shard_count)
+            self._mailboxes[key] = mailbox
+        mailbox.messages.append(queued_message)
+        self._pending[mailbox.home] += 1
+        self._size += 1
+        self._unfinished += 1
+        self._finished.clear()
+        if mailbox.owner is None and mailbox.inflight == 0 and not mailbox.ready:
+            self._make_ready(mailbox)
+
+    def task_done(self, queued_message: QueuedMessage) -> None:
+        """Mark a message handed out by a lane as processed.
+
+        Raises:
+            ValueError: If called more times than messages were handed out.
+
+        """
+        mailbox = self._mailboxes.get(queued_message.recipient or "")
+        if mailbox is None or mailbox.inflight <= 0:
+            message = "task_done() called for a message that is not in flight"
+            raise ValueError(message)
+        mailbox.inflight -= 1
+        if mailbox.inflight == 0 and mailbox.owner is None:
+            self._settle(mailbox)
+        self._unfinished -= 1
+        if self._unfinished == 0:
+            self._finished.set()
+
+    async def join(self) -> None:
+        """Wait until every message put into the scheduler has been processed."""
+        await self._finished.wait()
+
+    async def next_message(self, lane: ConversationLane) -> QueuedMessage | None:
+        """Return the next message for a lane, waiting until one is ready.
+
+        Returns None once the lane is closed.
+        """
+        loop = asyncio.get_running_loop()
+        while not lane.closed:
+            queued_message = self.next_message_nowait(lane)
+            if queued_message is not None:
+                return queued_message
+            waiter: asyncio.Future[None] = loop.create_future()
+            entry = (lane.shard, waiter)
+            self._waiters.append(entry)
+            lane.waiter = waiter
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                # A wake-up delivered just before the cancellation must not be
+                # lost for the other idle lanes.
+                if not waiter.cancelled() and any(self._ready):
+                    self._wake_waiter(lane.shard)
+                raise
+            finally:
+                lane.waiter = None
+                if entry in self._waiters:
+                    self._waiters.remove(entry)
+        return None
+
+    def next_message_nowait(self, lane: ConversationLane) -> QueuedMessage | None:
+        """Return the next ready message for a lane, or None."""
+        if lane.closed:
+            return None
+        current = lane.current
+        if current is not None:
+            if current.messages and lane.taken < self._quantum:
+                return self._pop(lane, current)
+            self._release(lane)
+        mailbox = self._claim(lane.shard)
+        if mailbox is None:
+            return None
+        CONVERSATION_BACKLOG.observe(len(mailbox.messages))
+        mailbox.owner = lane
+        lane.current = mailbox
+        lane.taken = 0
+        return self._pop(lane, mailbox)
+
+    def close_lane(self, lane: ConversationLane) -> None:
+        """Stop a lane, handing back its conversation and waking it if idle."""
+        if lane.closed:
+            return
+        lane.closed = True
+        self._release(lane)
+        waiter = lane.waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    def _release(self, lane: ConversationLane) -> None:
+        current, lane.current = lane.current, None
+        if current is None:
+            return
+        current.owner = None
+        if current.inflight == 0:
+            self._settle(current)
+
+    def _claim(self, shard: int) -> _Mailbox | None:
+        ready = self._ready[shard]
+        if ready:
+            mailbox = ready.popleft()
+        else:
+            victim = max(self._ready, key=len)
+            if not victim:
+                return None
+            # Steal the conversation that has waited longest on the busiest
+            # shard; its messages stay in order because the mailbox moves whole.
+            mailbox = victim.popleft()
+            CONVERSATION_STEALS.inc()
+        mailbox.ready = False
+        return mailbox
+
+    def _pop(self, lane: ConversationLane, mailbox: _Mailbox) -> QueuedMessage:
+        queued_message = mailbox.messages.popleft()
+        mailbox.inflight += 1
+        lane.taken += 1
+        self._pending[mailbox.home] -= 1
+        self._size -= 1
+        self._wake_putter()
+        return queued_message
+
+    def _settle(self, mailbox: _Mailbox) -> None:
+        if mailbox.messages:
+            self._make_ready(mailbox)
+        elif self._mailboxes.get(mailbox.key) is mailbox:
+            del self._mailboxes[mailbox.key]
+
+    def _make_ready(self, mailbox: _Mailbox) -> None:
+        mailbox.ready = True
+        self._ready[mailbox.home].append(mailbox)
+        self._wake_waiter(mailbox.home)
+
+    def _wake_waiter(self, shard: int) -> None:
+        # Prefer an idle lane of the home shard so the claim is not a steal.
+        idle = [entry for entry in self._waiters if not entry[1].done()]
+        chosen = next((entry for entry in idle if entry[0] == shard), None)
+        if chosen is None:
+            if not idle:
+                return
+            chosen = idle[0]
+        self._waiters.remove(chosen)
+        chosen[1].set_result(None)
+
+    def _wake_putter(self) -> None:
+        while self._putters:
+            putter = self._putters.popleft()
+            if not putter.done():
+                putter.set_result(None)
+                return
+
+
+class ConversationLane:
+    """One worker's consumer of a `ConversationScheduler`."""
+
+    __slots__ = ("closed", "current", "scheduler", "shard", "taken", "waiter")
+
+    def __init__(self, scheduler: ConversationScheduler, shard: int) -> None:
+        """Bind a lane to a home shard."""
+        self.scheduler = scheduler
+        self.shard = shard
+        self.closed = False
+        self.current: _Mailbox | None = None
+        self.taken = 0
+        self.waiter: asyncio.Future[None] | None = None
+
+    async def get(self) -> QueuedMessage | None:
+        """Return the next message for this worker, or None once closed."""
+        return await self.scheduler.next_message(self)
+
+    def get_nowait(self) -> QueuedMessage | None:
+        """Return the next message if one is ready, without waiting."""
+        return self.scheduler.next_message_nowait(self)
+
+    def task_done(self, queued_message: QueuedMessage) -> None:
+        """Mark a message returned by this lane as processed."""
+        self.scheduler.task_done(queued_message)
+
+    def qsize(self) -> int:
+        """Return the number of messages waiting for this lane's home shard."""
+        return self.scheduler.qsize(self.shard)
+
+    def close(self) -> None:
+        """Wake the worker if it is idle and make `get` return None."""
+        self.scheduler.close_lane(self)
+
+
+__all__ = ["ConversationLane", "ConversationScheduler"]
@@ -141,8 +141,8 @@ class DeadLetterQueue:
             else:
                 messages_to_keep.append(entry.to_record())
 
+        await self._storage.append_many(self._queue_name, messages_to_keep)
         for msg in messages_to_keep:
-            await self._storage.append(self._queue_name, msg)
             safe_log(
                 log,
                 "debug",
@@ -176,8 +176,7 @@ class DeadLetterQueue:
 
     async def _update_backlog_metric(self, count: int | None = None) -> None:
         if count is None:
-            entries = await self._storage.read_all(self._queue_name)
-            count = len(entries)
+            count = await self._storage.length(self._queue_name)
         DLQ_BACKLOG.labels(queue=self._queue_name).set(count)
 
     def _compute_next_retry_at(self, retry_count: int) -> float:
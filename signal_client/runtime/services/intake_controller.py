@@ -8,6 +8,7 @@ from typing import Any
 
 import structlog
 
+from signal_client.observability.logging import safe_log
 from signal_client.observability.metrics import INGEST_PAUSES
 
 log = structlog.get_logger()
@@ -25,7 +26,12 @@ class IntakeController:
         """
         self._default_pause_seconds = max(0.0, default_pause_seconds)
         self._pause_until = 0.0
-        self._lock = asyncio.Lock()
+        # Read on every inbound frame; the event and timer are only used
+        # while intake is paused.
+        self._paused = False
+        self._resumed = asyncio.Event()
+        self._resumed.set()
+        self._resume_timer: asyncio.TimerHandle | None = None
 
     async def pause(self, *, reason: str, duration: float | None = None) -> None:
         """Pause message intake for a specified duration or default.
@@ -39,10 +45,16 @@ class IntakeController:
             max(0.0, duration) if duration is not None else self._default_pause_seconds
         )
         pause_until = time.monotonic() + pause_seconds
-        async with self._lock:
-            self._pause_until = max(self._pause_until, pause_until)
+        if pause_until > self._pause_until:
+            self._pause_until = pause_until
+            if pause_seconds > 0:
+                self._paused = True
+                self._resumed.clear()
+                self._schedule_resume()
         INGEST_PAUSES.labels(reason=reason).inc()
-        log.warning(
+        safe_log(
+            log,
+            "warning",
             "ingest.paused",
             reason=reason,
             pause_seconds=pause_seconds,
@@ -51,22 +63,42 @@ class IntakeController:
 
     async def wait_if_paused(self) -> None:
         """Wait asynchronously if message intake is currently paused."""
-        while True:
-            async with self._lock:
-                pause_remaining = self._pause_until - time.monotonic()
-            if pause_remaining <= 0:
-                return
-            await asyncio.sleep(min(pause_remaining, 1.0))
+        while self._paused:
+            await self._resumed.wait()
 
     async def resume_now(self) -> None:
         """Immediately resume message intake, ending any current pause."""
-        async with self._lock:
-            self._pause_until = 0.0
-        log.info("ingest.resumed")
+        self._pause_until = 0.0
+        self._resume()
+        safe_log(log, "info", "ingest.resumed")
+
+    def _schedule_resume(self) -> None:
+        if self._resume_timer is not None:
+            self._resume_timer.cancel()
+        delay = max(0.0, self._pause_until - time.monotonic())
+        self._resume_timer = asyncio.get_running_loop().call_later(
+            delay, self._on_resume_timer
+        )
+
+    def _on_resume_timer(self) -> None:
+        self._resume_timer = None
+        if self._pause_until > time.monotonic():
+            # The loop clock fired a little early.
+            self._schedule_resume()
+            return
+        self._resume()
+
+    def _resume(self) -> None:
+        if self._resume_timer is not None:
+            self._resume_timer.cancel()
+            self._resume_timer = None
+        self._paused = False
+        self._resumed.set()
 
     def snapshot(self) -> dict[str, Any]:
         """Return a snapshot of the current intake controller state."""
         return {
+            "paused": self._paused,
             "paused_until": self._pause_until,
             "default_pause_seconds": self._default_pause_seconds,
         }
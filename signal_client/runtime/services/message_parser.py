@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import json
 import uuid
-from typing import Any
+from dataclasses import dataclass
+from typing import Any, cast
 
 import structlog
 from pydantic import ValidationError
@@ -19,28 +20,128 @@ from signal_client.adapters.api.schemas.events import (
     TypingEvent,
     VerificationEvent,
 )
+from signal_client.adapters.api.schemas.fast_message import FastMessage
 from signal_client.adapters.api.schemas.message import Message, MessageType
+from signal_client.core import serialization
 from signal_client.observability.logging import safe_log
 
 log = structlog.get_logger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class MessagePreview:
+    """Fields of a chat message read straight from the raw payload."""
+
+    text: str
+    source: str
+    timestamp: int
+
+
+class DecodedEnvelope:
+    """A websocket frame decoded once and carried through the pipeline.
+
+    The JSON payload is loaded when the envelope is created; the typed event
+    is validated on first access and cached, so the distributor and the worker
+    share a single decode and a single validation.
+    """
+
+    __slots__ = (
+        "_event",
+        "_event_resolved",
+        "_fast_message",
+        "_fast_resolved",
+        "_parser",
+        "payload",
+        "raw",
+    )
+
+    def __init__(
+        self, parser: MessageParser, raw: str, payload: dict[str, Any] | None
+    ) -> None:
+        """Wrap a decoded payload; `payload` is None when the JSON was invalid."""
+        self._parser = parser
+        self.raw = raw
+        self.payload = payload
+        self._event: BaseEvent | None = None
+        self._event_resolved = False
+        self._fast_message: FastMessage | None = None
+        self._fast_resolved = False
+
+    @property
+    def envelope(self) -> dict[str, Any] | None:
+        """Return the `envelope` object when it carries a source."""
+        envelope = self.payload.get("envelope") if self.payload else None
+        if isinstance(envelope, dict) and MessageParser.is_valid_envelope(envelope):
+            return envelope
+        return None
+
+    def event(self) -> BaseEvent | None:
+        """Return the typed event, validating it on first use."""
+        if not self._event_resolved:
+            envelope = self.envelope
+            self._event = (
+                self._parser.event_from_envelope(envelope)
+                if envelope is not None
+                else None
+            )
+            self._event_resolved = True
+        return self._event
+
+    def message(self) -> Message | None:
+        """Return the chat message carried by the event, if any.
+
+        With fast models enabled this is a `FastMessage` built straight from
+        the envelope, which offers the same attributes and helpers as `Message`.
+        """
+        if self._parser.fast_models:
+            if not self._fast_resolved:
+                envelope = self.envelope
+                self._fast_message = (
+                    FastMessage.from_envelope(envelope) if envelope else None
+                )
+                self._fast_resolved = True
+            return cast("Message | None", self._fast_message)
+        event = self.event()
+        return event.message if isinstance(event, MessageEvent) else None
+
+    def preview(self) -> MessagePreview | None:
+        """Return the unvalidated chat preview (see `MessageParser.preview`)."""
+        envelope = self.envelope
+        return MessageParser.preview_envelope(envelope) if envelope else None
+
+    def routing_key(self) -> str | None:
+        """Return the conversation key used to pick a shard, without validation."""
+        envelope = self.envelope
+        return MessageParser.routing_key(envelope) if envelope else None
+
+
 class MessageParser:
     """Parses raw websocket messages into structured event or message objects."""
 
+    def __init__(self, *, fast_models: bool = False) -> None:
+        """Initialize the parser.
+
+        Args:
+            fast_models: Build chat messages as `FastMessage` slots objects
+                instead of validating pydantic `Message` models.
+
+        """
+        self.fast_models = fast_models
+
+    def decode(self, raw_message_str: str) -> DecodedEnvelope:
+        """Decode raw JSON once; events are validated lazily by the result."""
+        return DecodedEnvelope(
+            self, raw_message_str, self._load_message(raw_message_str)
+        )
+
     def parse_event(self, raw_message_str: str) -> BaseEvent | None:
         """Parse raw JSON into a typed event when possible."""
-        raw_message = self._load_message(raw_message_str)
-        if raw_message is None:
-            return None
+        return self.decode(raw_message_str).event()
 
-        envelope = raw_message.get("envelope", {})
-        if not self._is_valid_envelope(envelope):
-            return None
-
-        metadata = self._metadata(envelope)
+    def event_from_envelope(self, envelope: dict[str, Any]) -> BaseEvent | None:
+        """Validate a decoded envelope into a typed event when possible."""
         try:
-            event = self._extract_event(envelope, metadata)
+            return self._extract_event(envelope, self._metadata(envelope))
         except ValidationError as exc:
             safe_log(
                 log,
@@ -49,23 +150,85 @@ class MessageParser:
                 errors=exc.errors(include_input=False),
             )
             return None
-        return event
 
     def parse(self, raw_message_str: str) -> Message | None:
         """Parse raw JSON into a Message instance when possible."""
-        event = self.parse_event(raw_message_str)
-        if isinstance(event, MessageEvent):
-            return event.message
-        return None
+        return self.decode(raw_message_str).message()
 
-    def recipient_from_raw(self, raw_message_str: str) -> str | None:  # noqa: PLR0911
-        """Best-effort extraction of a conversation recipient for sharding."""
-        raw_message = self._load_message(raw_message_str)
-        if raw_message is None:
+    def preview(self, raw_message_str: str) -> MessagePreview | None:
+        """Read a chat message's text, source and timestamp without validation.
+
+        The text is taken from `dataMessage`, `syncMessage.sentMessage` or the
+        replacement body of an `editMessage`, matching what `parse` would put in
+        `Message.message`. Returns None for anything else, or whenever only the
+        full parse can tell how the payload should be handled.
+        """
+        return self.decode(raw_message_str).preview()
+
+    @classmethod
+    def preview_envelope(cls, envelope: dict[str, Any]) -> MessagePreview | None:
+        """Build a `MessagePreview` from a decoded envelope (see `preview`)."""
+        source = envelope.get("source")
+        timestamp = envelope.get("timestamp")
+        if not isinstance(source, str) or type(timestamp) is not int:
+            return None
+        payload = cls._chat_payload(envelope)
+        text = payload.get("message") if payload is not None else None
+        if payload is None or (text is not None and not isinstance(text, str)):
+            return None
+        return MessagePreview(text=text or "", source=source, timestamp=timestamp)
+
+    @classmethod
+    def routing_key(cls, envelope: dict[str, Any]) -> str | None:
+        """Return a conversation key from a decoded envelope without validation.
+
+        Mirrors `recipient_from_raw`: the group of a chat message, its
+        destination when it differs from the sender, the group of a typing or
+        receipt event, and the sender otherwise.
+        """
+        source = cls._extract_source(envelope)
+        if "syncMessage" in envelope or "dataMessage" in envelope:
+            payload = cls._chat_payload(envelope) or {}
+            group_id = cls._group_id(payload.get("groupInfo") or payload.get("group"))
+            if group_id:
+                return group_id
+            destination = payload.get("destination")
+            if isinstance(destination, str) and destination and destination != source:
+                return destination
+            return source
+        if "receiptMessage" in envelope:
+            return cls._extract_group_from_envelope(envelope) or source
+        typing = envelope.get("typingMessage")
+        if isinstance(typing, dict):
+            group_id = typing.get("groupId")
+            if isinstance(group_id, str) and group_id:
+                return group_id
+        return source
+
+    @staticmethod
+    def _chat_payload(envelope: dict[str, Any]) -> dict[str, Any] | None:
+        payload: object = None
+        if "syncMessage" in envelope:
+            sync_message = envelope["syncMessage"]
+            if isinstance(sync_message, dict):
+                payload = sync_message.get("sentMessage")
+        elif "dataMessage" in envelope:
+            payload = envelope["dataMessage"]
+        if not isinstance(payload, dict) or not payload:
             return None
+        if "editMessage" not in payload:
+            return payload
+        edit_info = payload["editMessage"]
+        replacement = (
+            edit_info.get("dataMessage") if isinstance(edit_info, dict) else None
+        )
+        return replacement if isinstance(replacement, dict) else None
 
-        envelope = raw_message.get("envelope", {})
-        if not self._is_valid_envelope(envelope):
+    def recipient_from_raw(self, raw_message_str: str) -> str | None:  # noqa: PLR0911
+        """Best-effort extraction of a conversation recipient for sharding."""
+        decoded = self.decode(raw_message_str)
+        envelope = decoded.envelope
+        if envelope is None:
             return None
 
         try:
@@ -86,7 +249,7 @@ class MessageParser:
 
     def _load_message(self, raw_message_str: str) -> dict[str, Any] | None:
         try:
-            return json.loads(raw_message_str)
+            raw_message = serialization.loads(raw_message_str)
         except json.JSONDecodeError as exc:
             safe_log(
                 log,
@@ -95,9 +258,11 @@ class MessageParser:
                 error=str(exc),
             )
             return None
+        return raw_message if isinstance(raw_message, dict) else None
 
     @staticmethod
-    def _is_valid_envelope(envelope: dict[str, Any]) -> bool:
+    def is_valid_envelope(envelope: dict[str, Any]) -> bool:
+        """Return True when an envelope is non-empty and names its sender."""
         return bool(envelope) and "source" in envelope
 
     def _metadata(self, envelope: dict[str, Any]) -> EnvelopeMetadata:
@@ -287,7 +452,12 @@ class MessageParser:
 
     @staticmethod
     def _extract_group_from_envelope(envelope: dict[str, Any]) -> str | None:
-        group_info = envelope.get("groupInfo") or envelope.get("group")
+        return MessageParser._group_id(
+            envelope.get("groupInfo") or envelope.get("group")
+        )
+
+    @staticmethod
+    def _group_id(group_info: object) -> str | None:
         if isinstance(group_info, dict):
             group_id = group_info.get("groupId")
             if isinstance(group_id, str) and group_id:
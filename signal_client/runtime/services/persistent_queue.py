@@ -4,12 +4,20 @@ from __future__ import annotations
 
 import asyncio
 import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import suppress
 from dataclasses import dataclass
 from typing import Any
 
 import structlog
 
 from signal_client.adapters.storage.base import Storage
+from signal_client.observability.logging import safe_log
+from signal_client.runtime.services.write_behind import (
+    WriteBehindBuffer,
+    WriteBehindConfig,
+)
 
 log = structlog.get_logger()
 
@@ -20,13 +28,17 @@ class PersistentQueuedMessage:
 
     raw: str
     enqueued_at: float
+    seq: int | None = None
 
     def to_record(self) -> dict[str, Any]:
         """Convert the message to a dictionary record for storage."""
-        return {
+        record: dict[str, Any] = {
             "raw": self.raw,
             "enqueued_at": self.enqueued_at,
         }
+        if self.seq is not None:
+            record["seq"] = self.seq
+        return record
 
     @classmethod
     def from_record(cls, record: dict[str, Any]) -> PersistentQueuedMessage | None:
@@ -42,11 +54,24 @@ class PersistentQueuedMessage:
                 enqueued_at_f = time.time()
         else:
             enqueued_at_f = time.time()
-        return cls(raw=raw, enqueued_at=enqueued_at_f)
+        seq = record.get("seq")
+        return cls(
+            raw=raw,
+            enqueued_at=enqueued_at_f,
+            seq=seq if isinstance(seq, int) else None,
+        )
 
 
 class PersistentQueue:
-    """Optional durable backing store for ingest to survive restarts."""
+    """Optional durable backing store for ingest to survive restarts.
+
+    Every appended message gets a monotonic sequence number. Storage always holds
+    a contiguous run of sequence numbers, oldest first. Workers `ack` messages once
+    they are done with them; the lowest unacknowledged sequence number is the
+    low-watermark, and a background task started by `start` drops every stored
+    record below it. After a crash `replay` therefore only returns the unacked
+    tail.
+    """
 
     def __init__(
         self,
@@ -54,6 +79,8 @@ class PersistentQueue:
         key: str,
         *,
         max_length: int = 10000,
+        write_behind: WriteBehindConfig | None = None,
+        compaction_interval: float = 1.0,
     ) -> None:
         """Initialize the PersistentQueue.
 
@@ -61,84 +88,354 @@ class PersistentQueue:
             storage: The storage backend to use for persistence.
             key: The key under which to store queue records.
             max_length: The maximum number of records to keep in the queue.
+            write_behind: Optional flush bounds for batching appends.
+            compaction_interval: Seconds between background removals of
+                acknowledged records.
 
         """
         self._storage = storage
         self._key = key
         self._max_length = max(1, max_length)
+        self._compaction_interval = compaction_interval
         self._lock = asyncio.Lock()
+        # Stored records cover [_head_seq, _head_seq + _length); sequence numbers
+        # at or above that range belong to buffered appends. Loaded on first use.
+        self._head_seq = 0
+        self._length: int | None = None
+        self._next_seq = 0
+        # Sequence numbers handed out but not acknowledged yet, in order, plus the
+        # acknowledgements that arrived out of order.
+        self._outstanding: deque[int] = deque()
+        self._acked: set[int] = set()
+        self._compaction_task: asyncio.Task[None] | None = None
+        self._write_buffer = (
+            WriteBehindBuffer(
+                self._flush_records, write_behind, name=f"persistent_queue:{key}"
+            )
+            if write_behind is not None
+            else None
+        )
+
+    @property
+    def low_watermark(self) -> int:
+        """Return the lowest sequence number that is not acknowledged yet."""
+        return self._outstanding[0] if self._outstanding else self._next_seq
+
+    def start(self) -> None:
+        """Start removing acknowledged records in the background."""
+        if self._compaction_task is not None:
+            return
+        self._compaction_task = asyncio.create_task(self._run_compaction())
 
     async def replay(self) -> list[PersistentQueuedMessage]:
-        """Load persisted messages in FIFO order."""
+        """Load persisted messages in FIFO order.
+
+        Every returned message is tracked as outstanding until it is acknowledged.
+        """
+        await self.flush()
         async with self._lock:
             records = await self._storage.read_all(self._key)
+            self._load_state_locked(len(records), records[-1] if records else None)
+            self._outstanding.clear()
+            self._acked.clear()
             messages: list[PersistentQueuedMessage] = []
-            for record in records:
+            for offset, record in enumerate(records):
                 if not isinstance(record, dict):
                     continue
                 parsed = PersistentQueuedMessage.from_record(record)
                 if parsed:
+                    parsed.seq = self._head_seq + offset
+                    self._outstanding.append(parsed.seq)
                     messages.append(parsed)
             if messages:
-                log.info(
+                safe_log(
+                    log,
+                    "info",
                     "persistent_queue.recovered",
                     key=self._key,
                     count=len(messages),
                 )
             return messages
 
-    async def append(self, raw: str, enqueued_at: float | None = None) -> None:
-        """Persist a raw websocket message for later replay."""
-        message = PersistentQueuedMessage(
-            raw=raw, enqueued_at=enqueued_at or time.time()
+    async def begin_replay(self) -> range:
+        """Snapshot the stored backlog for `replay_stream`.
+
+        Call this before ingest starts so appends made while the backlog is
+        streamed stay out of the snapshot. Every sequence number in the returned
+        range is tracked as outstanding until it is acknowledged; messages
+        appended afterwards keep their own tracking.
+        """
+        await self.flush()
+        async with self._lock:
+            await self._ensure_state_locked()
+            backlog = range(self._head_seq, self._head_seq + (self._length or 0))
+            live = [seq for seq in self._outstanding if seq >= backlog.stop]
+            self._outstanding = deque(backlog)
+            self._outstanding.extend(live)
+            self._acked = {seq for seq in self._acked if seq >= backlog.stop}
+        return backlog
+
+    async def replay_stream(
+        self, page_size: int = 500, backlog: range | None = None
+    ) -> AsyncIterator[PersistentQueuedMessage]:
+        """Yield persisted messages in FIFO order, reading storage page by page.
+
+        Only messages in `backlog` (from `begin_replay`, taken on the first
+        iteration when omitted) are yielded; later appends are already on their
+        way through the live pipeline. The store lock is only held while a page
+        is read, so ingest and compaction continue while the consumer waits on a
+        full queue. Backlog entries that can no longer be yielded, because they
+        were truncated away or storage failed, are released so they do not hold
+        back the watermark.
+        """
+        page_size = max(1, page_size)
+        if backlog is None:
+            backlog = await self.begin_replay()
+        cursor, end = backlog.start, backlog.stop
+        recovered = 0
+        while cursor < end:
+            try:
+                async with self._lock:
+                    # Truncation or compaction may have dropped records from the head.
+                    head = min(max(cursor, self._head_seq), end)
+                    records = (
+                        await self._storage.read_range(
+                            self._key,
+                            head - self._head_seq,
+                            min(page_size, end - head),
+                        )
+                        if head < end
+                        else []
+                    )
+            except Exception:
+                self.release(range(cursor, end))
+                raise
+            self.release(range(cursor, head))
+            cursor = head
+            if not records:
+                self.release(range(cursor, end))
+                break
+            for seq, record in enumerate(records, start=cursor):
+                parsed = (
+                    PersistentQueuedMessage.from_record(record)
+                    if isinstance(record, dict)
+                    else None
+                )
+                if parsed is None:
+                    self.ack(seq)
+                    continue
+                parsed.seq = seq
+                recovered += 1
+                yield parsed
+            cursor += len(records)
+        if recovered:
+            safe_log(
+                log,
+                "info",
+                "persistent_queue.recovered",
+                key=self._key,
+                count=recovered,
+                streamed=True,
+            )
+
+    async def append(self, raw: str, enqueued_at: float | None = None) -> int:
+        """Persist a raw websocket message for later replay.
+
+        Returns:
+            The sequence number to pass to `ack` once the message is handled.
+
+        """
+        async with self._lock:
+            await self._ensure_state_locked()
+            seq = self._next_seq
+            self._next_seq += 1
+            self._outstanding.append(seq)
+            message = PersistentQueuedMessage(
+                raw=raw, enqueued_at=enqueued_at or time.time(), seq=seq
+            )
+            if self._write_buffer is None:
+                await self._storage.append(self._key, message.to_record())
+                await self._record_appended_locked(1)
+                return seq
+        await self._write_buffer.add(message.to_record())
+        return seq
+
+    def ack(self, seq: int) -> None:
+        """Mark a message as handled so it is no longer replayed.
+
+        Acknowledgements may arrive in any order; the low-watermark only advances
+        past contiguous acknowledged sequence numbers.
+        """
+        outstanding = self._outstanding
+        if not outstanding or seq < outstanding[0]:
+            return
+        if seq != outstanding[0]:
+            self._acked.add(seq)
+            return
+        outstanding.popleft()
+        acked = self._acked
+        while outstanding and outstanding[0] in acked:
+            acked.discard(outstanding.popleft())
+
+    def release(self, seqs: range) -> None:
+        """Acknowledge replayed messages that will never be handled.
+
+        Used when a replay stops early so the skipped sequence numbers do not pin
+        the low-watermark; their records are dropped by the next compaction.
+        """
+        if not seqs:
+            return
+        for seq in seqs:
+            self.ack(seq)
+        safe_log(
+            log,
+            "warning",
+            "persistent_queue.replay_released",
+            key=self._key,
+            first=seqs.start,
+            count=len(seqs),
         )
+
+    async def compact_acked(self) -> int:
+        """Remove stored records below the low-watermark.
+
+        Returns:
+            The number of records removed.
+
+        """
         async with self._lock:
-            await self._storage.append(self._key, message.to_record())
-            await self._truncate_locked()
+            if self._length is None:
+                return 0
+            removable = min(self.low_watermark - self._head_seq, self._length)
+            if removable <= 0:
+                return 0
+            await self._storage.trim_to_last(self._key, self._length - removable)
+            self._head_seq += removable
+            self._length -= removable
+            safe_log(
+                log,
+                "debug",
+                "persistent_queue.acked_compacted",
+                key=self._key,
+                removed=removable,
+                retained=self._length,
+            )
+            return removable
 
     async def compact(self, min_timestamp: int | None = None) -> None:
         """Drop persisted entries older than the provided message timestamp.
 
         This keeps the queue bounded once checkpoints advance, while still retaining
-        enough history to replay in-flight items after a crash.
+        enough history to replay in-flight items after a crash. Entries are removed
+        from the head only, so the stored sequence numbers stay contiguous.
         """
+        await self.flush()
         async with self._lock:
             records = await self._storage.read_all(self._key)
+            self._load_state_locked(len(records), records[-1] if records else None)
             if not records:
                 return
-            retained: list[dict[str, Any]] = []
+            drop = 0
             for record in records:
                 parsed = (
                     PersistentQueuedMessage.from_record(record)
                     if isinstance(record, dict)
                     else None
                 )
-                if parsed is None:
-                    continue
-                if min_timestamp is None or parsed.enqueued_at >= min_timestamp:
-                    retained.append(parsed.to_record())
-            await self._storage.delete_all(self._key)
-            for record in retained:
-                await self._storage.append(self._key, record)
-            log.debug(
+                if parsed is not None and (
+                    min_timestamp is None or parsed.enqueued_at >= min_timestamp
+                ):
+                    break
+                drop += 1
+            if drop:
+                await self._storage.trim_to_last(self._key, len(records) - drop)
+                self._head_seq += drop
+                self._length = len(records) - drop
+            safe_log(
+                log,
+                "debug",
                 "persistent_queue.compacted",
                 key=self._key,
-                retained=len(retained),
+                retained=self._length,
             )
 
     async def clear(self) -> None:
         """Remove all messages from the persistent queue."""
+        if self._write_buffer is not None:
+            self._write_buffer.discard()
         async with self._lock:
             await self._storage.delete_all(self._key)
+            self._head_seq = self._next_seq
+            self._length = 0
+            self._outstanding.clear()
+            self._acked.clear()
+
+    async def length(self) -> int:
+        """Return the number of persisted messages, excluding buffered ones."""
+        async with self._lock:
+            await self._ensure_state_locked()
+            return self._length or 0
+
+    async def flush(self) -> None:
+        """Write any buffered messages to storage."""
+        if self._write_buffer is not None:
+            await self._write_buffer.flush()
+
+    async def close(self) -> None:
+        """Stop background compaction and flush buffered messages."""
+        task = self._compaction_task
+        self._compaction_task = None
+        if task is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+        if self._write_buffer is not None:
+            await self._write_buffer.close()
+        await self.compact_acked()
+
+    async def _flush_records(self, records: list[dict[str, Any]]) -> None:
+        async with self._lock:
+            await self._storage.append_many(self._key, records)
+            await self._record_appended_locked(len(records))
 
-    async def _truncate_locked(self) -> None:
-        records = await self._storage.read_all(self._key)
-        if len(records) <= self._max_length:
+    async def _run_compaction(self) -> None:
+        while True:
+            await asyncio.sleep(self._compaction_interval)
+            try:
+                await self.compact_acked()
+            except Exception:  # noqa: BLE001 - keep compacting on transient errors
+                safe_log(
+                    log, "warning", "persistent_queue.compaction_failed", key=self._key
+                )
+
+    async def _ensure_state_locked(self) -> None:
+        if self._length is not None:
+            return
+        length = await self._storage.length(self._key)
+        last = (
+            await self._storage.read_range(self._key, length - 1, 1) if length else []
+        )
+        self._load_state_locked(length, last[0] if last else None)
+
+    def _load_state_locked(self, length: int, last: dict[str, Any] | None) -> None:
+        last_seq = last.get("seq") if isinstance(last, dict) else None
+        # Records written before sequence numbers existed are numbered from the
+        # current head instead.
+        if isinstance(last_seq, int):
+            self._head_seq = last_seq + 1 - length
+        self._length = length
+        self._next_seq = max(self._next_seq, self._head_seq + length)
+
+    async def _record_appended_locked(self, count: int) -> None:
+        if self._length is None:
+            await self._ensure_state_locked()
+            return
+        self._length += count
+        if self._length <= self._max_length:
             return
-        trimmed = records[-self._max_length :]
-        await self._storage.delete_all(self._key)
-        for record in trimmed:
-            await self._storage.append(self._key, record)
+        await self._storage.trim_to_last(self._key, self._max_length)
+        self._head_seq += self._length - self._max_length
+        self._length = self._max_length
 
 
 __all__ = ["PersistentQueue", "PersistentQueuedMessage"]
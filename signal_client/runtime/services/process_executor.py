@@ -0,0 +1,201 @@
+"""Run CPU-bound command handlers in a process pool.
+
+Commands declared with ``executor="process"`` do not run on the event loop.
+The worker sends the handler's module and qualified name, plus a picklable
+`MessageSnapshot` of the message, to a `ProcessPoolExecutor`. The child
+process imports the handler and calls it with a `ProcessContext`. Reply
+actions called on that context (`reply_text`, `send`, `react`, ...) are
+recorded. They are replayed on the real `Context` in the main process once
+the handler returns, so API clients, sessions and locks never cross the
+process boundary.
+
+The handler may be a coroutine function (run with `asyncio.run` in the child)
+or a plain function. When a handler exceeds its timeout, the command fails
+and no actions are replayed. The child process cannot be interrupted, so it
+keeps its pool slot until the handler returns.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import inspect
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from signal_client.core.command import Command, CommandError
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from signal_client.adapters.api.schemas.message import Message
+    from signal_client.core.context import Context
+
+# Context methods a process handler may call; they are replayed in order.
+PROXIED_ACTIONS = frozenset(
+    {
+        "hide_typing",
+        "react",
+        "remote_delete",
+        "remove_reaction",
+        "reply",
+        "reply_text",
+        "send",
+        "send_markdown",
+        "send_receipt",
+        "send_text",
+        "show_typing",
+    }
+)
+
+Action = tuple[str, tuple[Any, ...], dict[str, Any]]
+
+
+@dataclass(frozen=True, slots=True)
+class MessageSnapshot:
+    """Picklable copy of the message fields a process handler can read."""
+
+    source: str
+    timestamp: int
+    message: str | None = None
+    destination: str | None = None
+    group: dict[str, Any] | None = None
+    recipient_id: str = ""
+    mentions: list[str] | None = None
+    attachment_ids: tuple[str, ...] = ()
+
+    @classmethod
+    def from_message(cls, message: Message) -> MessageSnapshot:
+        """Copy a `Message` or `FastMessage`."""
+        attachments = message.attachments or []
+        return cls(
+            source=message.source,
+            timestamp=message.timestamp,
+            message=message.message,
+            destination=message.destination,
+            group=dict(message.group) if message.group else None,
+            recipient_id=message.recipient(),
+            mentions=list(message.mentions) if message.mentions else None,
+            attachment_ids=tuple(attachment.id for attachment in attachments),
+        )
+
+    def recipient(self) -> str:
+        """Return the group id, the destination, or the sender."""
+        return self.recipient_id
+
+    def is_group(self) -> bool:
+        """Return True for group messages."""
+        return self.group is not None
+
+
+@dataclass(slots=True)
+class ProcessContext:
+    """Context handed to process handlers; records reply actions for replay."""
+
+    message: MessageSnapshot
+    actions: list[Action] = field(default_factory=list)
+
+    def __getattr__(self, name: str) -> Callable[..., Awaitable[None]]:
+        """Return a recorder for a proxied `Context` action."""
+        if name not in PROXIED_ACTIONS:
+            message = (
+                f"'{name}' is not available to process command handlers; "
+                f"supported actions are {', '.join(sorted(PROXIED_ACTIONS))}."
+            )
+            raise AttributeError(message)
+
+        async def record(*args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+            self.actions.append((name, args, kwargs))
+
+        return record
+
+
+def resolve_handler(module: str, qualname: str) -> Callable[..., Any]:
+    """Import a handler by module and qualified name.
+
+    A `Command` found at that name (the usual result of the `command`
+    decorator) resolves to its handler.
+    """
+    target: Any = importlib.import_module(module)
+    for part in qualname.split("."):
+        target = getattr(target, part)
+    if isinstance(target, Command):
+        target = target.handle
+    if not callable(target):
+        message = f"Process command handler '{module}.{qualname}' is not callable."
+        raise TypeError(message)
+    return target
+
+
+def run_handler(module: str, qualname: str, snapshot: MessageSnapshot) -> list[Action]:
+    """Run a handler in the current process and return its recorded actions."""
+    context = ProcessContext(snapshot)
+    result = resolve_handler(module, qualname)(context)
+    if inspect.iscoroutine(result):
+        asyncio.run(result)
+    return context.actions
+
+
+class ProcessCommandExecutor:
+    """Runs process commands in a lazily started `ProcessPoolExecutor`."""
+
+    def __init__(self, *, max_workers: int = 0, timeout: float = 30.0) -> None:
+        """Initialize the executor.
+
+        Args:
+            max_workers: Number of worker processes; 0 uses the CPU count.
+            timeout: Default seconds a handler may run; 0 disables the limit.
+
+        """
+        self._max_workers = max_workers if max_workers > 0 else os.cpu_count() or 1
+        self._timeout = max(0.0, timeout)
+        self._pool: ProcessPoolExecutor | None = None
+
+    @property
+    def max_workers(self) -> int:
+        """Return the number of worker processes."""
+        return self._max_workers
+
+    async def run(self, command: Command, context: Context) -> None:
+        """Run a command's handler in the pool and replay its actions.
+
+        Raises:
+            CommandError: If the command has no handler or the handler times out.
+
+        """
+        handler = command.handle
+        if handler is None:
+            message = "Command handler is not configured."
+            raise CommandError(message)
+        snapshot = MessageSnapshot.from_message(context.message)
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self._max_workers)
+        future = asyncio.get_running_loop().run_in_executor(
+            self._pool, run_handler, handler.__module__, handler.__qualname__, snapshot
+        )
+        timeout = command.timeout if command.timeout is not None else self._timeout
+        try:
+            actions = await asyncio.wait_for(future, timeout=timeout or None)
+        except asyncio.TimeoutError as exc:
+            message = f"Process command '{command.name}' timed out after {timeout}s."
+            raise CommandError(message) from exc
+        for name, args, kwargs in actions:
+            await getattr(context, name)(*args, **kwargs)
+
+    def shutdown(self) -> None:
+        """Stop the worker processes without waiting for running handlers."""
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+__all__ = [
+    "PROXIED_ACTIONS",
+    "MessageSnapshot",
+    "ProcessCommandExecutor",
+    "ProcessContext",
+    "resolve_handler",
+    "run_handler",
+]
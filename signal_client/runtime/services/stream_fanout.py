@@ -0,0 +1,413 @@
+"""Fan ingest out to worker processes over partitioned Redis streams.
+
+One "ingest" process owns the websocket. `RedisStreamPublisher` drains its
+local queue and appends each raw envelope to one of `partitions` streams.
+The stream is picked by the crc32 of the conversation key, the same hash the
+worker pool shards on, so one conversation always lands in one stream. A
+batch that keeps failing to publish is retried with backoff, then handed to
+the dead-letter queue.
+
+Any number of "worker" processes run `RedisStreamConsumer`. The partitions
+are split between them by `worker_index` (partition % worker_count ==
+worker_index), so each stream has one reader and a conversation is handled
+in order by one process. Entries are read through a consumer group. An entry
+is acknowledged with XACK only once the local worker pool has processed it.
+
+A restarted worker first re-reads its own pending entries. Entries left
+pending by another consumer name for longer than `claim_idle_ms` are taken
+over with XCLAIM. Reclaimed entries are redelivered ahead of newer ones,
+and the ingest checkpoint store drops duplicates.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import socket
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from functools import partial
+from typing import TYPE_CHECKING, Any
+from zlib import crc32
+
+import structlog
+
+from signal_client.observability.logging import safe_log
+from signal_client.runtime.models import QueuedMessage
+
+if TYPE_CHECKING:
+    import redis.asyncio as redis
+
+    from signal_client.runtime.services.dead_letter_queue import DeadLetterQueue
+    from signal_client.runtime.services.message_parser import MessageParser
+
+log = structlog.get_logger()
+
+# Upper bound, in seconds, on the delay between publish attempts.
+MAX_RETRY_BACKOFF = 5.0
+
+StreamEntry = tuple[bytes, dict[bytes, bytes]]
+
+
+def _default_consumer() -> str:
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+@dataclass(frozen=True, slots=True)
+class StreamConfig:
+    """Layout of the partitioned ingest streams.
+
+    Attributes:
+        prefix: Stream keys are ``f"{prefix}:{partition}"``.
+        partitions: Number of streams conversations are hashed onto.
+        group: Consumer group shared by the worker processes.
+        consumer: Consumer name of this process inside the group. Keep it
+            stable across restarts so a worker re-reads its own pending
+            entries.
+        worker_index: Index of this worker process, from 0.
+        worker_count: Number of worker processes splitting the partitions.
+        read_count: Maximum entries read or published per round trip.
+        block_ms: How long a read waits for new entries.
+        claim_idle_ms: Idle time after which another consumer's pending
+            entries are reclaimed.
+        maxlen: Approximate cap on each stream's length; None keeps
+            everything until it is trimmed elsewhere.
+
+    """
+
+    prefix: str = "signal_client:ingest"
+    partitions: int = 16
+    group: str = "signal_client_workers"
+    consumer: str = ""
+    worker_index: int = 0
+    worker_count: int = 1
+    read_count: int = 100
+    block_ms: int = 1000
+    claim_idle_ms: int = 30000
+    maxlen: int | None = None
+
+    def stream(self, partition: int) -> str:
+        """Return the key of a partition stream."""
+        return f"{self.prefix}:{partition}"
+
+    def partition_for(self, key: str | None) -> int:
+        """Return the partition of a conversation key."""
+        if not key:
+            return 0
+        return crc32(key.encode("utf-8")) % max(1, self.partitions)
+
+    def owned_partitions(self) -> list[int]:
+        """Return the partitions read by this worker process."""
+        count = max(1, self.worker_count)
+        return [p for p in range(self.partitions) if p % count == self.worker_index]
+
+
+class RedisStreamPublisher:
+    """Moves messages from the ingest queue onto the partition streams."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        redis_client: redis.Redis,
+        config: StreamConfig,
+        message_parser: MessageParser,
+        *,
+        dead_letter_queue: DeadLetterQueue | None = None,
+        publish_attempts: int = 3,
+        retry_backoff: float = 0.1,
+    ) -> None:
+        """Initialize the publisher.
+
+        Args:
+            redis_client: Client connected to the shared Redis.
+            config: Stream layout.
+            message_parser: Computes routing keys the listener did not record.
+            dead_letter_queue: Receives batches that still fail to publish after
+                every attempt. Without one, the error is raised from `forward`.
+            publish_attempts: Attempts per batch before giving up.
+            retry_backoff: Delay before the first retry, in seconds; it doubles
+                per attempt up to `MAX_RETRY_BACKOFF`.
+
+        """
+        self._redis = redis_client
+        self._config = config
+        self._message_parser = message_parser
+        self._dead_letter_queue = dead_letter_queue
+        self._publish_attempts = max(1, publish_attempts)
+        self._retry_backoff = max(0.0, retry_backoff)
+
+    async def forward(self, queue: asyncio.Queue[QueuedMessage]) -> None:
+        """Publish queued messages until cancelled, acknowledging each one.
+
+        A batch is acknowledged once it is in the streams or, after the last
+        failed attempt, in the dead-letter queue.
+        """
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self._config.read_count and not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                await self._publish_or_dead_letter(batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _publish_or_dead_letter(self, batch: list[QueuedMessage]) -> None:
+        try:
+            await self._publish_with_retry(batch)
+        except Exception:
+            if self._dead_letter_queue is None:
+                raise
+            safe_log(
+                log,
+                "exception",
+                "stream_fanout.publish_failed: Sending messages to the DLQ",
+                count=len(batch),
+                attempts=self._publish_attempts,
+            )
+            for queued_message in batch:
+                await self._dead_letter_queue.send(
+                    {"raw": queued_message.raw, "reason": "stream_publish_failed"}
+                )
+        for queued_message in batch:
+            if queued_message.ack is not None:
+                queued_message.ack()
+
+    async def _publish_with_retry(self, batch: list[QueuedMessage]) -> None:
+        for attempt in range(1, self._publish_attempts + 1):
+            try:
+                await self.publish(batch)
+            except Exception:
+                if attempt == self._publish_attempts:
+                    raise
+                delay = min(self._retry_backoff * 2 ** (attempt - 1), MAX_RETRY_BACKOFF)
+                safe_log(
+                    log,
+                    "warning",
+                    "stream_fanout.publish_retry: Retrying stream publish",
+                    count=len(batch),
+                    attempt=attempt,
+                    delay=delay,
+                )
+                await asyncio.sleep(delay)
+            else:
+                return
+
+    async def publish(self, queued_messages: list[QueuedMessage]) -> None:
+        """Append messages to their partition streams in one round trip.
+
+        The pipeline is not transactional; a retried batch may append some
+        entries twice, and the ingest checkpoint store drops the duplicates.
+        """
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for queued_message in queued_messages:
+                recipient = self._routing_key(queued_message)
+                fields = {
+                    "raw": queued_message.raw,
+                    "recipient": recipient or "",
+                    "published_at": repr(time.time()),
+                }
+                pipe.xadd(
+                    self._config.stream(self._config.partition_for(recipient)),
+                    fields,  # type: ignore[arg-type]
+                    maxlen=self._config.maxlen,
+                    approximate=True,
+                )
+            await pipe.execute()
+
+    def _routing_key(self, queued_message: QueuedMessage) -> str | None:
+        if queued_message.recipient is None:
+            queued_message.recipient = self._message_parser.decode(
+                queued_message.raw
+            ).routing_key()
+        return queued_message.recipient
+
+
+class RedisStreamConsumer:
+    """Reads this worker's partition streams into the local worker pool."""
+
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        config: StreamConfig,
+        enqueue: Callable[[QueuedMessage], Awaitable[None]],
+    ) -> None:
+        """Initialize the consumer.
+
+        Args:
+            redis_client: Client connected to the shared Redis.
+            config: Stream layout and this worker's index.
+            enqueue: Hands a message to the local worker pool, waiting while
+                it is full.
+
+        """
+        self._redis = redis_client
+        self._config = config
+        self._consumer = config.consumer or _default_consumer()
+        self._enqueue = enqueue
+        self._streams = [config.stream(p) for p in config.owned_partitions()]
+        self._pending_acks: dict[str, list[bytes]] = {}
+        self._closed = False
+
+    @property
+    def consumer(self) -> str:
+        """Return the consumer name used inside the group."""
+        return self._consumer
+
+    @property
+    def streams(self) -> list[str]:
+        """Return the stream keys read by this consumer."""
+        return list(self._streams)
+
+    def stop(self) -> None:
+        """Stop reading after the current round trip."""
+        self._closed = True
+
+    async def run(self) -> None:
+        """Deliver entries to the worker pool until `stop` is called."""
+        if not self._streams:
+            return
+        await self.ensure_groups()
+        # Redeliver what this consumer read but never acknowledged.
+        await self._read("0")
+        next_claim = 0.0
+        while not self._closed:
+            if time.monotonic() >= next_claim:
+                await self.reclaim()
+                next_claim = time.monotonic() + self._config.claim_idle_ms / 2000
+            await self.flush_acks()
+            await self._read(">")
+        await self.flush_acks()
+
+    async def ensure_groups(self) -> None:
+        """Create the consumer group on every owned stream if it is missing."""
+        import redis.asyncio as redis  # noqa: PLC0415
+
+        for stream in self._streams:
+            try:
+                await self._redis.xgroup_create(
+                    stream, self._config.group, id="0", mkstream=True
+                )
+            except redis.ResponseError as exc:
+                if "BUSYGROUP" not in str(exc):
+                    raise
+
+    async def reclaim(self) -> int:
+        """Take over entries other consumers left pending; return how many.
+
+        Entries this consumer holds itself are left alone even when they have
+        been idle for `claim_idle_ms`: they are still queued or being handled
+        locally, and claiming them would deliver them again.
+        """
+        claimed = 0
+        for stream in self._streams:
+            start = "-"
+            while True:
+                pending = await self._redis.xpending_range(
+                    stream,
+                    self._config.group,
+                    min=start,
+                    max="+",
+                    count=self._config.read_count,
+                    idle=self._config.claim_idle_ms,
+                )
+                abandoned: list[Any] = [
+                    entry["message_id"]
+                    for entry in pending
+                    if _text(entry["consumer"]) != self._consumer
+                ]
+                if abandoned:
+                    # XCLAIM re-checks the idle time, so an entry another
+                    # worker claimed meanwhile is skipped.
+                    entries: list[StreamEntry]
+                    entries = await self._redis.xclaim(  # type: ignore[assignment]
+                        stream,
+                        self._config.group,
+                        self._consumer,
+                        min_idle_time=self._config.claim_idle_ms,
+                        message_ids=abandoned,
+                    )
+                    await self._deliver(stream, entries)
+                    claimed += len(entries)
+                if len(pending) < self._config.read_count:
+                    break
+                start = f"({_text(pending[-1]['message_id'])}"
+        if claimed:
+            safe_log(
+                log,
+                "info",
+                "stream_fanout.reclaimed: Reclaimed pending entries",
+                count=claimed,
+                consumer=self._consumer,
+            )
+        return claimed
+
+    async def flush_acks(self) -> None:
+        """Acknowledge processed entries with one XACK per stream."""
+        pending, self._pending_acks = self._pending_acks, {}
+        for stream, entry_ids in pending.items():
+            await self._redis.xack(stream, self._config.group, *entry_ids)
+
+    async def _read(self, start: str) -> None:
+        """Read one page of new entries, or every pending entry from "0".
+
+        Pending entries are returned again until they are acknowledged, so the
+        backlog is paged by moving each stream's ID past the last entry read.
+        """
+        ids = dict.fromkeys(self._streams, start)
+        while not self._closed:
+            response: list[tuple[bytes, list[StreamEntry]]] | None
+            response = await self._redis.xreadgroup(  # type: ignore[assignment]
+                self._config.group,
+                self._consumer,
+                ids,  # type: ignore[arg-type]
+                count=self._config.read_count,
+                block=None if start == "0" else self._config.block_ms,
+            )
+            returned = 0
+            for stream, entries in response or []:
+                if not entries:
+                    continue
+                name = stream.decode() if isinstance(stream, bytes) else stream
+                await self._deliver(name, entries)
+                ids[name] = _text(entries[-1][0])
+                returned += len(entries)
+            if start != "0" or not returned:
+                return
+
+    async def _deliver(self, stream: str, entries: list[StreamEntry]) -> int:
+        delivered = 0
+        for entry_id, fields in entries:
+            if not fields:
+                # Trimmed from the stream while pending; nothing to process.
+                self._pending_acks.setdefault(stream, []).append(entry_id)
+                continue
+            raw = _text(fields.get(b"raw"))
+            recipient = _text(fields.get(b"recipient")) or None
+            await self._enqueue(
+                QueuedMessage(
+                    raw=raw,
+                    enqueued_at=time.perf_counter(),
+                    recipient=recipient,
+                    ack=partial(self._ack, stream, entry_id),
+                )
+            )
+            delivered += 1
+        return delivered
+
+    def _ack(self, stream: str, entry_id: bytes) -> None:
+        self._pending_acks.setdefault(stream, []).append(entry_id)
+
+
+def _text(value: Any) -> str:  # noqa: ANN401
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+    return "" if value is None else str(value)
+
+
+__all__ = [
+    "MAX_RETRY_BACKOFF",
+    "RedisStreamConsumer",
+    "RedisStreamPublisher",
+    "StreamConfig",
+]
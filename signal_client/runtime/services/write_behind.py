@@ -0,0 +1,134 @@
+"""Write-behind buffering for storage writes on the ingest hot path.
+
+Checkpoints and durable queue appends are coalesced in memory and handed to the
+storage backend as one batch once either the record or the time bound is hit.
+Records that are still buffered when the process dies are lost, so the bounds
+double as the durability window.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import Any
+
+import structlog
+
+from signal_client.observability.logging import safe_log
+
+log = structlog.get_logger()
+
+FlushCallback = Callable[[list[dict[str, Any]]], Awaitable[None]]
+
+
+@dataclass(frozen=True, slots=True)
+class WriteBehindConfig:
+    """Flush bounds for a write-behind buffer.
+
+    Attributes:
+        max_records: Flush as soon as this many records are pending.
+        max_delay: Flush pending records at most this many seconds after the
+            first one was buffered.
+
+    """
+
+    max_records: int = 100
+    max_delay: float = 0.05
+
+
+class WriteBehindBuffer:
+    """Coalesce records and flush them to storage in batches."""
+
+    def __init__(
+        self,
+        flush: FlushCallback,
+        config: WriteBehindConfig | None = None,
+        *,
+        name: str = "write_behind",
+    ) -> None:
+        """Initialize the buffer.
+
+        Args:
+            flush: Coroutine receiving each batch of records, in insertion order.
+            config: Flush bounds. Defaults to `WriteBehindConfig()`.
+            name: Identifier used in log events.
+
+        """
+        config = config or WriteBehindConfig()
+        self._flush_callback = flush
+        self._max_records = max(1, config.max_records)
+        self._max_delay = max(0.0, config.max_delay)
+        self._name = name
+        self._pending: list[dict[str, Any]] = []
+        self._flush_lock = asyncio.Lock()
+        self._timer: asyncio.Task[None] | None = None
+
+    @property
+    def pending_count(self) -> int:
+        """Return the number of records waiting to be flushed."""
+        return len(self._pending)
+
+    async def add(self, record: dict[str, Any]) -> None:
+        """Buffer a record, flushing inline once the record bound is reached."""
+        self._pending.append(record)
+        if len(self._pending) >= self._max_records:
+            await self.flush()
+            return
+        if self._timer is None:
+            self._timer = asyncio.create_task(self._flush_after_delay())
+
+    async def flush(self) -> None:
+        """Write all pending records to storage."""
+        async with self._flush_lock:
+            if not self._pending:
+                return
+            batch = self._pending
+            self._pending = []
+            try:
+                await self._flush_callback(batch)
+            except Exception:
+                # Keep the batch so the next flush retries it ahead of newer records.
+                self._pending[:0] = batch
+                raise
+            safe_log(
+                log,
+                "debug",
+                "write_behind.flushed",
+                buffer=self._name,
+                count=len(batch),
+            )
+
+    def discard(self) -> None:
+        """Drop pending records without writing them."""
+        self._pending = []
+
+    async def close(self) -> None:
+        """Cancel the flush timer and write any pending records."""
+        timer = self._timer
+        self._timer = None
+        if timer is not None and timer is not asyncio.current_task():
+            timer.cancel()
+            with suppress(asyncio.CancelledError):
+                await timer
+        await self.flush()
+
+    async def _flush_after_delay(self) -> None:
+        try:
+            await asyncio.sleep(self._max_delay)
+        finally:
+            self._timer = None
+        try:
+            await self.flush()
+        except Exception:  # noqa: BLE001 - retried on the next flush
+            safe_log(
+                log,
+                "warning",
+                "write_behind.flush_failed",
+                buffer=self._name,
+                pending=len(self._pending),
+            )
+
+
+__all__ = ["FlushCallback", "WriteBehindBuffer", "WriteBehindConfig"]
@@ -3,19 +3,21 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import math
 import time
+from collections import deque
 from collections.abc import Awaitable, Callable, Iterable
 from contextlib import suppress
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import cast
 from zlib import crc32
 
 import structlog
 
 from signal_client.adapters.api.schemas.message import Message
-from signal_client.core.command import Command, CommandError
+from signal_client.core.command import BatchCommand, Command, CommandError
 from signal_client.core.context import Context
 from signal_client.core.exceptions import (
     AuthenticationError,
@@ -38,10 +40,22 @@ from signal_client.observability.metrics import (
 )
 from signal_client.runtime.command_router import CommandRouter
 from signal_client.runtime.models import QueuedMessage
-from signal_client.runtime.services.checkpoint_store import IngestCheckpointStore
+from signal_client.runtime.services.autoscaler import AutoscaleConfig, WorkerAutoscaler
+from signal_client.runtime.services.checkpoint_store import (
+    CheckpointRecord,
+    IngestCheckpointStore,
+)
+from signal_client.runtime.services.conversation_scheduler import (
+    ConversationLane,
+    ConversationScheduler,
+)
 from signal_client.runtime.services.dead_letter_queue import DeadLetterQueue
 from signal_client.runtime.services.lock_manager import LockManager
-from signal_client.runtime.services.message_parser import MessageParser
+from signal_client.runtime.services.message_parser import (
+    DecodedEnvelope,
+    MessageParser,
+)
+from signal_client.runtime.services.process_executor import ProcessCommandExecutor
 
 log = structlog.get_logger(__name__)
 
@@ -50,6 +64,95 @@ MiddlewareCallable = Callable[
 ]
 
 
+class _QueueWaiter:
+    """Blocks on `queue.get()` until an item arrives or `close` is called.
+
+    Closing cancels the consuming task, but only while it is parked on the get,
+    so a message that is being processed is never interrupted. This replaces
+    polling with `asyncio.wait_for(queue.get(), timeout)`, which schedules a
+    task and a timer per message and delays shutdown by up to the timeout.
+    """
+
+    __slots__ = ("_closed", "_queue", "_waiting")
+
+    def __init__(self, queue: asyncio.Queue[QueuedMessage]) -> None:
+        self._queue = queue
+        self._closed = False
+        self._waiting: asyncio.Task[object] | None = None
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    async def get(self) -> QueuedMessage | None:
+        """Return the next item, or None once the waiter is closed."""
+        if self._closed:
+            return None
+        if not self._queue.empty():
+            return self._queue.get_nowait()
+        task = asyncio.current_task()
+        self._waiting = task
+        try:
+            return await self._queue.get()
+        except asyncio.CancelledError:
+            if not self._closed:
+                raise
+            # The cancellation came from `close`; Queue.get leaves the item in
+            # the queue when cancelled, so nothing is lost.
+            uncancel = getattr(task, "uncancel", None)
+            if uncancel is not None:
+                uncancel()
+            return None
+        finally:
+            self._waiting = None
+
+    def get_nowait(self) -> QueuedMessage | None:
+        """Return the next item if one is queued, without waiting."""
+        try:
+            return self._queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return None
+
+    def task_done(self, _queued_message: QueuedMessage) -> None:
+        """Mark an item returned by `get` as processed."""
+        self._queue.task_done()
+
+    def qsize(self) -> int:
+        """Return the number of queued items."""
+        return self._queue.qsize()
+
+    def close(self) -> None:
+        """Wake a parked consumer and make further `get` calls return None."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._waiting is not None:
+            self._waiting.cancel()
+
+
+@dataclass(slots=True)
+class _ConversationGate:
+    """Handler slots of one conversation and the messages waiting for one.
+
+    Slots are handed from a finishing handler straight to the oldest waiter,
+    so messages of a conversation start in the order they were taken from the
+    queue.
+    """
+
+    running: int = 0
+    waiters: deque[asyncio.Future[None]] = field(default_factory=deque)
+
+
+@dataclass(slots=True)
+class _BatchEntry:
+    """A batch command match waiting for the end of the drained batch."""
+
+    context: Context
+    message: Message
+    trigger: str | None
+    queued_message: QueuedMessage | None
+
+
 @dataclass(slots=True)
 class WorkerConfig:
     """Configuration for a single worker."""
@@ -63,6 +166,13 @@ class WorkerConfig:
     checkpoint_store: IngestCheckpointStore | None = None
     lock_manager: LockManager | None = None
     queue_depth_getter: Callable[[], int] | None = None
+    prefilter_commands: bool = False
+    batch_size: int = 1
+    scheduler: ConversationScheduler | None = None
+    max_inflight: int = 1
+    conversation_max_inflight: int = 1
+    latency_observer: Callable[[float], None] | None = None
+    process_executor: ProcessCommandExecutor | None = None
 
 
 class Worker:
@@ -84,17 +194,34 @@ class Worker:
         self._message_parser = config.message_parser
         self._router = config.router
         self._middleware: list[MiddlewareCallable] = list(config.middleware)
-        self._stop = asyncio.Event()
+        # Workers read from their shard queue, or from a lane of the shared
+        # conversation scheduler when work stealing is enabled.
+        self._waiter: _QueueWaiter | ConversationLane = (
+            config.scheduler.lane(shard_id)
+            if config.scheduler is not None
+            else _QueueWaiter(self._queue)
+        )
         self._worker_id = worker_id
         self._shard_id = shard_id
         self._dead_letter_queue = config.dead_letter_queue
         self._checkpoint_store = config.checkpoint_store
         self._lock_manager = config.lock_manager
         self._queue_depth_getter = config.queue_depth_getter
+        self._prefilter_commands = config.prefilter_commands
+        self._batch_size = max(1, config.batch_size)
+        self._max_inflight = max(1, config.max_inflight)
+        self._conversation_max_inflight = max(1, config.conversation_max_inflight)
+        self._conversation_gates: dict[str, _ConversationGate] = {}
+        self._latency_observer = config.latency_observer
+        self._process_executor = config.process_executor
+        # Only set while a batch is processed: batch command matches and
+        # checkpoints are collected here and handled once the batch is done.
+        self._batch_entries: dict[BatchCommand, list[_BatchEntry]] | None = None
+        self._pending_checkpoints: dict[tuple[str, int], CheckpointRecord] | None = None
 
     def stop(self) -> None:
-        """Signal the worker to stop processing messages."""
-        self._stop.set()
+        """Stop after the current message, waking the worker if it is idle."""
+        self._waiter.close()
 
     def add_middleware(self, middleware: MiddlewareCallable) -> None:
         """Add a middleware to the worker."""
@@ -102,65 +229,218 @@ class Worker:
 
     async def process_messages(self) -> None:
         """Continuously retrieve and process messages from the queue."""
-        while not self._stop.is_set():
-            try:
-                queued_item = await asyncio.wait_for(self._queue.get(), timeout=1.0)
-                queued_message = (
-                    queued_item
-                    if isinstance(queued_item, QueuedMessage)
-                    else QueuedMessage(
-                        raw=str(queued_item),
-                        enqueued_at=time.perf_counter(),
-                    )
+        if self._batch_size > 1:
+            await self._process_batches()
+            return
+        if self._max_inflight > 1:
+            await self._process_concurrently()
+            return
+        while (queued_item := await self._waiter.get()) is not None:
+            await self._process_queued(self._as_queued_message(queued_item))
+
+    async def _process_queued(self, queued_message: QueuedMessage) -> None:
+        try:
+            structlog.contextvars.bind_contextvars(
+                worker_id=self._worker_id,
+                shard_id=self._shard_id,
+                queue_depth=self._waiter.qsize(),
+            )
+            latency = time.perf_counter() - queued_message.enqueued_at
+            if await self._handle_queued(queued_message, latency):
+                MESSAGES_PROCESSED.inc()
+        finally:
+            self._finish((queued_message,))
+
+    async def _process_concurrently(self) -> None:
+        """Run up to `max_inflight` handlers at once, ordered per conversation.
+
+        A message is only taken from the queue once an in-flight slot is free,
+        so a saturated worker leaves the backlog queued. Each message then
+        waits for a slot of its conversation; handlers of different
+        conversations overlap.
+        """
+        inflight = asyncio.Semaphore(self._max_inflight)
+        tasks: set[asyncio.Task[None]] = set()
+        try:
+            while True:
+                await inflight.acquire()
+                queued_item = await self._waiter.get()
+                if queued_item is None:
+                    inflight.release()
+                    break
+                queued_message = self._as_queued_message(queued_item)
+                key = self._conversation_key(queued_message)
+                # Reserve the conversation slot before yielding so messages
+                # of one conversation keep their queue order.
+                turn = self._enter_conversation(key)
+                task = asyncio.create_task(
+                    self._process_in_conversation(queued_message, key, turn, inflight)
                 )
-                latency = time.perf_counter() - queued_message.enqueued_at
-                try:
-                    MESSAGE_QUEUE_LATENCY.observe(latency)
-                    structlog.contextvars.bind_contextvars(
-                        worker_id=self._worker_id,
-                        shard_id=self._shard_id,
-                        queue_depth=self._queue.qsize(),
-                    )
-                    message = queued_message.message or self._message_parser.parse(
-                        queued_message.raw
-                    )
-                    if message:
-                        await self.process(
-                            message, latency, queued_message=queued_message
-                        )
-                        MESSAGES_PROCESSED.inc()
-                except UnsupportedMessageError as error:
-                    log.debug(
-                        "worker.unsupported_message: Unsupported message", error=error
-                    )
-                    ERRORS_OCCURRED.inc()
-                except (json.JSONDecodeError, KeyError):
-                    log.exception(
-                        "worker.message_parse_failed: Failed to parse message",
-                        raw_message=queued_message.raw,
-                        worker_id=self._worker_id,
-                    )
-                    await self._send_to_dlq(
-                        reason="parse_failed",
-                        raw=queued_message.raw,
-                        metadata={"worker_id": self._worker_id},
-                    )
-                    ERRORS_OCCURRED.inc()
-                finally:
-                    self._queue.task_done()
-                    self._acknowledge(queued_message)
-                    queue_depth = (
-                        self._queue_depth_getter()
-                        if self._queue_depth_getter
-                        else self._queue.qsize()
-                    )
-                    MESSAGE_QUEUE_DEPTH.set(queue_depth)
-                    SHARD_QUEUE_DEPTH.labels(shard=str(self._shard_id)).set(
-                        self._queue.qsize()
-                    )
-                    structlog.contextvars.clear_contextvars()
-            except asyncio.TimeoutError:  # noqa: PERF203
-                continue
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+        except asyncio.CancelledError:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    async def _process_in_conversation(
+        self,
+        queued_message: QueuedMessage,
+        key: str | None,
+        turn: asyncio.Future[None] | None,
+        inflight: asyncio.Semaphore,
+    ) -> None:
+        try:
+            if turn is not None:
+                await turn
+            await self._process_queued(queued_message)
+        finally:
+            self._leave_conversation(key, turn)
+            inflight.release()
+
+    def _conversation_key(self, queued_message: QueuedMessage) -> str | None:
+        if queued_message.recipient is None:
+            queued_message.recipient = (
+                queued_message.message.recipient()
+                if queued_message.message
+                else self._decode(queued_message).routing_key()
+            )
+        return queued_message.recipient
+
+    def _enter_conversation(self, key: str | None) -> asyncio.Future[None] | None:
+        """Take a conversation slot, or return a future resolved once one frees."""
+        if key is None:
+            return None
+        gate = self._conversation_gates.get(key)
+        if gate is None:
+            gate = self._conversation_gates[key] = _ConversationGate()
+        if gate.running < self._conversation_max_inflight and not gate.waiters:
+            gate.running += 1
+            return None
+        turn: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        gate.waiters.append(turn)
+        return turn
+
+    def _leave_conversation(
+        self, key: str | None, turn: asyncio.Future[None] | None
+    ) -> None:
+        if key is None:
+            return
+        gate = self._conversation_gates.get(key)
+        if gate is None:
+            return
+        if turn is not None and turn.cancelled():
+            # Cancelled while waiting: no slot was held.
+            with suppress(ValueError):
+                gate.waiters.remove(turn)
+        else:
+            while gate.waiters:
+                waiter = gate.waiters.popleft()
+                if not waiter.done():
+                    waiter.set_result(None)
+                    return
+            gate.running -= 1
+        if gate.running == 0 and not gate.waiters:
+            del self._conversation_gates[key]
+
+    async def process_batch(self, batch: list[QueuedMessage]) -> None:
+        """Process drained messages, amortizing checkpoints and metrics.
+
+        Messages are parsed and routed in order. Regular commands run as each
+        message is reached; batch command matches are collected and passed to
+        one handler call per command once every message has been routed. The
+        checkpoints of the whole batch are then written with a single store
+        call.
+        """
+        structlog.contextvars.bind_contextvars(
+            worker_id=self._worker_id,
+            shard_id=self._shard_id,
+            queue_depth=self._waiter.qsize(),
+            batch_size=len(batch),
+        )
+        self._batch_entries = {}
+        if self._checkpoint_store:
+            self._pending_checkpoints = {}
+        processed = 0
+        try:
+            now = time.perf_counter()
+            for queued_message in batch:
+                if await self._handle_queued(
+                    queued_message, now - queued_message.enqueued_at
+                ):
+                    processed += 1
+            entries, self._batch_entries = self._batch_entries, None
+            for command, command_entries in entries.items():
+                await self._dispatch_batch(command, command_entries)
+            await self._flush_checkpoints()
+        finally:
+            self._batch_entries = None
+            self._pending_checkpoints = None
+            MESSAGES_PROCESSED.inc(processed)
+
+    async def _process_batches(self) -> None:
+        while (queued_item := await self._waiter.get()) is not None:
+            batch = [self._as_queued_message(queued_item)]
+            while len(batch) < self._batch_size:
+                if (queued_item := self._waiter.get_nowait()) is None:
+                    break
+                batch.append(self._as_queued_message(queued_item))
+            try:
+                await self.process_batch(batch)
+            finally:
+                self._finish(batch)
+
+    @staticmethod
+    def _as_queued_message(queued_item: QueuedMessage | object) -> QueuedMessage:
+        if isinstance(queued_item, QueuedMessage):
+            return queued_item
+        return QueuedMessage(raw=str(queued_item), enqueued_at=time.perf_counter())
+
+    async def _handle_queued(
+        self, queued_message: QueuedMessage, latency: float
+    ) -> bool:
+        """Parse and dispatch one queued message; return True once processed."""
+        MESSAGE_QUEUE_LATENCY.observe(latency)
+        if self._latency_observer is not None:
+            self._latency_observer(latency)
+        try:
+            if await self._skip_non_command(queued_message):
+                return True
+            message = queued_message.message or self._decode(queued_message).message()
+            if message:
+                await self.process(message, latency, queued_message=queued_message)
+                return True
+        except UnsupportedMessageError as error:
+            log.debug("worker.unsupported_message: Unsupported message", error=error)
+            ERRORS_OCCURRED.inc()
+        except (json.JSONDecodeError, KeyError):
+            log.exception(
+                "worker.message_parse_failed: Failed to parse message",
+                raw_message=queued_message.raw,
+                worker_id=self._worker_id,
+            )
+            await self._send_to_dlq(
+                reason="parse_failed",
+                raw=queued_message.raw,
+                metadata={"worker_id": self._worker_id},
+            )
+            ERRORS_OCCURRED.inc()
+        return False
+
+    def _finish(self, queued_messages: Iterable[QueuedMessage]) -> None:
+        """Acknowledge handled messages and refresh queue gauges once."""
+        for queued_message in queued_messages:
+            self._waiter.task_done(queued_message)
+            self._acknowledge(queued_message)
+        shard_depth = self._waiter.qsize()
+        queue_depth = (
+            self._queue_depth_getter() if self._queue_depth_getter else shard_depth
+        )
+        MESSAGE_QUEUE_DEPTH.set(queue_depth)
+        SHARD_QUEUE_DEPTH.labels(shard=str(self._shard_id)).set(shard_depth)
+        structlog.contextvars.clear_contextvars()
 
     async def process(  # compatibility alias for legacy tests/callers
         self,
@@ -176,7 +456,9 @@ class Worker:
             timestamp=message.timestamp,
         )
         if await self._is_duplicate(message):
-            log.debug(
+            safe_log(
+                log,
+                "debug",
                 "worker.duplicate_suppressed: Duplicate message suppressed",
                 message_id=str(message.id),
                 source=message.source,
@@ -186,7 +468,9 @@ class Worker:
         recipient = message.recipient()
         if recipient:
             structlog.contextvars.bind_contextvars(conversation_id=recipient)
-        if self._lock_manager and recipient:
+        # With several handlers per conversation allowed, the worker sequences
+        # conversations itself and the per-recipient lock would serialize them.
+        if self._lock_manager and recipient and self._conversation_max_inflight == 1:
             async with self._lock_manager.lock(recipient):
                 await self._dispatch_message(
                     message,
@@ -215,7 +499,9 @@ class Worker:
 
         command, trigger = self._router.match(text)
         if command is None:
-            log.debug(
+            safe_log(
+                log,
+                "debug",
                 "worker.command_not_found: Command not found",
                 trigger=trigger,
                 message_id=str(message.id),
@@ -224,7 +510,9 @@ class Worker:
             await self._mark_checkpoint(message, queued_message)
             return
         if not self._is_whitelisted(command, context):
-            log.debug(
+            safe_log(
+                log,
+                "debug",
                 "worker.command_not_whitelisted: Command not whitelisted",
                 command=command.__class__.__name__,
                 recipient=recipient,
@@ -232,6 +520,14 @@ class Worker:
             )
             await self._mark_checkpoint(message, queued_message)
             return
+        if self._batch_entries is not None and isinstance(command, BatchCommand):
+            self._batch_entries.setdefault(command, []).append(
+                _BatchEntry(context, message, trigger, queued_message)
+            )
+            # Reserve the checkpoint so duplicates later in the batch are
+            # suppressed; it is released again if the batch handler fails.
+            await self._mark_checkpoint(message, queued_message)
+            return
 
         handler = getattr(command, "handle", None)
         handler_name = getattr(handler, "__name__", command.__class__.__name__)
@@ -285,6 +581,71 @@ class Worker:
             )
             COMMANDS_PROCESSED.labels(command=handler_name, status=status).inc()
 
+    async def _dispatch_batch(
+        self, command: BatchCommand, entries: list[_BatchEntry]
+    ) -> None:
+        """Run middleware per message, then the batch handler once."""
+        handler_name = getattr(
+            command.handle_batch, "__name__", command.__class__.__name__
+        )
+        status = "success"
+        start_time = time.perf_counter()
+        contexts: list[Context] = []
+
+        async def collect(ctx: Context) -> None:
+            contexts.append(ctx)
+
+        try:
+            structlog.contextvars.bind_contextvars(command_name=handler_name)
+            for entry in entries:
+                await self._run_middleware(entry.context, collect)
+            if contexts:
+                await command.call_batch(contexts)
+        except SignalAPIError as error:
+            status = "failure"
+            self._release_checkpoints(entries)
+            for entry in entries:
+                await self._handle_api_exception(
+                    error=error,
+                    handler_name=handler_name,
+                    trigger=entry.trigger,
+                    message=entry.message,
+                    recipient=entry.message.recipient(),
+                    queued_message=entry.queued_message,
+                )
+        except Exception:  # noqa: BLE001 - every message in the batch goes to the DLQ
+            status = "failure"
+            self._release_checkpoints(entries)
+            safe_log(
+                log,
+                "exception",
+                "worker.batch_command_failed: Batch command failed",
+                command_name=handler_name,
+                worker_id=self._worker_id,
+                shard_id=self._shard_id,
+                batch_size=len(entries),
+            )
+            for entry in entries:
+                await self._send_to_dlq(
+                    reason="command_failed",
+                    raw=entry.queued_message.raw if entry.queued_message else None,
+                    metadata=self._build_dlq_metadata(
+                        handler_name=handler_name,
+                        trigger=entry.trigger,
+                        message=entry.message,
+                        recipient=entry.message.recipient(),
+                    ),
+                )
+            ERRORS_OCCURRED.inc(len(entries))
+        finally:
+            duration = time.perf_counter() - start_time
+            COMMAND_LATENCY.labels(command=handler_name, status=status).observe(
+                duration
+            )
+            COMMANDS_PROCESSED.labels(command=handler_name, status=status).inc(
+                len(entries)
+            )
+
     async def _handle_api_exception(  # noqa: PLR0913
         self,
         *,
@@ -370,7 +731,16 @@ class Worker:
         if handler is None:
             message = "Command handler is not configured."
             raise CommandError(message)
-
+        if command.executor == "process":
+            if self._process_executor is None:
+                message = "No process executor is configured for process commands."
+                raise CommandError(message)
+            handler = functools.partial(self._process_executor.run, command)
+        await self._run_middleware(context, handler)
+
+    async def _run_middleware(
+        self, context: Context, handler: Callable[[Context], Awaitable[None]]
+    ) -> None:
         async def invoke(index: int, ctx: Context) -> None:
             if index >= len(self._middleware):
                 await handler(ctx)
@@ -385,36 +755,100 @@ class Worker:
 
         await invoke(0, context)
 
+    def _decode(self, queued_message: QueuedMessage) -> DecodedEnvelope:
+        if queued_message.decoded is None:
+            queued_message.decoded = self._message_parser.decode(queued_message.raw)
+        return queued_message.decoded
+
+    async def _skip_non_command(self, queued_message: QueuedMessage) -> bool:
+        """Checkpoint a message no command can match without fully parsing it.
+
+        Only applies when the prefilter is enabled and the raw payload is a chat
+        message; everything else takes the regular parse and dispatch path.
+        """
+        if not self._prefilter_commands or queued_message.message is not None:
+            return False
+        preview = self._decode(queued_message).preview()
+        if preview is None or self._router.could_match(preview.text):
+            return False
+        if not await self._is_duplicate_key(preview.source, preview.timestamp):
+            await self._mark_checkpoint_key(
+                preview.source, preview.timestamp, queued_message
+            )
+        return True
+
     async def _mark_checkpoint(
         self, message: Message, queued_message: QueuedMessage | None
+    ) -> None:
+        await self._mark_checkpoint_key(
+            message.source, message.timestamp, queued_message
+        )
+
+    async def _mark_checkpoint_key(
+        self, source: str, timestamp: int, queued_message: QueuedMessage | None
     ) -> None:
         if not self._checkpoint_store:
             return
+        enqueued_at = queued_message.enqueued_at if queued_message else None
+        if self._pending_checkpoints is not None:
+            self._pending_checkpoints[source, timestamp] = CheckpointRecord(
+                source=source,
+                timestamp=timestamp,
+                enqueued_at=enqueued_at or time.time(),
+            )
+            return
         try:
             await self._checkpoint_store.mark_processed(
-                source=message.source,
-                timestamp=message.timestamp,
-                enqueued_at=queued_message.enqueued_at if queued_message else None,
+                source=source,
+                timestamp=timestamp,
+                enqueued_at=enqueued_at,
             )
         except Exception:  # noqa: BLE001, pragma: no cover - defensive
             self._warn(
                 "worker.checkpoint_failed: Failed to mark checkpoint",
-                source=message.source,
-                timestamp=message.timestamp,
+                source=source,
+                timestamp=timestamp,
             )
 
+    async def _flush_checkpoints(self) -> None:
+        pending, self._pending_checkpoints = self._pending_checkpoints, None
+        if not pending or not self._checkpoint_store:
+            return
+        try:
+            await self._checkpoint_store.mark_processed_many(pending.values())
+        except Exception:  # noqa: BLE001, pragma: no cover - defensive
+            self._warn(
+                "worker.checkpoint_failed: Failed to mark checkpoints",
+                count=len(pending),
+            )
+
+    def _release_checkpoints(self, entries: Iterable[_BatchEntry]) -> None:
+        if self._pending_checkpoints is None:
+            return
+        for entry in entries:
+            key = (entry.message.source, entry.message.timestamp)
+            self._pending_checkpoints.pop(key, None)
+
     async def _is_duplicate(self, message: Message) -> bool:
+        return await self._is_duplicate_key(message.source, message.timestamp)
+
+    async def _is_duplicate_key(self, source: str, timestamp: int) -> bool:
         if not self._checkpoint_store:
             return False
+        if (
+            self._pending_checkpoints
+            and (source, timestamp) in self._pending_checkpoints
+        ):
+            return True
         try:
             return await self._checkpoint_store.is_duplicate(
-                source=message.source, timestamp=message.timestamp
+                source=source, timestamp=timestamp
             )
         except Exception:  # noqa: BLE001, pragma: no cover - defensive
             self._warn(
                 "worker.checkpoint_lookup_failed: Failed to lookup checkpoint",
-                source=message.source,
-                timestamp=message.timestamp,
+                source=source,
+                timestamp=timestamp,
             )
             return False
 
@@ -480,6 +914,14 @@ class WorkerPool:
         checkpoint_store: IngestCheckpointStore | None = None,
         shard_count: int | None = None,
         lock_manager: LockManager | None = None,
+        prefilter_commands: bool = False,
+        batch_size: int = 1,
+        direct_enqueue: bool = False,
+        work_stealing: bool = False,
+        max_inflight: int = 1,
+        conversation_max_inflight: int = 1,
+        autoscale: AutoscaleConfig | None = None,
+        process_executor: ProcessCommandExecutor | None = None,
     ) -> None:
         """Initialize the WorkerPool.
 
@@ -493,8 +935,41 @@ class WorkerPool:
             checkpoint_store: Optional IngestCheckpointStore for deduplication.
             shard_count: Number of shards for message distribution.
             lock_manager: Optional LockManager for distributed locks.
+            prefilter_commands: Checkpoint chat messages whose raw text matches
+                no command without building a Message or Context.
+            batch_size: Maximum number of ready messages a worker drains from
+                its shard and processes as one batch; 1 disables batching.
+            direct_enqueue: Do not run the distributor task. Producers put
+                messages straight into the queue returned by `select_queue`,
+                and workers acknowledge them on their shard queue.
+            work_stealing: Distribute messages into per-conversation mailboxes
+                instead of shard queues. Idle workers steal whole conversations
+                from busier shards, and each conversation is still processed in
+                order by one worker at a time. Requires the distributor, so it
+                cannot be combined with `direct_enqueue`.
+            max_inflight: Handlers each worker runs concurrently. With more
+                than 1, messages of different conversations overlap and
+                ordering is only kept per conversation. Not supported together
+                with `batch_size` above 1.
+            conversation_max_inflight: Handlers of one conversation a worker
+                runs concurrently; 1 keeps each conversation in order.
+            autoscale: Add and retire workers between `pool_size` and
+                `autoscale.max_workers` based on queue latency and depth.
+            process_executor: Runs commands declared with
+                `executor="process"`. Defaults to a pool sized to the CPU
+                count; it is shut down with the worker pool.
+
+        Raises:
+            ValueError: If `work_stealing` and `direct_enqueue` are both set,
+                or `max_inflight` and `batch_size` are both above 1.
 
         """
+        if work_stealing and direct_enqueue:
+            msg = "work_stealing cannot be combined with direct_enqueue."
+            raise ValueError(msg)
+        if max_inflight > 1 and batch_size > 1:
+            msg = "max_inflight cannot be combined with batch_size."
+            raise ValueError(msg)
         self._context_factory = context_factory
         self._queue = queue
         self._message_parser = message_parser
@@ -509,19 +984,61 @@ class WorkerPool:
         self._dead_letter_queue = dead_letter_queue
         self._checkpoint_store = checkpoint_store
         self._lock_manager = lock_manager
+        self._prefilter_commands = prefilter_commands
+        self._batch_size = batch_size
+        self._direct_enqueue = direct_enqueue
+        self._work_stealing = work_stealing
+        self._scheduler: ConversationScheduler | None = None
+        self._max_inflight = max_inflight
+        self._conversation_max_inflight = conversation_max_inflight
+        self._autoscale = autoscale
+        self._autoscaler: WorkerAutoscaler | None = None
+        self._process_executor = process_executor or ProcessCommandExecutor()
         self._shard_queues: list[asyncio.Queue[QueuedMessage]] = []
         self._distributor_task: asyncio.Task[None] | None = None
-        self._distributor_stop = asyncio.Event()
+        self._distributor_waiter: _QueueWaiter | None = None
 
     @property
     def router(self) -> CommandRouter:
         """Get the command router."""
         return self._router
 
+    @property
+    def worker_count(self) -> int:
+        """Return the number of running workers."""
+        return len(self._workers)
+
+    @property
+    def direct_enqueue(self) -> bool:
+        """Return True when producers enqueue straight into shard queues."""
+        return self._direct_enqueue
+
     def register(self, command: Command) -> None:
         """Register a command with the internal command router."""
         self._router.register(command)
 
+    def select_queue(
+        self, queued_message: QueuedMessage
+    ) -> asyncio.Queue[QueuedMessage]:
+        """Return the queue a producer should put `queued_message` into.
+
+        With `direct_enqueue` this is the shard queue of the message's
+        conversation (the routing key is recorded on the message, so workers do
+        not compute it again); otherwise it is the pool's input queue.
+        """
+        if not self._direct_enqueue:
+            return self._queue
+        self._initialize_shards()
+        return self._shard_queues[self._route(queued_message)]
+
+    async def wait_idle(self) -> None:
+        """Wait until every message put into the pool has been processed."""
+        await self._queue.join()
+        for shard_queue in self._shard_queues:
+            await shard_queue.join()
+        if self._scheduler is not None:
+            await self._scheduler.join()
+
     def register_middleware(self, middleware: MiddlewareCallable) -> None:
         """Register a middleware to be applied to all workers."""
         if id(middleware) in self._middleware_ids:
@@ -544,9 +1061,35 @@ class WorkerPool:
             raise ValueError(msg)
 
         self._initialize_shards()
-        self._start_distributor()
+        if self._work_stealing:
+            self._scheduler = ConversationScheduler(
+                self._shard_count, maxsize=self._queue.maxsize
+            )
+        if not self._direct_enqueue:
+            self._start_distributor()
+
+        if self._autoscale is not None:
+            self._autoscaler = WorkerAutoscaler(
+                self._autoscale,
+                min_workers=self._pool_size,
+                worker_count=lambda: self.worker_count,
+                queue_depth=self.queue_depth,
+                resize=self.resize,
+            )
+        self.resize(self._pool_size)
+        if self._autoscaler is not None:
+            self._autoscaler.start()
+        self._started.set()
 
-        for worker_id in range(self._pool_size):
+    def resize(self, worker_count: int) -> None:
+        """Start or retire workers until `worker_count` are running.
+
+        The pool never shrinks below one worker per shard. Retired workers
+        finish the message in hand before they exit.
+        """
+        worker_count = max(worker_count, self._shard_count, 1)
+        while len(self._workers) < worker_count:
+            worker_id = len(self._workers)
             shard_id = worker_id % self._shard_count
             worker_config = WorkerConfig(
                 context_factory=self._context_factory,
@@ -557,7 +1100,16 @@ class WorkerPool:
                 dead_letter_queue=self._dead_letter_queue,
                 checkpoint_store=self._checkpoint_store,
                 lock_manager=self._lock_manager,
-                queue_depth_getter=self._queue_depth,
+                queue_depth_getter=self.queue_depth,
+                prefilter_commands=self._prefilter_commands,
+                batch_size=self._batch_size,
+                scheduler=self._scheduler,
+                max_inflight=self._max_inflight,
+                conversation_max_inflight=self._conversation_max_inflight,
+                latency_observer=(
+                    self._autoscaler.observe_latency if self._autoscaler else None
+                ),
+                process_executor=self._process_executor,
             )
             worker = Worker(
                 worker_config,
@@ -567,14 +1119,50 @@ class WorkerPool:
             self._workers.append(worker)
             task = asyncio.create_task(worker.process_messages())
             self._tasks.append(task)
-        self._started.set()
+        while len(self._workers) > worker_count:
+            self._workers.pop().stop()
+        self._tasks = [task for task in self._tasks if not task.done()]
 
     def stop(self) -> None:
-        """Stop all workers and the message distributor."""
-        self._distributor_stop.set()
+        """Stop all workers and the message distributor.
+
+        Workers and the distributor finish the message in hand and exit; idle
+        ones are woken immediately. Messages still queued stay in their queues.
+        """
+        if self._autoscaler is not None:
+            self._autoscaler.stop()
+        if self._distributor_waiter is not None:
+            self._distributor_waiter.close()
         for worker in self._workers:
             worker.stop()
 
+    async def shutdown(self, *, drain_timeout: float | None = None) -> bool:
+        """Drain queued messages for up to `drain_timeout` seconds, then stop.
+
+        Args:
+            drain_timeout: Seconds to wait for every queued message to be
+                processed before stopping; None or 0 stops without draining.
+
+        Returns:
+            True if no message was left unprocessed.
+
+        """
+        if drain_timeout:
+            try:
+                await asyncio.wait_for(self.wait_idle(), timeout=drain_timeout)
+            except asyncio.TimeoutError:
+                safe_log(
+                    log,
+                    "warning",
+                    "worker_pool.drain_timeout: Stopping with messages queued",
+                    drain_timeout=drain_timeout,
+                    queue_depth=self.queue_depth(),
+                )
+        self.stop()
+        await self.join()
+        self._process_executor.shutdown()
+        return self.queue_depth() == 0
+
     async def join(self) -> None:
         """Wait for all active workers to complete their current tasks."""
         if self._distributor_task:
@@ -605,17 +1193,13 @@ class WorkerPool:
     def _start_distributor(self) -> None:
         if self._distributor_task:
             return
-        self._distributor_stop.clear()
-        self._distributor_task = asyncio.create_task(self._distribute_messages())
+        self._distributor_waiter = _QueueWaiter(self._queue)
+        self._distributor_task = asyncio.create_task(
+            self._distribute_messages(self._distributor_waiter)
+        )
 
-    async def _distribute_messages(self) -> None:
-        while True:
-            if self._distributor_stop.is_set() and self._queue.empty():
-                return
-            try:
-                queued_item = await asyncio.wait_for(self._queue.get(), timeout=1.0)
-            except asyncio.TimeoutError:
-                continue
+    async def _distribute_messages(self, waiter: _QueueWaiter) -> None:
+        while (queued_item := await waiter.get()) is not None:
             await self._process_and_enqueue_queued_message(queued_item)
 
     async def _process_and_enqueue_queued_message(
@@ -629,15 +1213,7 @@ class WorkerPool:
                 enqueued_at=time.perf_counter(),
             )
         )
-        if queued_message.message is None:
-            queued_message.message = self._message_parser.parse(queued_message.raw)
-
-        recipient = queued_message.recipient
-        if queued_message.message:
-            recipient = queued_message.message.recipient()
-        elif recipient is None:
-            recipient = self._message_parser.recipient_from_raw(queued_message.raw)
-        queued_message.recipient = recipient
+        shard_index = self._route(queued_message)
 
         if queued_message.ack:
             existing_ack: Callable[[], None] = cast(
@@ -652,10 +1228,11 @@ class WorkerPool:
         else:
             queued_message.ack = self._queue.task_done
 
-        shard_index = self._compute_shard(recipient)
-
         try:
-            await self._shard_queues[shard_index].put(queued_message)
+            if self._scheduler is not None:
+                await self._scheduler.put(queued_message, shard_index)
+            else:
+                await self._shard_queues[shard_index].put(queued_message)
         except Exception:
             log.exception(
                 "worker_pool.shard_enqueue_failed: Failed to enqueue message to shard",
@@ -664,6 +1241,20 @@ class WorkerPool:
             with suppress(Exception):  # pragma: no cover - defensive
                 self._queue.task_done()
 
+    def _route(self, queued_message: QueuedMessage) -> int:
+        """Record the conversation key of a message and return its shard."""
+        recipient = queued_message.recipient
+        if queued_message.message:
+            recipient = queued_message.message.recipient()
+        elif recipient is None:
+            # Decode once and shard on the raw payload; the worker validates the
+            # event from the same decoded envelope only when it needs it.
+            if queued_message.decoded is None:
+                queued_message.decoded = self._message_parser.decode(queued_message.raw)
+            recipient = queued_message.decoded.routing_key()
+        queued_message.recipient = recipient
+        return self._compute_shard(recipient)
+
     def _compute_shard(self, recipient: str | None) -> int:
         if not self._shard_queues:
             return 0
@@ -671,12 +1262,15 @@ class WorkerPool:
             return 0
         return crc32(recipient.encode("utf-8")) % len(self._shard_queues)
 
-    def _queue_depth(self) -> int:
+    def queue_depth(self) -> int:
+        """Return the number of messages waiting in the input and shard queues."""
         shard_depth = sum(queue.qsize() for queue in self._shard_queues)
+        if self._scheduler is not None:
+            shard_depth += self._scheduler.qsize()
         return self._queue.qsize() + shard_depth
 
     def _set_queue_depth_metric(self) -> None:
-        MESSAGE_QUEUE_DEPTH.set(self._queue_depth())
+        MESSAGE_QUEUE_DEPTH.set(self.queue_depth())
         for index, shard_queue in enumerate(self._shard_queues):
             SHARD_QUEUE_DEPTH.labels(shard=str(index)).set(shard_queue.qsize())
 
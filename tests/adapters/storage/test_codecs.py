@@ -0,0 +1,67 @@
+"""Tests for storage record codecs."""
+
+from __future__ import annotations
+
+import importlib.util
+
+import pytest
+
+from signal_client.adapters.storage.codecs import (
+    JsonCodec,
+    OrjsonCodec,
+    resolve_codec,
+)
+
+HAS_MSGPACK = importlib.util.find_spec("msgpack") is not None
+
+
+def test_json_codec_matches_stdlib_output():
+    """Test that the default codec keeps the historical wire format."""
+    codec = resolve_codec()
+    assert isinstance(codec, JsonCodec)
+    assert codec.encode({"a": 1}) == '{"a": 1}'
+    assert codec.decode(b'{"a": 1}') == {"a": 1}
+
+
+def test_orjson_codec_reads_json_written_by_default_codec():
+    """Test that orjson can read data written by the json codec."""
+    pytest.importorskip("orjson")
+    codec = resolve_codec("orjson")
+    assert codec.decode(JsonCodec().encode({"a": [1, 2]})) == {"a": [1, 2]}
+    assert JsonCodec().decode(codec.encode({"a": [1, 2]})) == {"a": [1, 2]}
+
+
+def test_auto_codec_prefers_orjson(monkeypatch):
+    """Test that auto picks orjson when available and json otherwise."""
+    pytest.importorskip("orjson")
+    assert isinstance(resolve_codec("auto"), OrjsonCodec)
+
+    def missing(_name: str) -> None:
+        raise ImportError
+
+    monkeypatch.setattr(
+        "signal_client.adapters.storage.codecs.importlib.import_module", missing
+    )
+    assert isinstance(resolve_codec("auto"), JsonCodec)
+
+
+@pytest.mark.skipif(not HAS_MSGPACK, reason="msgpack is not installed")
+def test_msgpack_codec_round_trips():
+    """Test msgpack encoding and decoding."""
+    codec = resolve_codec("msgpack")
+    assert codec.decode(codec.encode({"a": b"x", "b": 1})) == {"a": b"x", "b": 1}
+
+
+def test_resolve_codec_rejects_unknown_or_missing_codecs(monkeypatch):
+    """Test that unknown names and missing packages raise ValueError."""
+    with pytest.raises(ValueError, match="Unknown storage codec"):
+        resolve_codec("yaml")
+
+    def missing(_name: str) -> None:
+        raise ImportError
+
+    monkeypatch.setattr(
+        "signal_client.adapters.storage.codecs.importlib.import_module", missing
+    )
+    with pytest.raises(ValueError, match="requires the 'msgpack' package"):
+        resolve_codec("msgpack")
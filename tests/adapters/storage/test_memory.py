@@ -38,3 +38,41 @@ async def test_memory_storage_close(memory_storage: MemoryStorage):
     await memory_storage.close()
     result = await memory_storage.read_all("test_key")
     assert result == []
+
+
+async def test_memory_storage_append_many(memory_storage: MemoryStorage):
+    """Test appending several records at once to memory storage."""
+    await memory_storage.append("test_key", {"idx": 0})
+    await memory_storage.append_many("test_key", [{"idx": 1}, {"idx": 2}])
+    result = await memory_storage.read_all("test_key")
+    assert result == [{"idx": 0}, {"idx": 1}, {"idx": 2}]
+
+
+async def test_memory_storage_length_and_trim(memory_storage: MemoryStorage):
+    """Test trimming memory storage down to the newest records."""
+    await memory_storage.append_many("test_key", [{"idx": idx} for idx in range(5)])
+    assert await memory_storage.length("test_key") == 5
+
+    await memory_storage.trim_to_last("test_key", 2)
+
+    assert await memory_storage.length("test_key") == 2
+    assert await memory_storage.read_all("test_key") == [{"idx": 3}, {"idx": 4}]
+
+
+async def test_memory_storage_pop_front(memory_storage: MemoryStorage):
+    """Test popping the oldest records from memory storage."""
+    await memory_storage.append_many("test_key", [{"idx": idx} for idx in range(3)])
+
+    assert await memory_storage.pop_front("test_key", 2) == [{"idx": 0}, {"idx": 1}]
+    assert await memory_storage.pop_front("test_key", 5) == [{"idx": 2}]
+    assert await memory_storage.pop_front("test_key", 1) == []
+    assert await memory_storage.length("missing") == 0
+
+
+async def test_memory_storage_read_range(memory_storage: MemoryStorage):
+    """Test reading a slice of records from memory storage."""
+    await memory_storage.append_many("test_key", [{"idx": idx} for idx in range(5)])
+
+    assert await memory_storage.read_range("test_key", 1, 2) == [{"idx": 1}, {"idx": 2}]
+    assert await memory_storage.read_range("test_key", 4, 10) == [{"idx": 4}]
+    assert await memory_storage.read_range("missing", 0, 3) == []
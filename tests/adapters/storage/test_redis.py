@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import json
 from typing import cast
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from pytest_mock import MockerFixture
@@ -20,6 +20,8 @@ def redis_storage(mocker: MockerFixture) -> RedisStorage:
     mock_instance.rpush = AsyncMock()
     mock_instance.lrange = AsyncMock()
     mock_instance.delete = AsyncMock()
+    mock_instance.llen = AsyncMock()
+    mock_instance.ltrim = AsyncMock()
     mock_instance.close = AsyncMock()
 
     return RedisStorage(host="localhost", port=6379)
@@ -36,6 +38,18 @@ async def test_append_list(redis_storage: RedisStorage):
     )
 
 
+@pytest.mark.asyncio
+async def test_append_many_uses_single_rpush(redis_storage: RedisStorage):
+    """Test that batched appends are sent as one RPUSH."""
+    records = [{"idx": 1}, {"idx": 2}]
+    await redis_storage.append_many("test_key", records)
+    cast("AsyncMock", redis_storage.client.rpush).assert_awaited_once_with(
+        "test_key",
+        json.dumps(records[0]),
+        json.dumps(records[1]),
+    )
+
+
 @pytest.mark.asyncio
 async def test_read_all_list(redis_storage: RedisStorage):
     """Test reading all items from a list."""
@@ -43,11 +57,12 @@ async def test_read_all_list(redis_storage: RedisStorage):
         b'{"key1": "value1"}',
         b'{"key2": 123}',
     ]
-    result = await redis_storage.read_all("test_key")  # noqa: F841
+    result = await redis_storage.read_all("test_key")
+    assert result == [{"key1": "value1"}, {"key2": 123}]
     cast("AsyncMock", redis_storage.client.lrange).assert_awaited_once_with(
         "test_key",
         0,
-        -1,
+        999,
     )
 
 
@@ -60,7 +75,7 @@ async def test_read_all_empty_list(redis_storage: RedisStorage):
     cast("AsyncMock", redis_storage.client.lrange).assert_awaited_once_with(
         "test_key",
         0,
-        -1,
+        999,
     )
 
 
@@ -76,3 +91,133 @@ async def test_close(redis_storage: RedisStorage):
     """Test closing the redis client."""
     await redis_storage.close()
     cast("AsyncMock", redis_storage.client.close).assert_awaited_once_with()
+
+
+@pytest.mark.asyncio
+async def test_length_uses_llen(redis_storage: RedisStorage):
+    """Test that length is answered by LLEN."""
+    cast("AsyncMock", redis_storage.client.llen).return_value = 3
+    assert await redis_storage.length("test_key") == 3
+    cast("AsyncMock", redis_storage.client.llen).assert_awaited_once_with("test_key")
+
+
+@pytest.mark.asyncio
+async def test_trim_to_last_uses_ltrim(redis_storage: RedisStorage):
+    """Test that trimming keeps the newest entries with LTRIM."""
+    await redis_storage.trim_to_last("test_key", 10)
+    cast("AsyncMock", redis_storage.client.ltrim).assert_awaited_once_with(
+        "test_key", -10, -1
+    )
+
+
+def _mock_pipeline(redis_storage: RedisStorage, result: list) -> MagicMock:
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=result)
+    pipeline_cm = MagicMock()
+    pipeline_cm.__aenter__ = AsyncMock(return_value=pipe)
+    pipeline_cm.__aexit__ = AsyncMock(return_value=None)
+    cast("MagicMock", redis_storage.client.pipeline).return_value = pipeline_cm
+    return pipe
+
+
+@pytest.mark.asyncio
+async def test_pop_front_uses_transactional_pipeline(redis_storage: RedisStorage):
+    """Test that pop_front reads and trims the head in one MULTI/EXEC."""
+    pipe = _mock_pipeline(redis_storage, [[b'{"idx": 1}', b'{"idx": 2}'], True])
+
+    popped = await redis_storage.pop_front("test_key", 2)
+
+    assert popped == [{"idx": 1}, {"idx": 2}]
+    cast("MagicMock", redis_storage.client.pipeline).assert_called_once_with(
+        transaction=True
+    )
+    pipe.lrange.assert_called_once_with("test_key", 0, 1)
+    pipe.ltrim.assert_called_once_with("test_key", 2, -1)
+
+
+@pytest.mark.asyncio
+async def test_read_range_uses_bounded_lrange(redis_storage: RedisStorage):
+    """Test that read_range only fetches the requested slice."""
+    cast("AsyncMock", redis_storage.client.lrange).return_value = [b'{"idx": 2}']
+
+    assert await redis_storage.read_range("test_key", 2, 3) == [{"idx": 2}]
+    cast("AsyncMock", redis_storage.client.lrange).assert_awaited_once_with(
+        "test_key", 2, 4
+    )
+
+
+@pytest.mark.asyncio
+async def test_read_all_pages_through_long_lists(mocker: MockerFixture):
+    """Test that read_all fetches long lists in LRANGE pages."""
+    mock_redis_class = mocker.patch("redis.asyncio.Redis", autospec=True)
+    lrange = AsyncMock(
+        side_effect=[
+            [b'{"idx": 0}', b'{"idx": 1}'],
+            [b'{"idx": 2}', b'{"idx": 3}'],
+            [b'{"idx": 4}'],
+        ]
+    )
+    mock_redis_class.return_value.lrange = lrange
+    storage = RedisStorage(host="localhost", port=6379, page_size=2)
+
+    assert await storage.read_all("test_key") == [{"idx": idx} for idx in range(5)]
+    assert [call.args for call in lrange.await_args_list] == [
+        ("test_key", 0, 1),
+        ("test_key", 2, 3),
+        ("test_key", 4, 5),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_append_many_pipelines_large_batches(mocker: MockerFixture):
+    """Test that batches above the page size are split across one pipeline."""
+    mocker.patch("redis.asyncio.Redis", autospec=True)
+    storage = RedisStorage(host="localhost", port=6379, page_size=2)
+    pipe = _mock_pipeline(storage, [2, 1])
+
+    await storage.append_many("test_key", [{"idx": idx} for idx in range(3)])
+
+    assert [call.args for call in pipe.rpush.call_args_list] == [
+        ("test_key", '{"idx": 0}', '{"idx": 1}'),
+        ("test_key", '{"idx": 2}'),
+    ]
+    pipe.execute.assert_awaited_once()
+
+
+def test_connection_settings_are_forwarded(mocker: MockerFixture):
+    """Test that pool, auth and TLS options reach the redis client."""
+    mock_redis_class = mocker.patch("redis.asyncio.Redis", autospec=True)
+
+    RedisStorage(
+        host="redis.internal",
+        port=6380,
+        db=2,
+        password="secret",  # noqa: S106
+        ssl=True,
+        max_connections=16,
+    )
+
+    mock_redis_class.assert_called_once_with(
+        host="redis.internal",
+        port=6380,
+        db=2,
+        password="secret",  # noqa: S106
+        ssl=True,
+        max_connections=16,
+    )
+
+
+@pytest.mark.asyncio
+async def test_orjson_codec_round_trips(mocker: MockerFixture):
+    """Test that a non-default codec is used for writes and reads."""
+    mock_redis_class = mocker.patch("redis.asyncio.Redis", autospec=True)
+    mock_redis_class.return_value.rpush = AsyncMock()
+    mock_redis_class.return_value.lrange = AsyncMock(return_value=[b'{"idx":1}'])
+    storage = RedisStorage(host="localhost", port=6379, codec="orjson")
+
+    await storage.append("test_key", {"idx": 1})
+
+    cast("AsyncMock", storage.client.rpush).assert_awaited_once_with(
+        "test_key", b'{"idx":1}'
+    )
+    assert await storage.read_all("test_key") == [{"idx": 1}]
@@ -0,0 +1,75 @@
+"""Opt-in SQLite append throughput benchmark.
+
+Set RUN_PERFORMANCE_TESTS=1 and run with `pytest -m performance -s` to see the
+appends per second for the legacy and tuned configurations.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+
+import pytest
+
+from signal_client.adapters.storage.sqlite import SQLiteStorage
+
+pytestmark = [
+    pytest.mark.performance,
+    pytest.mark.skipif(
+        bool(os.environ.get("CI")),
+        reason="Performance benchmark is disabled on CI runners.",
+    ),
+    pytest.mark.skipif(
+        not bool(os.environ.get("RUN_PERFORMANCE_TESTS")),
+        reason=(
+            "Performance benchmark is opt-in; set RUN_PERFORMANCE_TESTS=1 to enable."
+        ),
+    ),
+]
+
+NUM_RECORDS = 2000
+BATCH_SIZE = 100
+
+
+async def _appends_per_second(
+    storage: SQLiteStorage, *, batch_size: int | None = None
+) -> float:
+    records = [
+        {"raw": f"message-{idx}", "enqueued_at": idx} for idx in range(NUM_RECORDS)
+    ]
+    start = time.perf_counter()
+    if batch_size is None:
+        for record in records:
+            await storage.append("queue", record)
+    else:
+        for offset in range(0, NUM_RECORDS, batch_size):
+            await storage.append_many("queue", records[offset : offset + batch_size])
+    duration = time.perf_counter() - start
+    assert await storage.length("queue") == NUM_RECORDS
+    await storage.close()
+    return NUM_RECORDS / duration
+
+
+@pytest.mark.asyncio
+async def test_sqlite_append_throughput(tmp_path) -> None:
+    """Compare appends/sec of the rollback-journal defaults and the tuned profile."""
+    legacy = await _appends_per_second(
+        SQLiteStorage(
+            database=str(tmp_path / "legacy.db"),
+            journal_mode="delete",
+            synchronous=None,
+        )
+    )
+    tuned = await _appends_per_second(
+        SQLiteStorage(database=str(tmp_path / "tuned.db"))
+    )
+    batched = await _appends_per_second(
+        SQLiteStorage(database=str(tmp_path / "batched.db")), batch_size=BATCH_SIZE
+    )
+
+    print(f"legacy (journal=delete, synchronous=full): {legacy:.0f} appends/sec")
+    print(f"tuned (journal=wal, synchronous=normal): {tuned:.0f} appends/sec")
+    print(f"tuned + append_many({BATCH_SIZE}): {batched:.0f} appends/sec")
+
+    assert tuned > legacy
+    assert batched > tuned
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import pytest
 
-from signal_client.core.command import command
+from signal_client.core.command import BatchCommand, batch_command, command
 
 
 class DummyContext:
@@ -53,3 +53,29 @@ async def test_command_metadata_overrides():
     ctx = DummyContext()
     await echo(ctx)
     assert ctx.called_with == ["handled"]
+
+
+@pytest.mark.asyncio
+async def test_batch_command_receives_context_lists():
+    """Test that batch commands wrap single dispatch in a one-item list."""
+    received: list[list[DummyContext]] = []
+
+    @batch_command("!log")
+    async def archive(contexts):
+        """Archive messages."""
+        received.append(contexts)
+
+    assert isinstance(archive, BatchCommand)
+    assert archive.name == "archive"
+    assert archive.description == "Archive messages."
+
+    first, second = DummyContext(), DummyContext()
+    await archive(first)
+    await archive.call_batch([first, second])
+    assert received == [[first], [first, second]]
+
+
+def test_command_rejects_unknown_executor():
+    """Test that the executor must be inline or process."""
+    with pytest.raises(ValueError, match="executor"):
+        command("!work", executor="thread")
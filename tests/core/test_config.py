@@ -147,6 +147,27 @@ def test_settings_invalid_sqlite_configuration(mock_env_vars):
         Settings.from_sources(config=config)
 
 
+def test_settings_invalid_sqlite_synchronous(mock_env_vars):
+    """Test that an unknown SQLite synchronous level is rejected."""
+    config = {"storage_type": "sqlite", "sqlite_synchronous": "sometimes"}
+    with pytest.raises(ConfigurationError, match="sqlite_synchronous"):
+        Settings.from_sources(config=config)
+
+
+def test_settings_invalid_json_backend(mock_env_vars):
+    """Test that an unknown JSON backend is rejected."""
+    with pytest.raises(ConfigurationError, match="json_backend"):
+        Settings.from_sources(config={"json_backend": "yaml"})
+
+
+def test_settings_split_ingest_role_requires_redis(mock_env_vars):
+    """Test that ingest and worker roles are rejected without Redis storage."""
+    with pytest.raises(ConfigurationError, match="requires the 'redis' storage"):
+        Settings.from_sources(config={"ingest_role": "worker"})
+    with pytest.raises(ConfigurationError, match="ingest_role"):
+        Settings.from_sources(config={"ingest_role": "both"})
+
+
 def test_settings_invalid_config_overrides_report_missing_fields(mock_env_vars):
     """Test that invalid config overrides report missing fields."""
     config = {"phone_number": None}
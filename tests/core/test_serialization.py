@@ -0,0 +1,66 @@
+"""Tests for the pluggable JSON backend."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+
+import pytest
+
+from signal_client.adapters.storage.codecs import JsonCodec
+from signal_client.core import serialization
+
+PAYLOAD = {"envelope": {"source": "+1", "timestamp": 1, "text": "héllo"}}
+
+
+@pytest.fixture(autouse=True)
+def restore_backend() -> Iterator[None]:
+    """Reset the process-wide backend after each test."""
+    previous = serialization.get_backend()
+    yield
+    serialization.set_backend(previous)
+
+
+def test_default_backend_matches_stdlib_output() -> None:
+    """Test that the default backend writes exactly what json.dumps writes."""
+    assert serialization.get_backend().name == "json"
+    assert serialization.dumps(PAYLOAD) == json.dumps(PAYLOAD)
+    assert serialization.dumps_bytes(PAYLOAD) == json.dumps(PAYLOAD).encode()
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+def test_backends_round_trip_and_raise_json_errors(name: str) -> None:
+    """Test that every backend round-trips and reports JSONDecodeError."""
+    pytest.importorskip(name)
+    backend = serialization.resolve_backend(name)
+
+    assert backend.loads(backend.dumps(PAYLOAD)) == PAYLOAD
+    assert backend.loads(backend.dumps_bytes(PAYLOAD)) == PAYLOAD
+    assert backend.loads(json.dumps(PAYLOAD)) == PAYLOAD
+    assert json.loads(backend.dumps({1: "a"})) == {"1": "a"}
+    with pytest.raises(json.JSONDecodeError):
+        backend.loads('{"envelope":')
+
+
+def test_auto_backend_prefers_installed_fast_library() -> None:
+    """Test that auto picks orjson when present."""
+    pytest.importorskip("orjson")
+    assert serialization.resolve_backend("auto").name == "orjson"
+
+
+def test_resolve_backend_rejects_unknown_name() -> None:
+    """Test that unknown backend names raise ValueError."""
+    with pytest.raises(ValueError, match="Unknown JSON backend"):
+        serialization.resolve_backend("yaml")
+
+
+def test_set_backend_switches_module_functions_and_codec() -> None:
+    """Test that the active backend drives module helpers and the JSON codec."""
+    pytest.importorskip("orjson")
+    serialization.set_backend("orjson")
+
+    assert serialization.dumps(PAYLOAD) == json.dumps(
+        PAYLOAD, separators=(",", ":"), ensure_ascii=False
+    )
+    assert JsonCodec().encode(PAYLOAD) == serialization.dumps(PAYLOAD)
+    assert JsonCodec().decode(json.dumps(PAYLOAD)) == PAYLOAD
@@ -0,0 +1,79 @@
+"""Opt-in per-message JSON parse/serialize benchmark.
+
+Set RUN_PERFORMANCE_TESTS=1 and run with `pytest -m performance -s` to see the
+cost of decoding a websocket frame and encoding a storage record with each
+installed backend.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+
+import pytest
+
+from signal_client.core import serialization
+
+pytestmark = [
+    pytest.mark.performance,
+    pytest.mark.skipif(
+        bool(os.environ.get("CI")),
+        reason="Performance benchmark is disabled on CI runners.",
+    ),
+    pytest.mark.skipif(
+        not bool(os.environ.get("RUN_PERFORMANCE_TESTS")),
+        reason=(
+            "Performance benchmark is opt-in; set RUN_PERFORMANCE_TESTS=1 to enable."
+        ),
+    ),
+]
+
+NUM_MESSAGES = 20000
+FRAME = json.dumps(
+    {
+        "envelope": {
+            "source": "+15550001111",
+            "sourceNumber": "+15550001111",
+            "sourceUuid": "2f1c8b4e-5d0a-4c8f-9a3e-7b6d5c4b3a21",
+            "sourceName": "Alice",
+            "sourceDevice": 1,
+            "timestamp": 1_700_000_000_000,
+            "dataMessage": {
+                "timestamp": 1_700_000_000_000,
+                "message": "just chatting about the weekend plans",
+                "expiresInSeconds": 0,
+                "viewOnce": False,
+                "groupInfo": {"groupId": "Z3JvdXAtaWQtYmFzZTY0", "type": "DELIVER"},
+                "mentions": [{"number": "+15550002222", "start": 0, "length": 1}],
+            },
+        },
+        "account": "+15550009999",
+    }
+)
+
+
+def _microseconds_per_message(backend: serialization.JsonBackend) -> float:
+    start = time.perf_counter()
+    for index in range(NUM_MESSAGES):
+        decoded = backend.loads(FRAME)
+        backend.dumps({"raw": FRAME, "enqueued_at": index, "seq": index})
+    duration = time.perf_counter() - start
+    assert decoded["envelope"]["source"] == "+15550001111"
+    return duration / NUM_MESSAGES * 1_000_000
+
+
+def test_json_backend_per_message_cost() -> None:
+    """Compare per-message decode + encode cost across installed backends."""
+    results: dict[str, float] = {}
+    for name in ("json", "orjson", "msgspec"):
+        try:
+            backend = serialization.resolve_backend(name)
+        except ValueError:
+            continue
+        results[name] = _microseconds_per_message(backend)
+        print(f"{name}: {results[name]:.2f} us/message (loads frame + dumps record)")
+
+    fastest = min(results, key=results.__getitem__)
+    if len(results) > 1:
+        assert fastest != "json"
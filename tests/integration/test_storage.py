@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import sqlite3
+
 import pytest
 
+from signal_client.adapters.storage.base import Storage, StorageError
 from signal_client.adapters.storage.redis import RedisStorage
-from signal_client.adapters.storage.sqlite import SQLiteStorage
+from signal_client.adapters.storage.sqlite import SCHEMA_VERSION, SQLiteStorage
 from signal_client.app import Application
 from signal_client.core.config import Settings
 
@@ -94,3 +97,138 @@ async def test_application_redis_configuration(monkeypatch):
     finally:
         await storage.close()
         await app.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_storage_append_many(tmp_path):
+    """Test batched SQLite appends preserve order."""
+    storage = SQLiteStorage(database=str(tmp_path / "test.db"))
+
+    await storage.append("queue", {"idx": 0})
+    await storage.append_many("queue", [{"idx": 1}, {"idx": 2}])
+    assert await storage.read_all("queue") == [{"idx": 0}, {"idx": 1}, {"idx": 2}]
+
+    await storage.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_storage_bulk_operations(tmp_path):
+    """Test SQLite read_range, length, trim_to_last and pop_front."""
+    storage = SQLiteStorage(database=str(tmp_path / "test.db"))
+    await storage.append_many("queue", [{"idx": idx} for idx in range(5)])
+    await storage.append("other", {"idx": 99})
+
+    assert await storage.read_range("queue", 1, 2) == [{"idx": 1}, {"idx": 2}]
+
+    await storage.trim_to_last("queue", 3)
+    assert await storage.length("queue") == 3
+    assert await storage.read_all("queue") == [{"idx": 2}, {"idx": 3}, {"idx": 4}]
+
+    assert await storage.pop_front("queue", 2) == [{"idx": 2}, {"idx": 3}]
+    assert await storage.read_all("queue") == [{"idx": 4}]
+    assert await storage.read_all("other") == [{"idx": 99}]
+
+    await storage.trim_to_last("queue", 0)
+    assert await storage.length("queue") == 0
+
+    await storage.close()
+
+
+@pytest.mark.asyncio
+async def test_storage_base_fallbacks_preserve_order():
+    """Test the generic bulk operations on a minimal Storage subclass."""
+
+    class ListStorage(Storage):
+        def __init__(self) -> None:
+            self.data: dict[str, list[dict]] = {}
+
+        async def close(self) -> None:
+            return None
+
+        async def append(self, key: str, data: dict) -> None:
+            self.data.setdefault(key, []).append(data)
+
+        async def read_all(self, key: str) -> list[dict]:
+            return list(self.data.get(key, []))
+
+        async def delete_all(self, key: str) -> None:
+            self.data.pop(key, None)
+
+    storage = ListStorage()
+    await storage.append_many("queue", [{"idx": idx} for idx in range(4)])
+    assert await storage.read_range("queue", 2, 5) == [{"idx": 2}, {"idx": 3}]
+    await storage.trim_to_last("queue", 3)
+    assert await storage.pop_front("queue", 1) == [{"idx": 1}]
+    assert await storage.length("queue") == 2
+    assert await storage.read_all("queue") == [{"idx": 2}, {"idx": 3}]
+
+
+@pytest.mark.asyncio
+async def test_sqlite_storage_applies_pragmas(tmp_path):
+    """Test that the journal mode and synchronous level are applied on connect."""
+    storage = SQLiteStorage(
+        database=str(tmp_path / "test.db"), journal_mode="wal", synchronous="full"
+    )
+    await storage.append("queue", {"idx": 1})
+    db = await storage._get_db()
+    async with db.execute("PRAGMA journal_mode") as cursor:
+        assert (await cursor.fetchone())[0] == "wal"
+    async with db.execute("PRAGMA synchronous") as cursor:
+        assert (await cursor.fetchone())[0] == 2  # FULL
+    await storage.close()
+
+    with pytest.raises(ValueError, match="journal_mode"):
+        SQLiteStorage(database=str(tmp_path / "test.db"), journal_mode="fast")
+
+
+@pytest.mark.asyncio
+async def test_sqlite_storage_migrates_legacy_schema(tmp_path):
+    """Test that a database created before schema versioning is upgraded."""
+    database_path = tmp_path / "legacy.db"
+    legacy = sqlite3.connect(database_path)
+    legacy.execute("CREATE TABLE signal_client_dlq (key TEXT, value TEXT)")
+    legacy.execute(
+        "INSERT INTO signal_client_dlq (key, value) VALUES (?, ?)",
+        ["dlq", '{"id": 1}'],
+    )
+    legacy.commit()
+    legacy.close()
+
+    storage = SQLiteStorage(database=str(database_path))
+    assert await storage.read_all("dlq") == [{"id": 1}]
+    await storage.close()
+
+    upgraded = sqlite3.connect(database_path)
+    try:
+        assert upgraded.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+        indexes = {
+            row[1] for row in upgraded.execute("PRAGMA index_list(signal_client_dlq)")
+        }
+        assert "signal_client_dlq_key_idx" in indexes
+    finally:
+        upgraded.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_storage_rolls_back_failed_transactions(tmp_path):
+    """Test that a failed write transaction leaves no partial writes behind."""
+    storage = SQLiteStorage(database=str(tmp_path / "test.db"))
+    await storage.append("queue", {"idx": 0})
+
+    async def insert_then_fail() -> None:
+        async with storage._transaction() as db:
+            await db.execute(
+                "INSERT INTO signal_client_dlq (key, value) VALUES (?, ?)",
+                ["queue", '{"idx": 1}'],
+            )
+            raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        await insert_then_fail()
+
+    assert await storage.read_all("queue") == [{"idx": 0}]
+    with pytest.raises(StorageError):
+        await storage.append_many("queue", [{"idx": 2}, {"idx": object()}])
+    await storage.append("queue", {"idx": 3})
+    assert await storage.read_all("queue") == [{"idx": 0}, {"idx": 3}]
+    await storage.close()
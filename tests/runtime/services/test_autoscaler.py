@@ -0,0 +1,126 @@
+"""Tests for queue-driven worker autoscaling."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from signal_client.observability.metrics import WORKER_POOL_SIZE, WORKER_SCALING_EVENTS
+from signal_client.runtime.models import QueuedMessage
+from signal_client.runtime.services.autoscaler import AutoscaleConfig, WorkerAutoscaler
+from signal_client.runtime.services.message_parser import MessageParser
+from signal_client.runtime.worker_pool import WorkerPool
+
+
+class _FakePool:
+    def __init__(self, workers: int) -> None:
+        self.workers = workers
+        self.depth = 0
+
+    def resize(self, workers: int) -> None:
+        self.workers = workers
+
+
+def _autoscaler(pool: _FakePool, **overrides: float) -> WorkerAutoscaler:
+    config = AutoscaleConfig(
+        max_workers=int(overrides.pop("max_workers", 8)),
+        target_latency=overrides.pop("target_latency", 0.1),
+        target_queue_depth=int(overrides.pop("target_queue_depth", 10)),
+        scale_down_after=int(overrides.pop("scale_down_after", 2)),
+    )
+    return WorkerAutoscaler(
+        config,
+        min_workers=2,
+        worker_count=lambda: pool.workers,
+        queue_depth=lambda: pool.depth,
+        resize=pool.resize,
+    )
+
+
+def _scaling_events(direction: str) -> float:
+    return WORKER_SCALING_EVENTS.labels(direction=direction)._value.get()  # type: ignore[attr-defined]
+
+
+def test_scales_up_to_spread_backlog() -> None:
+    """Test that a deep queue adds enough workers to meet the depth target."""
+    pool = _FakePool(2)
+    autoscaler = _autoscaler(pool)
+    pool.depth = 55
+    events_before = _scaling_events("up")
+
+    assert autoscaler.evaluate() == 6
+    assert pool.workers == 6
+    assert _scaling_events("up") == events_before + 1
+    assert WORKER_POOL_SIZE._value.get() == 6  # type: ignore[attr-defined]
+
+    pool.depth = 500
+    assert autoscaler.evaluate() == 8
+
+
+def test_scales_up_on_latency() -> None:
+    """Test that slow queue latency adds a worker even with a short queue."""
+    pool = _FakePool(2)
+    autoscaler = _autoscaler(pool)
+    autoscaler.observe_latency(0.05)
+    autoscaler.observe_latency(0.25)
+
+    assert autoscaler.evaluate() == 3
+
+    # Samples are consumed by each decision.
+    assert autoscaler.evaluate() == 3
+
+
+def test_scales_down_after_consecutive_idle_intervals() -> None:
+    """Test that idle intervals retire one worker at a time down to the minimum."""
+    pool = _FakePool(3)
+    autoscaler = _autoscaler(pool)
+    events_before = _scaling_events("down")
+
+    assert autoscaler.evaluate() == 3
+    assert autoscaler.evaluate() == 2
+    for _ in range(4):
+        autoscaler.evaluate()
+
+    assert pool.workers == 2
+    assert _scaling_events("down") == events_before + 1
+
+
+def test_busy_interval_resets_scale_down() -> None:
+    """Test that a non-idle interval restarts the idle count."""
+    pool = _FakePool(3)
+    autoscaler = _autoscaler(pool)
+
+    autoscaler.evaluate()
+    pool.depth = 1
+    autoscaler.evaluate()
+    pool.depth = 0
+    autoscaler.evaluate()
+
+    assert pool.workers == 3
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_resize_adds_and_retires_workers() -> None:
+    """Test that resized pools keep processing and retire idle workers."""
+    queue: asyncio.Queue[QueuedMessage] = asyncio.Queue()
+    pool = WorkerPool(
+        context_factory=MagicMock(),
+        queue=queue,
+        message_parser=MessageParser(),
+        pool_size=1,
+        autoscale=AutoscaleConfig(max_workers=4, interval=60),
+    )
+    pool.start()
+    assert pool.worker_count == 1
+
+    pool.resize(4)
+    assert pool.worker_count == 4
+    pool.resize(0)
+    assert pool.worker_count == 1
+
+    await queue.put(QueuedMessage(raw="{}", enqueued_at=time.perf_counter()))
+    await asyncio.wait_for(pool.wait_idle(), timeout=1)
+    assert await pool.shutdown()
@@ -0,0 +1,153 @@
+"""Tests for the ingest checkpoint store."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from signal_client.adapters.storage.memory import MemoryStorage
+from signal_client.runtime.services.checkpoint_store import (
+    CheckpointRecord,
+    IngestCheckpointStore,
+)
+
+
+@pytest.mark.asyncio
+async def test_snapshot_mode_rewrites_window() -> None:
+    """Test that the default mode persists exactly the current window."""
+    storage = MemoryStorage()
+    store = IngestCheckpointStore(storage, "checkpoints", window_size=2)
+
+    for timestamp in (1, 2, 3):
+        await store.mark_processed("+1", timestamp)
+
+    stored = await storage.read_all("checkpoints")
+    assert [record["timestamp"] for record in stored] == [2, 3]
+    assert not await store.is_duplicate("+1", 1)
+    assert await store.is_duplicate("+1", 3)
+
+
+@pytest.mark.asyncio
+async def test_incremental_mode_appends_single_record_per_checkpoint() -> None:
+    """Test that incremental mode never rewrites the log on the hot path."""
+    storage = MemoryStorage()
+    storage.delete_all = AsyncMock(wraps=storage.delete_all)  # type: ignore[method-assign]
+    store = IngestCheckpointStore(
+        storage, "checkpoints", window_size=2, incremental=True
+    )
+
+    for timestamp in (1, 2, 3):
+        await store.mark_processed("+1", timestamp)
+
+    storage.delete_all.assert_not_awaited()
+    stored = await storage.read_all("checkpoints")
+    assert [record["timestamp"] for record in stored] == [1, 2, 3]
+    assert not await store.is_duplicate("+1", 1)
+    assert await store.is_duplicate("+1", 2)
+
+
+@pytest.mark.asyncio
+async def test_incremental_compaction_trims_log_to_window() -> None:
+    """Test that compaction trims the append-only log back to the window."""
+    storage = MemoryStorage()
+    store = IngestCheckpointStore(
+        storage, "checkpoints", window_size=2, incremental=True
+    )
+    for timestamp in (1, 2, 3, 4):
+        await store.mark_processed("+1", timestamp)
+
+    await store.compact()
+
+    stored = await storage.read_all("checkpoints")
+    assert [record["timestamp"] for record in stored] == [3, 4]
+
+
+@pytest.mark.asyncio
+async def test_incremental_load_keeps_latest_window() -> None:
+    """Test that loading an uncompacted log keeps only the newest records."""
+    storage = MemoryStorage()
+    for timestamp in (1, 2, 3):
+        await storage.append(
+            "checkpoints", {"source": "+1", "timestamp": timestamp, "enqueued_at": 0}
+        )
+    store = IngestCheckpointStore(
+        storage, "checkpoints", window_size=2, incremental=True
+    )
+
+    assert not await store.is_duplicate("+1", 1)
+    assert await store.is_duplicate("+1", 2)
+    assert await store.is_duplicate("+1", 3)
+
+
+@pytest.mark.asyncio
+async def test_background_compaction_runs_periodically() -> None:
+    """Test that start() schedules compaction and close() stops it."""
+    storage = MemoryStorage()
+    store = IngestCheckpointStore(
+        storage,
+        "checkpoints",
+        window_size=1,
+        incremental=True,
+        compaction_interval=0.01,
+    )
+    store.start()
+    await store.mark_processed("+1", 1)
+    await store.mark_processed("+1", 2)
+
+    await asyncio.sleep(0.05)
+    stored = await storage.read_all("checkpoints")
+    assert [record["timestamp"] for record in stored] == [2]
+
+    await store.close()
+    assert store._compaction_task is None
+
+
+@pytest.mark.asyncio
+async def test_duplicate_index_tracks_window_evictions() -> None:
+    """Test that the lookup index forgets records evicted from the window."""
+    store = IngestCheckpointStore(MemoryStorage(), "checkpoints", window_size=2)
+
+    await store.mark_processed("+1", 1)
+    await store.mark_processed("+1", 1)
+    await store.mark_processed("+2", 5)
+
+    # One copy of ("+1", 1) was evicted, the other is still in the window.
+    assert await store.is_duplicate("+1", 1)
+    await store.mark_processed("+3", 7)
+    assert not await store.is_duplicate("+1", 1)
+    assert await store.is_duplicate("+2", 5)
+    assert store._index == {("+2", 5): 1, ("+3", 7): 1}
+
+
+@pytest.mark.asyncio
+async def test_duplicate_lookup_does_not_wait_for_store_lock() -> None:
+    """Test that lookups proceed while a checkpoint write holds the lock."""
+    store = IngestCheckpointStore(MemoryStorage(), "checkpoints")
+    await store.mark_processed("+1", 1)
+
+    async with store._lock:
+        assert await asyncio.wait_for(store.is_duplicate("+1", 1), timeout=0.1)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("incremental", [False, True])
+async def test_mark_processed_many_writes_once(incremental: bool) -> None:  # noqa: FBT001
+    """Test that a batch of checkpoints costs a single storage write."""
+    storage = MemoryStorage()
+    storage.append_many = AsyncMock(wraps=storage.append_many)  # type: ignore[method-assign]
+    store = IngestCheckpointStore(
+        storage, "checkpoints", window_size=2, incremental=incremental
+    )
+    await store.load()
+
+    await store.mark_processed_many(
+        CheckpointRecord(source="+1", timestamp=timestamp, enqueued_at=0.0)
+        for timestamp in (1, 2, 3)
+    )
+
+    storage.append_many.assert_awaited_once()
+    assert not await store.is_duplicate("+1", 1)
+    assert await store.is_duplicate("+1", 2)
+    assert await store.is_duplicate("+1", 3)
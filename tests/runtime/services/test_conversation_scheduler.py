@@ -0,0 +1,134 @@
+"""Tests for the work-stealing conversation scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from signal_client.observability.metrics import CONVERSATION_STEALS
+from signal_client.runtime.models import QueuedMessage
+from signal_client.runtime.services.conversation_scheduler import (
+    ConversationScheduler,
+)
+
+
+def _queued(recipient: str, raw: str) -> QueuedMessage:
+    return QueuedMessage(raw=raw, enqueued_at=0.0, recipient=recipient)
+
+
+def _steals() -> float:
+    return CONVERSATION_STEALS._value.get()  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio
+async def test_lane_keeps_conversation_in_order() -> None:
+    """Test that a lane returns one conversation's messages in FIFO order."""
+    scheduler = ConversationScheduler(1)
+    for idx in range(3):
+        scheduler.put_nowait(_queued("chat", str(idx)), 0)
+    lane = scheduler.lane(0)
+
+    taken = [lane.get_nowait() for _ in range(3)]
+
+    assert [item.raw for item in taken if item] == ["0", "1", "2"]
+    assert scheduler.qsize() == 0
+
+
+@pytest.mark.asyncio
+async def test_conversation_is_not_claimed_while_in_flight() -> None:
+    """Test that a second lane cannot take a conversation another lane holds."""
+    scheduler = ConversationScheduler(2, quantum=1)
+    scheduler.put_nowait(_queued("chat", "first"), 0)
+    scheduler.put_nowait(_queued("chat", "second"), 0)
+    owner = scheduler.lane(0)
+    other = scheduler.lane(1)
+
+    first = owner.get_nowait()
+    assert first is not None
+    # The quantum is used up, but the first message is still in flight.
+    assert owner.get_nowait() is None
+    assert other.get_nowait() is None
+
+    owner.task_done(first)
+    second = other.get_nowait()
+
+    assert second is not None
+    assert second.raw == "second"
+
+
+@pytest.mark.asyncio
+async def test_idle_lane_steals_from_busy_shard() -> None:
+    """Test that an idle lane takes a waiting conversation of another shard."""
+    scheduler = ConversationScheduler(2)
+    scheduler.put_nowait(_queued("hot", "h1"), 0)
+    scheduler.put_nowait(_queued("cold", "c1"), 0)
+    home = scheduler.lane(0)
+    thief = scheduler.lane(1)
+    steals_before = _steals()
+
+    hot = home.get_nowait()
+    stolen = thief.get_nowait()
+
+    assert hot is not None
+    assert hot.raw == "h1"
+    assert stolen is not None
+    assert stolen.raw == "c1"
+    assert _steals() == steals_before + 1
+
+
+@pytest.mark.asyncio
+async def test_put_wakes_waiting_lane_and_join_waits_for_task_done() -> None:
+    """Test that a parked lane is woken by put and join tracks completion."""
+    scheduler = ConversationScheduler(1)
+    lane = scheduler.lane(0)
+    getter = asyncio.create_task(lane.get())
+    await asyncio.sleep(0)
+
+    scheduler.put_nowait(_queued("chat", "hello"), 0)
+    queued = await asyncio.wait_for(getter, timeout=1)
+    joiner = asyncio.create_task(scheduler.join())
+    await asyncio.sleep(0)
+
+    assert queued is not None
+    assert not joiner.done()
+    lane.task_done(queued)
+    await asyncio.wait_for(joiner, timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_close_wakes_idle_lane() -> None:
+    """Test that closing a lane makes a parked get return None."""
+    scheduler = ConversationScheduler(1)
+    lane = scheduler.lane(0)
+    getter = asyncio.create_task(lane.get())
+    await asyncio.sleep(0)
+
+    lane.close()
+
+    assert await asyncio.wait_for(getter, timeout=1) is None
+
+
+@pytest.mark.asyncio
+async def test_put_blocks_until_capacity_frees() -> None:
+    """Test that put waits while the scheduler is full."""
+    scheduler = ConversationScheduler(1, maxsize=1)
+    scheduler.put_nowait(_queued("chat", "first"), 0)
+    with pytest.raises(asyncio.QueueFull):
+        scheduler.put_nowait(_queued("chat", "second"), 0)
+    putter = asyncio.create_task(scheduler.put(_queued("chat", "second"), 0))
+    await asyncio.sleep(0)
+    assert not putter.done()
+
+    assert scheduler.lane(0).get_nowait() is not None
+    await asyncio.wait_for(putter, timeout=1)
+
+    assert scheduler.qsize() == 1
+
+
+def test_task_done_rejects_unknown_message() -> None:
+    """Test that task_done fails for a message that was never handed out."""
+    scheduler = ConversationScheduler(1)
+
+    with pytest.raises(ValueError, match="not in flight"):
+        scheduler.task_done(_queued("chat", "never"))
@@ -0,0 +1,61 @@
+"""Tests for ingest pauses and resumes."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from signal_client.runtime.services.intake_controller import IntakeController
+
+
+@pytest.mark.asyncio
+async def test_wait_returns_immediately_when_not_paused() -> None:
+    """Test that an unpaused controller does not block intake."""
+    controller = IntakeController()
+
+    await asyncio.wait_for(controller.wait_if_paused(), timeout=0.1)
+
+    assert controller.snapshot()["paused"] is False
+
+
+@pytest.mark.asyncio
+async def test_pause_resumes_when_duration_elapses() -> None:
+    """Test that waiters are released by the resume timer."""
+    controller = IntakeController()
+    await controller.pause(reason="test", duration=0.05)
+    started = time.monotonic()
+
+    await asyncio.wait_for(controller.wait_if_paused(), timeout=1)
+
+    assert time.monotonic() - started >= 0.04
+    assert controller.snapshot()["paused"] is False
+
+
+@pytest.mark.asyncio
+async def test_resume_now_wakes_waiters_immediately() -> None:
+    """Test that resume_now releases waiters before the pause ends."""
+    controller = IntakeController()
+    await controller.pause(reason="test", duration=60)
+    waiters = [asyncio.create_task(controller.wait_if_paused()) for _ in range(3)]
+    await asyncio.sleep(0)
+    assert not any(waiter.done() for waiter in waiters)
+
+    await controller.resume_now()
+
+    await asyncio.wait_for(asyncio.gather(*waiters), timeout=0.1)
+
+
+@pytest.mark.asyncio
+async def test_longer_pause_extends_and_shorter_pause_does_not_shorten() -> None:
+    """Test that overlapping pauses keep the latest deadline."""
+    controller = IntakeController()
+    await controller.pause(reason="test", duration=0.05)
+    await controller.pause(reason="test", duration=0.2)
+    await controller.pause(reason="test", duration=0.01)
+    waiter = asyncio.create_task(controller.wait_if_paused())
+
+    await asyncio.sleep(0.1)
+    assert not waiter.done()
+    await asyncio.wait_for(waiter, timeout=1)
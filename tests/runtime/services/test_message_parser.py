@@ -8,6 +8,7 @@ from unittest.mock import AsyncMock
 
 import pytest
 
+from signal_client.adapters.api.schemas.fast_message import FastMessage, FastQuote
 from signal_client.adapters.api.schemas.message import Message, MessageType
 from signal_client.runtime.command_router import CommandRouter
 from signal_client.runtime.services.message_parser import MessageParser
@@ -278,3 +279,246 @@ def test_parse_message_with_no_message_body(message_parser: MessageParser) -> No
     message = message_parser.parse(raw_message_str)
     assert message is not None
     assert message.message is None
+
+
+@pytest.mark.parametrize(
+    ("envelope_body", "expected_text"),
+    [
+        ({"dataMessage": {"message": "!ping"}}, "!ping"),
+        ({"dataMessage": {"message": None, "timestamp": TIMESTAMP}}, ""),
+        ({"syncMessage": {"sentMessage": {"message": "!sync"}}}, "!sync"),
+        (
+            {"dataMessage": {"editMessage": {"dataMessage": {"message": "!edit"}}}},
+            "!edit",
+        ),
+    ],
+)
+def test_preview_reads_message_text(
+    message_parser: MessageParser, envelope_body: dict, expected_text: str
+) -> None:
+    """Test that previews expose the same text a full parse would."""
+    raw_message_str = json.dumps(
+        {"envelope": {"source": "+1", "timestamp": TIMESTAMP, **envelope_body}}
+    )
+
+    preview = message_parser.preview(raw_message_str)
+
+    assert preview is not None
+    assert preview.text == expected_text
+    assert (preview.source, preview.timestamp) == ("+1", TIMESTAMP)
+    message = message_parser.parse(raw_message_str)
+    assert message is not None
+    assert (message.message or "") == expected_text
+
+
+@pytest.mark.parametrize(
+    "raw_message_str",
+    [
+        '{"envelope":',
+        json.dumps({"envelope": {"source": "+1", "timestamp": TIMESTAMP}}),
+        json.dumps({"envelope": {"timestamp": TIMESTAMP, "dataMessage": {}}}),
+        json.dumps(
+            {"envelope": {"source": "+1", "timestamp": "1", "dataMessage": {"a": 1}}}
+        ),
+        json.dumps(
+            {
+                "envelope": {
+                    "source": "+1",
+                    "timestamp": TIMESTAMP,
+                    "typingMessage": {"action": "STARTED"},
+                }
+            }
+        ),
+    ],
+)
+def test_preview_defers_to_full_parse(
+    message_parser: MessageParser, raw_message_str: str
+) -> None:
+    """Test that anything but a plain chat message yields no preview."""
+    assert message_parser.preview(raw_message_str) is None
+
+
+@pytest.mark.parametrize(
+    "envelope_body",
+    [
+        {"dataMessage": {"message": "hi"}},
+        {"dataMessage": {"message": "hi", "groupInfo": {"groupId": "group-1"}}},
+        {"syncMessage": {"sentMessage": {"message": "hi", "destination": "+2"}}},
+        {"syncMessage": {"sentMessage": {"message": "hi", "destination": "+1"}}},
+        {"typingMessage": {"action": "STARTED", "groupId": "group-2"}},
+        {"typingMessage": {"action": "STARTED"}},
+        {"receiptMessage": {"when": TIMESTAMP}, "groupInfo": {"groupId": "group-3"}},
+        {"callMessage": {}},
+    ],
+)
+def test_routing_key_matches_validated_recipient(
+    message_parser: MessageParser, envelope_body: dict
+) -> None:
+    """Test that the unvalidated shard key agrees with the validated recipient."""
+    raw_message_str = json.dumps(
+        {"envelope": {"source": "+1", "timestamp": TIMESTAMP, **envelope_body}}
+    )
+
+    decoded = message_parser.decode(raw_message_str)
+
+    assert decoded.routing_key() == message_parser.recipient_from_raw(raw_message_str)
+
+
+def test_decoded_envelope_validates_event_once(message_parser: MessageParser) -> None:
+    """Test that the decoded envelope caches its validated event."""
+    decoded = message_parser.decode(
+        json.dumps(
+            {
+                "envelope": {
+                    "source": "+1",
+                    "timestamp": TIMESTAMP,
+                    "dataMessage": {"message": "hi"},
+                }
+            }
+        )
+    )
+
+    message = decoded.message()
+
+    assert message is not None
+    assert decoded.message() is message
+    assert decoded.event() is decoded.event()
+    assert message_parser.decode("[1, 2]").message() is None
+
+
+FAST_MODEL_FIELDS = (
+    "id",
+    "message",
+    "source",
+    "destination",
+    "timestamp",
+    "type",
+    "group",
+    "reaction_emoji",
+    "reaction_target_author",
+    "reaction_target_timestamp",
+    "target_sent_timestamp",
+    "remote_delete_timestamp",
+    "attachments_local_filenames",
+    "mentions",
+)
+
+
+@pytest.mark.parametrize(
+    "envelope_body",
+    [
+        {
+            "dataMessage": {
+                "id": "6f1c2f04-8d7e-4a3e-9e3b-1f2d3c4b5a69",
+                "message": "hi",
+                "groupInfo": {"groupId": "group-1"},
+                "mentions": [{"number": "+2", "start": 0, "length": 1}],
+                "attachments": [
+                    {"id": "a1", "contentType": "image/png", "filename": "a.png"},
+                    {"id": "a2", "size": "42"},
+                ],
+                "quote": {"id": 7, "author": "+3", "text": "quoted"},
+            }
+        },
+        {"syncMessage": {"sentMessage": {"message": "sent", "destination": "+2"}}},
+        {
+            "dataMessage": {
+                "editMessage": {
+                    "targetSentTimestamp": 5,
+                    "dataMessage": {"message": "edited"},
+                }
+            }
+        },
+        {"dataMessage": {"remoteDelete": {"timestamp": 9}}},
+        {
+            "dataMessage": {
+                "reaction": {
+                    "emoji": "+1",
+                    "targetAuthor": "+2",
+                    "targetSentTimestamp": 3,
+                }
+            }
+        },
+    ],
+)
+def test_fast_models_match_pydantic_models(envelope_body: dict) -> None:
+    """Test that fast models expose the same values as the pydantic models."""
+    raw_message_str = json.dumps(
+        {"envelope": {"source": "+1", "timestamp": TIMESTAMP, **envelope_body}}
+    )
+
+    expected = MessageParser().parse(raw_message_str)
+    fast = MessageParser(fast_models=True).parse(raw_message_str)
+
+    assert expected is not None
+    assert fast is not None
+    for field in FAST_MODEL_FIELDS:
+        if field == "id" and "id" not in envelope_body.get("dataMessage", {}):
+            continue
+        assert getattr(fast, field) == getattr(expected, field), field
+    for method in ("recipient", "is_group", "is_private"):
+        assert getattr(fast, method)() == getattr(expected, method)()
+    assert fast.is_sync == expected.is_sync
+    assert fast.get_target_chat("+1") == expected.get_target_chat("+1")
+    assert fast.get_target_chat("+9") == expected.get_target_chat("+9")
+    assert fast.is_reply_to("+3") == expected.is_reply_to("+3")
+    expected_attachments = [
+        (a.id, a.content_type, a.filename, a.size) for a in expected.attachments or []
+    ]
+    fast_attachments = [
+        (a.id, a.content_type, a.filename, a.size) for a in fast.attachments or []
+    ]
+    assert fast_attachments == expected_attachments
+
+
+def test_fast_models_reject_payloads_without_sender(
+    message_parser: MessageParser,
+) -> None:
+    """Test that fast models skip envelopes that are not chat messages."""
+    fast_parser = MessageParser(fast_models=True)
+    for envelope in (
+        {"source": "+1", "timestamp": TIMESTAMP, "typingMessage": {}},
+        {"source": "+1", "timestamp": "soon", "dataMessage": {"message": "hi"}},
+        {"timestamp": TIMESTAMP, "dataMessage": {"message": "hi"}},
+    ):
+        assert fast_parser.parse(json.dumps({"envelope": envelope})) is None
+    assert message_parser.parse(json.dumps({"envelope": {}})) is None
+
+
+def test_fast_models_build_sub_structures_on_access(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that fast models only build attachments and quotes when read."""
+    built: list[object] = []
+    original = FastQuote.from_raw
+
+    def tracking_from_raw(raw: object) -> FastQuote | None:
+        built.append(raw)
+        return original(raw)
+
+    monkeypatch.setattr(FastQuote, "from_raw", staticmethod(tracking_from_raw))
+    raw_message_str = json.dumps(
+        {
+            "envelope": {
+                "source": "+1",
+                "timestamp": TIMESTAMP,
+                "dataMessage": {
+                    "message": "hi",
+                    "quote": {"id": 7, "author": "+3", "text": "quoted"},
+                },
+            }
+        }
+    )
+
+    message = MessageParser(fast_models=True).parse(raw_message_str)
+
+    assert isinstance(message, FastMessage)
+    assert built == []
+    assert message.quote is not None
+    assert message.quote.author == "+3"
+    assert message.quote is message.quote
+    assert len(built) == 1
+    assert message.attachments is None
+
+    message.mentions = ["+4"]
+    assert message.mentions == ["+4"]
@@ -0,0 +1,94 @@
+"""Opt-in message parsing benchmark: pydantic models versus fast models.
+
+Set RUN_PERFORMANCE_TESTS=1 and run with `pytest -m performance -s` to see the
+cost of building a chat message with each model type, with and without the
+JSON decode of the websocket frame.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from collections.abc import Callable
+from typing import cast
+
+import pytest
+
+from signal_client.adapters.api.schemas.events import MessageEvent
+from signal_client.adapters.api.schemas.fast_message import FastMessage
+from signal_client.adapters.api.schemas.message import Message
+from signal_client.runtime.services.message_parser import MessageParser
+
+pytestmark = [
+    pytest.mark.performance,
+    pytest.mark.skipif(
+        bool(os.environ.get("CI")),
+        reason="Performance benchmark is disabled on CI runners.",
+    ),
+    pytest.mark.skipif(
+        not bool(os.environ.get("RUN_PERFORMANCE_TESTS")),
+        reason=(
+            "Performance benchmark is opt-in; set RUN_PERFORMANCE_TESTS=1 to enable."
+        ),
+    ),
+]
+
+NUM_MESSAGES = 10000
+FRAME = json.dumps(
+    {
+        "envelope": {
+            "source": "+15550001111",
+            "sourceNumber": "+15550001111",
+            "sourceUuid": "2f1c8b4e-5d0a-4c8f-9a3e-7b6d5c4b3a21",
+            "sourceDevice": 1,
+            "timestamp": 1_700_000_000_000,
+            "dataMessage": {
+                "timestamp": 1_700_000_000_000,
+                "message": "just chatting about the weekend plans",
+                "groupInfo": {"groupId": "Z3JvdXAtaWQtYmFzZTY0", "type": "DELIVER"},
+                "mentions": [{"number": "+15550002222", "start": 0, "length": 1}],
+            },
+        }
+    }
+)
+
+
+def _microseconds_per_call(build: Callable[[], Message | None]) -> float:
+    start = time.perf_counter()
+    for _ in range(NUM_MESSAGES):
+        message = build()
+    duration = time.perf_counter() - start
+    assert message is not None
+    assert message.recipient() == "Z3JvdXAtaWQtYmFzZTY0"
+    return duration / NUM_MESSAGES * 1_000_000
+
+
+def test_fast_models_parse_cost() -> None:
+    """Compare per-message cost of pydantic and fast models.
+
+    Model construction is measured from an already decoded envelope, and the
+    full parse adds the JSON decode with the active serialization backend.
+    """
+    pydantic_parser = MessageParser()
+    fast_parser = MessageParser(fast_models=True)
+    envelope = json.loads(FRAME)["envelope"]
+
+    def pydantic_build() -> Message | None:
+        event = pydantic_parser.event_from_envelope(envelope)
+        return event.message if isinstance(event, MessageEvent) else None
+
+    def fast_build() -> Message | None:
+        return cast("Message | None", FastMessage.from_envelope(envelope))
+
+    pydantic_model = _microseconds_per_call(pydantic_build)
+    fast_model = _microseconds_per_call(fast_build)
+    pydantic_parse = _microseconds_per_call(lambda: pydantic_parser.parse(FRAME))
+    fast_parse = _microseconds_per_call(lambda: fast_parser.parse(FRAME))
+
+    print(f"model build: pydantic {pydantic_model:.2f} us, fast {fast_model:.2f} us")
+    print(f"full parse: pydantic {pydantic_parse:.2f} us, fast {fast_parse:.2f} us")
+    print(f"model build speedup: {pydantic_model / fast_model:.1f}x")
+
+    assert fast_model * 3 < pydantic_model
+    assert fast_parse < pydantic_parse
@@ -8,8 +8,10 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from signal_client.adapters.storage.memory import MemoryStorage
 from signal_client.runtime.listener import BackpressurePolicy, MessageService
 from signal_client.runtime.models import QueuedMessage
+from signal_client.runtime.services.persistent_queue import PersistentQueue
 
 
 @pytest.fixture
@@ -73,6 +75,38 @@ async def test_listen_drops_oldest_when_queue_full(mock_websocket_client):
     dead_letter_queue.send.assert_not_called()
 
 
+@pytest.mark.asyncio
+async def test_listen_applies_backpressure_to_selected_queue(mock_websocket_client):
+    """Test that a queue selector routes messages and bounds each queue."""
+    messages = [json.dumps({"to": "a", "idx": idx}) for idx in (1, 2)]
+    messages.append(json.dumps({"to": "b", "idx": 3}))
+
+    async def async_generator():
+        for msg in messages:
+            yield msg
+
+    mock_websocket_client.listen.return_value = async_generator()
+    queues: dict[str, asyncio.Queue[QueuedMessage]] = {
+        "a": asyncio.Queue(maxsize=1),
+        "b": asyncio.Queue(maxsize=1),
+    }
+    unused: asyncio.Queue[QueuedMessage] = asyncio.Queue()
+    service = MessageService(
+        mock_websocket_client,
+        unused,
+        enqueue_timeout=0.01,
+        backpressure_policy=BackpressurePolicy.DROP_OLDEST,
+        queue_selector=lambda queued: queues[json.loads(queued.raw)["to"]],
+        queue_depth_getter=lambda: sum(queue.qsize() for queue in queues.values()),
+    )
+
+    await asyncio.wait_for(service.listen(), timeout=1)
+
+    assert unused.empty()
+    assert queues["a"].get_nowait().raw == messages[1]
+    assert queues["b"].get_nowait().raw == messages[2]
+
+
 @pytest.mark.asyncio
 async def test_listen_sends_to_dlq_when_drop_disabled(mock_websocket_client):
     """Test that listen sends to the DLQ when drop is disabled."""
@@ -154,3 +188,67 @@ async def test_integration_websocket_to_queue():
     for msg in messages:
         queued = await real_queue.get()
         assert queued.raw == msg
+
+
+@pytest.mark.asyncio
+async def test_listen_acks_durable_messages_that_leave_the_pipeline(
+    mock_websocket_client,
+):
+    """Test that dropped messages do not hold back the durable queue."""
+    messages = [json.dumps({"idx": 1}), json.dumps({"idx": 2})]
+
+    async def async_generator():
+        for msg in messages:
+            yield msg
+
+    mock_websocket_client.listen.return_value = async_generator()
+    queue: asyncio.Queue[QueuedMessage] = asyncio.Queue(maxsize=1)
+    persistent_queue = PersistentQueue(MemoryStorage(), "ingest")
+    service = MessageService(
+        mock_websocket_client,
+        queue,
+        persistent_queue=persistent_queue,
+        enqueue_timeout=0.01,
+        backpressure_policy=BackpressurePolicy.DROP_OLDEST,
+    )
+
+    await asyncio.wait_for(service.listen(), timeout=1)
+
+    # The oldest message was dropped and acknowledged; the survivor is pending.
+    assert persistent_queue.low_watermark == 1
+    queued = await queue.get()
+    assert queued.ack is not None
+    queued.ack()
+    assert persistent_queue.low_watermark == 2
+
+
+@pytest.mark.asyncio
+async def test_listen_persists_but_holds_dispatch_until_gate_opens(
+    mock_websocket_client,
+):
+    """Test that live messages wait behind a replay backlog before dispatch."""
+    messages = [json.dumps({"idx": 1}), json.dumps({"idx": 2})]
+
+    async def async_generator():
+        for msg in messages:
+            yield msg
+
+    mock_websocket_client.listen.return_value = async_generator()
+    queue: asyncio.Queue[QueuedMessage] = asyncio.Queue()
+    persistent_queue = PersistentQueue(MemoryStorage(), "ingest")
+    gate = asyncio.Event()
+    service = MessageService(
+        mock_websocket_client,
+        queue,
+        persistent_queue=persistent_queue,
+        dispatch_gate=gate,
+    )
+
+    listen_task = asyncio.create_task(service.listen())
+    await asyncio.sleep(0.05)
+    assert queue.empty()
+    assert await persistent_queue.length() == 1
+
+    gate.set()
+    await asyncio.wait_for(listen_task, timeout=1)
+    assert [(await queue.get()).raw for _ in messages] == messages
@@ -0,0 +1,310 @@
+"""Tests for the durable ingest queue."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from signal_client.adapters.storage.memory import MemoryStorage
+from signal_client.app import Application
+from signal_client.core.config import Settings
+from signal_client.runtime.services.persistent_queue import PersistentQueue
+
+
+@pytest.mark.asyncio
+async def test_append_tracks_length_without_reading_records() -> None:
+    """Test that appends never read the stored records back."""
+    storage = MemoryStorage()
+    storage.read_all = AsyncMock(wraps=storage.read_all)  # type: ignore[method-assign]
+    storage.length = AsyncMock(wraps=storage.length)  # type: ignore[method-assign]
+    queue = PersistentQueue(storage, "ingest", max_length=3)
+
+    for idx in range(5):
+        await queue.append(f"msg-{idx}", enqueued_at=float(idx))
+
+    storage.read_all.assert_not_awaited()
+    # The stored length is looked up once and tracked in memory afterwards.
+    assert storage.length.await_count == 1
+    assert await queue.length() == 3
+    stored = await MemoryStorage.read_all(storage, "ingest")
+    assert [record["raw"] for record in stored] == ["msg-2", "msg-3", "msg-4"]
+
+
+@pytest.mark.asyncio
+async def test_length_resumes_from_existing_records() -> None:
+    """Test that a new queue picks up records persisted by a previous run."""
+    storage = MemoryStorage()
+    await storage.append_many(
+        "ingest",
+        [{"raw": "old", "enqueued_at": 1.0}, {"raw": "old", "enqueued_at": 2.0}],
+    )
+    queue = PersistentQueue(storage, "ingest", max_length=2)
+
+    await queue.append("new", enqueued_at=3.0)
+
+    assert await queue.length() == 2
+    assert [message.raw for message in await queue.replay()] == ["old", "new"]
+
+
+@pytest.mark.asyncio
+async def test_compact_and_clear_reset_tracked_length() -> None:
+    """Test that compaction and clearing keep the tracked length accurate."""
+    queue = PersistentQueue(MemoryStorage(), "ingest")
+    for idx in range(4):
+        await queue.append(f"msg-{idx}", enqueued_at=float(idx + 1))
+
+    await queue.compact(min_timestamp=3)
+    assert await queue.length() == 2
+
+    await queue.clear()
+    assert await queue.length() == 0
+
+
+@pytest.mark.asyncio
+async def test_append_assigns_monotonic_sequence_numbers() -> None:
+    """Test that each persisted message records its sequence number."""
+    storage = MemoryStorage()
+    queue = PersistentQueue(storage, "ingest")
+
+    assert [await queue.append(f"msg-{idx}") for idx in range(3)] == [0, 1, 2]
+    assert [record["seq"] for record in await storage.read_all("ingest")] == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_out_of_order_acks_advance_low_watermark() -> None:
+    """Test that the low-watermark only moves past contiguous acknowledgements."""
+    queue = PersistentQueue(MemoryStorage(), "ingest")
+    for idx in range(4):
+        await queue.append(f"msg-{idx}")
+
+    queue.ack(1)
+    queue.ack(2)
+    assert queue.low_watermark == 0
+    assert await queue.compact_acked() == 0
+
+    queue.ack(0)
+    assert queue.low_watermark == 3
+    assert await queue.compact_acked() == 3
+    assert [message.raw for message in await queue.replay()] == ["msg-3"]
+
+
+@pytest.mark.asyncio
+async def test_restart_replays_only_unacked_tail() -> None:
+    """Test that a new process only replays messages that were never acked."""
+    storage = MemoryStorage()
+    queue = PersistentQueue(storage, "ingest")
+    for idx in range(3):
+        await queue.append(f"msg-{idx}")
+    queue.ack(0)
+    queue.ack(1)
+    await queue.close()
+
+    restarted = PersistentQueue(storage, "ingest")
+    replayed = await restarted.replay()
+
+    assert [(message.seq, message.raw) for message in replayed] == [(2, "msg-2")]
+    assert await restarted.append("msg-3") == 3
+    restarted.ack(2)
+    await restarted.compact_acked()
+    assert [message.raw for message in await restarted.replay()] == ["msg-3"]
+
+
+@pytest.mark.asyncio
+async def test_background_task_removes_acked_messages() -> None:
+    """Test that start() compacts acknowledged messages periodically."""
+    storage = MemoryStorage()
+    queue = PersistentQueue(storage, "ingest", compaction_interval=0.01)
+    queue.start()
+    seq = await queue.append("msg")
+    queue.ack(seq)
+
+    await asyncio.sleep(0.05)
+    assert await storage.read_all("ingest") == []
+
+    await queue.close()
+    assert queue._compaction_task is None
+
+
+@pytest.mark.asyncio
+async def test_replay_stream_reads_in_pages_and_skips_live_appends() -> None:
+    """Test that streaming replay pages through the backlog present at start."""
+    storage = MemoryStorage()
+    queue = PersistentQueue(storage, "ingest")
+    for idx in range(5):
+        await queue.append(f"msg-{idx}")
+    storage.read_range = AsyncMock(wraps=storage.read_range)  # type: ignore[method-assign]
+    storage.read_all = AsyncMock(wraps=storage.read_all)  # type: ignore[method-assign]
+
+    restarted = PersistentQueue(storage, "ingest")
+    replayed = []
+    async for message in restarted.replay_stream(page_size=2):
+        replayed.append(message)
+        if message.seq == 0:
+            await restarted.append("live")
+
+    assert [message.raw for message in replayed] == [f"msg-{idx}" for idx in range(5)]
+    assert [message.seq for message in replayed] == [0, 1, 2, 3, 4]
+    storage.read_all.assert_not_awaited()
+    # One lookup of the newest record, then three pages of at most two records.
+    assert storage.read_range.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_append_while_replay_pending_is_not_replayed() -> None:
+    """Test that appends after the backlog snapshot keep their own tracking."""
+    storage = MemoryStorage()
+    queue = PersistentQueue(storage, "ingest")
+    for idx in range(3):
+        await queue.append(f"msg-{idx}")
+
+    restarted = PersistentQueue(storage, "ingest")
+    backlog = await restarted.begin_replay()
+    # Ingest runs before the replay task reads its first page.
+    live_seq = await restarted.append("live")
+    replayed = [message async for message in restarted.replay_stream(backlog=backlog)]
+
+    assert [message.raw for message in replayed] == ["msg-0", "msg-1", "msg-2"]
+    for message in replayed:
+        assert message.seq is not None
+        restarted.ack(message.seq)
+    assert restarted.low_watermark == live_seq
+    restarted.ack(live_seq)
+    assert restarted.low_watermark == live_seq + 1
+
+
+@pytest.mark.asyncio
+async def test_replay_stream_tolerates_compaction_between_pages() -> None:
+    """Test that acknowledged records compacted mid-stream are not re-read."""
+    storage = MemoryStorage()
+    queue = PersistentQueue(storage, "ingest")
+    for idx in range(4):
+        await queue.append(f"msg-{idx}")
+
+    restarted = PersistentQueue(storage, "ingest")
+    replayed = []
+    async for message in restarted.replay_stream(page_size=2):
+        replayed.append(message.raw)
+        assert message.seq is not None
+        restarted.ack(message.seq)
+        await restarted.compact_acked()
+
+    assert replayed == ["msg-0", "msg-1", "msg-2", "msg-3"]
+    assert await storage.read_all("ingest") == []
+
+
+@pytest.mark.asyncio
+async def test_replay_stream_releases_records_truncated_mid_stream() -> None:
+    """Test that records trimmed away mid-replay stop pinning the watermark."""
+    storage = MemoryStorage()
+    queue = PersistentQueue(storage, "ingest")
+    for idx in range(5):
+        await queue.append(f"msg-{idx}")
+
+    restarted = PersistentQueue(storage, "ingest", max_length=5)
+    backlog = await restarted.begin_replay()
+    handled = []
+    async for message in restarted.replay_stream(page_size=2, backlog=backlog):
+        assert message.seq is not None
+        handled.append(message.seq)
+        if message.seq == 0:
+            # Live ingest pushes msg-0..msg-2 out of the capped store.
+            handled.extend([await restarted.append(f"live-{idx}") for idx in range(3)])
+
+    assert sorted(handled) == [0, 1, 3, 4, 5, 6, 7]
+    for seq in handled:
+        restarted.ack(seq)
+    assert restarted.low_watermark == 8
+    assert await restarted.compact_acked() == 5
+    assert await storage.read_all("ingest") == []
+
+
+@pytest.mark.asyncio
+async def test_replay_stream_releases_backlog_when_storage_fails() -> None:
+    """Test that a failed page read releases the rest of the backlog."""
+    storage = MemoryStorage()
+    queue = PersistentQueue(storage, "ingest")
+    for idx in range(4):
+        await queue.append(f"msg-{idx}")
+
+    restarted = PersistentQueue(storage, "ingest")
+    backlog = await restarted.begin_replay()
+    storage.read_range = AsyncMock(side_effect=OSError("disk gone"))  # type: ignore[method-assign]
+
+    with pytest.raises(OSError, match="disk gone"):
+        async for _ in restarted.replay_stream(backlog=backlog):
+            pass
+
+    assert restarted.low_watermark == backlog.stop
+
+
+@pytest.mark.asyncio
+async def test_application_streams_backlog_larger_than_queue() -> None:
+    """Test that streaming replay recovers a backlog that exceeds queue_size."""
+    settings = Settings.from_sources(
+        config={
+            "phone_number": "+15550000001",
+            "signal_service": "http://localhost:8080",
+            "base_url": "http://localhost:8080",
+            "durable_queue_enabled": True,
+            "durable_queue_streaming_replay": True,
+            "durable_queue_replay_page_size": 2,
+            "queue_size": 2,
+        }
+    )
+    app = Application(settings)
+    backlog = PersistentQueue(app.storage, settings.ingest_queue_name)
+    for idx in range(5):
+        await backlog.append(f"msg-{idx}")
+
+    await app.initialize()
+    assert app.queue is not None
+    received = []
+    for _ in range(5):
+        queued = await asyncio.wait_for(app.queue.get(), timeout=1)
+        received.append(queued.raw)
+        assert queued.ack is not None
+        queued.ack()
+
+    assert received == [f"msg-{idx}" for idx in range(5)]
+    await app.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_application_dispatches_live_messages_after_backlog() -> None:
+    """Test that live ingest is held until the streamed backlog is queued."""
+    settings = Settings.from_sources(
+        config={
+            "phone_number": "+15550000001",
+            "signal_service": "http://localhost:8080",
+            "base_url": "http://localhost:8080",
+            "durable_queue_enabled": True,
+            "durable_queue_streaming_replay": True,
+            "durable_queue_replay_page_size": 2,
+            "queue_size": 2,
+        }
+    )
+    app = Application(settings)
+    backlog = PersistentQueue(app.storage, settings.ingest_queue_name)
+    for idx in range(3):
+        await backlog.append(f"msg-{idx}")
+
+    async def live_messages():
+        yield "live"
+
+    await app.initialize()
+    assert app.queue is not None
+    assert app.message_service is not None
+    websocket = AsyncMock()
+    websocket.listen = MagicMock(return_value=live_messages())
+    app.message_service.set_websocket_client(websocket)
+    listen_task = asyncio.create_task(app.message_service.listen())
+    received = []
+    for _ in range(4):
+        queued = await asyncio.wait_for(app.queue.get(), timeout=1)
+        received.append(queued.raw)
+
+    assert received == ["msg-0", "msg-1", "msg-2", "live"]
+    await listen_task
+    await app.shutdown()
@@ -0,0 +1,102 @@
+"""Tests for running command handlers in a process pool."""
+
+from __future__ import annotations
+
+import os
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from signal_client.adapters.api.schemas.message import Message, MessageType
+from signal_client.core.command import CommandError, command
+from signal_client.runtime.services.process_executor import (
+    MessageSnapshot,
+    ProcessCommandExecutor,
+    ProcessContext,
+    resolve_handler,
+)
+
+
+@command("!pid", executor="process")
+async def report_pid(context: ProcessContext) -> None:
+    """Reply with the handler's process id."""
+    await context.reply_text(f"{os.getpid()}:{context.message.message}")
+    await context.react("👍")
+
+
+@command("!slow", executor="process", timeout=0.05)
+def slow_handler(context: ProcessContext) -> None:
+    """Block the worker process past the command timeout."""
+    _ = context
+    time.sleep(0.5)
+
+
+def _context(text: str) -> SimpleNamespace:
+    message = Message(
+        source="+1",
+        timestamp=1,
+        type=MessageType.DATA_MESSAGE,
+        message=text,
+    )
+    return SimpleNamespace(
+        message=message,
+        reply_text=AsyncMock(),
+        react=AsyncMock(),
+    )
+
+
+def test_resolve_handler_unwraps_command() -> None:
+    """Test that a decorated handler is found by module and qualified name."""
+    handler = resolve_handler(__name__, "report_pid")
+
+    assert handler is report_pid.handle
+
+
+def test_process_handler_must_be_importable() -> None:
+    """Test that nested process handlers are rejected at decoration time."""
+    with pytest.raises(ValueError, match="module level"):
+
+        @command("!nested", executor="process")
+        async def nested(context: ProcessContext) -> None:
+            _ = context
+
+
+@pytest.mark.asyncio
+async def test_executor_runs_handler_in_child_and_replays_actions() -> None:
+    """Test that actions recorded in the worker process are replayed in order."""
+    executor = ProcessCommandExecutor(max_workers=1)
+    context = _context("!pid")
+    try:
+        await executor.run(report_pid, context)  # type: ignore[arg-type]
+    finally:
+        executor.shutdown()
+
+    reply = context.reply_text.await_args.args[0]
+    pid, text = reply.split(":", 1)
+    assert int(pid) != os.getpid()
+    assert text == "!pid"
+    context.react.assert_awaited_once_with("👍")
+
+
+@pytest.mark.asyncio
+async def test_executor_times_out_without_replaying() -> None:
+    """Test that a handler exceeding its timeout fails the command."""
+    executor = ProcessCommandExecutor(max_workers=1)
+    context = _context("!slow")
+    try:
+        with pytest.raises(CommandError, match="timed out"):
+            await executor.run(slow_handler, context)  # type: ignore[arg-type]
+    finally:
+        executor.shutdown()
+
+    context.reply_text.assert_not_awaited()
+
+
+def test_process_context_rejects_unproxied_actions() -> None:
+    """Test that API clients are not reachable from process handlers."""
+    context = ProcessContext(MessageSnapshot(source="+1", timestamp=1))
+
+    with pytest.raises(AttributeError, match="not available"):
+        _ = context.groups
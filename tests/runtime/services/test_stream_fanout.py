@@ -0,0 +1,413 @@
+"""Tests for fanning ingest out to worker processes over Redis streams.
+
+The Redis tests use the server at REDIS_URL, or start a throwaway
+``redis-server`` (or fakeredis' TCP server) when one is available, and are
+skipped otherwise.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import multiprocessing
+import os
+import shutil
+import socket
+import subprocess
+import threading
+import time
+import uuid
+from collections.abc import Iterator
+from dataclasses import replace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import redis.asyncio as redis
+from redis.asyncio.retry import Retry
+from redis.backoff import NoBackoff
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from signal_client.runtime.models import QueuedMessage
+from signal_client.runtime.services.message_parser import MessageParser
+from signal_client.runtime.services.stream_fanout import (
+    RedisStreamConsumer,
+    RedisStreamPublisher,
+    StreamConfig,
+)
+
+CONVERSATIONS = 12
+MESSAGES_PER_CONVERSATION = 25
+WORKER_PROCESSES = 2
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+@pytest.fixture(scope="module")
+def redis_url() -> Iterator[str]:
+    """Return the URL of a Redis server, starting one if needed."""
+    url = os.environ.get("REDIS_URL")
+    if url:
+        yield url
+        return
+    port = _free_port()
+    binary = shutil.which("redis-server")
+    if binary is None:
+        yield from _fake_redis_url(port)
+        return
+    server = subprocess.Popen(  # noqa: S603
+        [binary, "--port", str(port), "--save", "", "--appendonly", "no"],
+        stdout=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + 5
+        while True:
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+                break
+            except OSError:
+                if time.monotonic() > deadline:
+                    pytest.skip("redis-server did not start.")
+                time.sleep(0.05)
+        yield f"redis://127.0.0.1:{port}/0"
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def _fake_redis_url(port: int) -> Iterator[str]:
+    try:
+        from fakeredis import TcpFakeServer  # noqa: PLC0415
+    except ImportError:
+        pytest.skip("Set REDIS_URL or install redis-server to run stream tests.")
+    server = TcpFakeServer(("127.0.0.1", port))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"redis://127.0.0.1:{port}/0"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _client(url: str) -> redis.Redis:
+    # fakeredis' TCP server drops the connection after an error reply such as
+    # BUSYGROUP; one reconnect keeps the client usable.
+    return redis.from_url(
+        url, retry=Retry(NoBackoff(), 1), retry_on_error=[RedisConnectionError]
+    )
+
+
+def _config(
+    prefix: str,
+    *,
+    worker_index: int = 0,
+    worker_count: int = 1,
+    claim_idle_ms: int = 30000,
+    consumer: str = "",
+) -> StreamConfig:
+    return StreamConfig(
+        prefix=prefix,
+        partitions=8,
+        block_ms=50,
+        worker_index=worker_index,
+        worker_count=worker_count,
+        claim_idle_ms=claim_idle_ms,
+        consumer=consumer or f"consumer-{os.getpid()}",
+    )
+
+
+async def _publish(url: str, prefix: str) -> None:
+    client = _client(url)
+    publisher = RedisStreamPublisher(client, _config(prefix), MessageParser())
+    batch = [
+        QueuedMessage(
+            raw=json.dumps({"conversation": conversation, "seq": seq}),
+            enqueued_at=time.perf_counter(),
+            recipient=f"+{conversation}",
+        )
+        for seq in range(MESSAGES_PER_CONVERSATION)
+        for conversation in range(CONVERSATIONS)
+    ]
+    await publisher.publish(batch)
+    await client.aclose()
+
+
+async def _work(url: str, prefix: str, index: int) -> None:
+    client = _client(url)
+    queue: asyncio.Queue[QueuedMessage] = asyncio.Queue(maxsize=10)
+    consumer = RedisStreamConsumer(
+        client,
+        _config(prefix, worker_index=index, worker_count=WORKER_PROCESSES),
+        queue.put,
+    )
+    reader = asyncio.create_task(consumer.run())
+    while not await client.exists(f"{prefix}:stop"):
+        try:
+            queued_message = await asyncio.wait_for(queue.get(), timeout=0.05)
+        except TimeoutError:
+            continue
+        payload = json.loads(queued_message.raw)
+        record = [payload["conversation"], payload["seq"], os.getpid()]
+        await client.rpush(f"{prefix}:results", json.dumps(record))
+        assert queued_message.ack is not None
+        queued_message.ack()
+    consumer.stop()
+    await reader
+    await client.aclose()
+
+
+def _run_ingest(url: str, prefix: str) -> None:
+    asyncio.run(_publish(url, prefix))
+
+
+def _run_worker(url: str, prefix: str, index: int) -> None:
+    asyncio.run(_work(url, prefix, index))
+
+
+def test_partitions_are_split_between_workers() -> None:
+    """Test that every partition is read by exactly one worker process."""
+    owned = [
+        StreamConfig(
+            partitions=10, worker_index=index, worker_count=3
+        ).owned_partitions()
+        for index in range(3)
+    ]
+
+    assert sorted(p for partitions in owned for p in partitions) == list(range(10))
+    assert StreamConfig().partition_for("+1") == StreamConfig().partition_for("+1")
+
+
+class _FlakyPublisher(RedisStreamPublisher):
+    def __init__(
+        self, failures: int, dead_letter_queue: AsyncMock | None = None
+    ) -> None:
+        super().__init__(
+            MagicMock(),
+            StreamConfig(),
+            MessageParser(),
+            dead_letter_queue=dead_letter_queue,
+            retry_backoff=0,
+        )
+        self.failures = failures
+        self.published: list[str] = []
+
+    async def publish(self, queued_messages: list[QueuedMessage]) -> None:
+        if self.failures:
+            self.failures -= 1
+            message = "connection reset"
+            raise RedisConnectionError(message)
+        self.published.extend(message.raw for message in queued_messages)
+
+
+async def _forward_one(publisher: RedisStreamPublisher) -> MagicMock:
+    queue: asyncio.Queue[QueuedMessage] = asyncio.Queue()
+    ack = MagicMock()
+    await queue.put(QueuedMessage(raw="{}", enqueued_at=0.0, recipient="+1", ack=ack))
+    forward = asyncio.create_task(publisher.forward(queue))
+    try:
+        await asyncio.wait_for(queue.join(), timeout=1)
+    finally:
+        forward.cancel()
+        with contextlib.suppress(asyncio.CancelledError, RedisConnectionError):
+            await forward
+    return ack
+
+
+@pytest.mark.asyncio
+async def test_publisher_retries_transient_failures() -> None:
+    """Test that a failed publish is retried before the batch is acknowledged."""
+    dead_letter_queue = AsyncMock()
+    publisher = _FlakyPublisher(2, dead_letter_queue=dead_letter_queue)
+
+    ack = await _forward_one(publisher)
+
+    assert publisher.published == ["{}"]
+    ack.assert_called_once_with()
+    dead_letter_queue.send.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_publisher_dead_letters_after_last_attempt() -> None:
+    """Test that a batch that keeps failing moves to the DLQ and is acknowledged."""
+    dead_letter_queue = AsyncMock()
+    publisher = _FlakyPublisher(3, dead_letter_queue=dead_letter_queue)
+
+    ack = await _forward_one(publisher)
+
+    assert publisher.published == []
+    dead_letter_queue.send.assert_awaited_once_with(
+        {"raw": "{}", "reason": "stream_publish_failed"}
+    )
+    ack.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test_publisher_raises_without_dead_letter_queue() -> None:
+    """Test that publish failures surface when there is no DLQ to keep them."""
+    publisher = _FlakyPublisher(3)
+    queue: asyncio.Queue[QueuedMessage] = asyncio.Queue()
+    ack = MagicMock()
+    await queue.put(QueuedMessage(raw="{}", enqueued_at=0.0, ack=ack))
+
+    with pytest.raises(RedisConnectionError):
+        await asyncio.wait_for(publisher.forward(queue), timeout=1)
+
+    ack.assert_not_called()
+
+
+def test_worker_processes_share_the_stream(redis_url: str) -> None:
+    """Test that worker processes split conversations and keep their order."""
+    prefix = f"test:{uuid.uuid4().hex}"
+    spawn = multiprocessing.get_context("spawn")
+    workers = [
+        spawn.Process(target=_run_worker, args=(redis_url, prefix, index))
+        for index in range(WORKER_PROCESSES)
+    ]
+    for worker in workers:
+        worker.start()
+    ingest = spawn.Process(target=_run_ingest, args=(redis_url, prefix))
+    ingest.start()
+    ingest.join(timeout=30)
+
+    async def collect() -> tuple[list[list[int]], int]:
+        client = _client(redis_url)
+        total = CONVERSATIONS * MESSAGES_PER_CONVERSATION
+        deadline = time.monotonic() + 30
+        while await client.llen(f"{prefix}:results") < total:
+            assert time.monotonic() < deadline, "workers did not drain the streams"
+            await asyncio.sleep(0.05)
+        await client.set(f"{prefix}:stop", 1)
+        for worker in workers:
+            await asyncio.to_thread(worker.join, 30)
+        records = [
+            json.loads(item) for item in await client.lrange(f"{prefix}:results", 0, -1)
+        ]
+        pending = 0
+        for partition in range(8):
+            summary = await client.xpending(
+                f"{prefix}:{partition}", StreamConfig().group
+            )
+            pending += summary["pending"]
+        await client.aclose()
+        return records, pending
+
+    records, pending = asyncio.run(collect())
+
+    assert ingest.exitcode == 0
+    assert [worker.exitcode for worker in workers] == [0] * WORKER_PROCESSES
+    assert pending == 0
+    assert len({pid for _, _, pid in records}) == WORKER_PROCESSES
+    for conversation in range(CONVERSATIONS):
+        handled = [(seq, pid) for conv, seq, pid in records if conv == conversation]
+        assert [seq for seq, _ in handled] == list(range(MESSAGES_PER_CONVERSATION))
+        assert len({pid for _, pid in handled}) == 1
+
+
+@pytest.mark.asyncio
+async def test_consumer_reclaims_abandoned_entries(redis_url: str) -> None:
+    """Test that entries read by a dead consumer are redelivered and acked."""
+    prefix = f"test:{uuid.uuid4().hex}"
+    client = _client(redis_url)
+    config = _config(prefix, claim_idle_ms=1, consumer="live")
+    stream = config.stream(config.partition_for("+1"))
+    delivered: list[str] = []
+
+    async def enqueue(queued_message: QueuedMessage) -> None:
+        delivered.append(queued_message.raw)
+        assert queued_message.ack is not None
+        queued_message.ack()
+
+    consumer = RedisStreamConsumer(client, config, enqueue)
+    await consumer.ensure_groups()
+    publisher = RedisStreamPublisher(client, config, MessageParser())
+    await publisher.publish([QueuedMessage(raw="{}", enqueued_at=0.0, recipient="+1")])
+    # A consumer that crashed after reading the entry.
+    await client.xreadgroup(config.group, "dead", {stream: ">"})
+    await asyncio.sleep(0.01)
+
+    assert await consumer.reclaim() == 1
+    await consumer.flush_acks()
+
+    assert delivered == ["{}"]
+    assert (await client.xpending(stream, config.group))["pending"] == 0
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_restarted_consumer_redelivers_own_pending_entries_once(
+    redis_url: str,
+) -> None:
+    """Test that a restart re-reads its own unacknowledged entries exactly once."""
+    prefix = f"test:{uuid.uuid4().hex}"
+    client = _client(redis_url)
+    config = replace(_config(prefix, consumer="restarted"), read_count=2)
+    stream = config.stream(config.partition_for("+1"))
+    publisher = RedisStreamPublisher(client, config, MessageParser())
+    await publisher.publish(
+        [
+            QueuedMessage(raw=str(seq), enqueued_at=0.0, recipient="+1")
+            for seq in range(5)
+        ]
+    )
+    delivered: list[str] = []
+
+    async def enqueue(queued_message: QueuedMessage) -> None:
+        delivered.append(queued_message.raw)
+        assert queued_message.ack is not None
+        queued_message.ack()
+
+    consumer = RedisStreamConsumer(client, config, enqueue)
+    await consumer.ensure_groups()
+    # The previous run read the entries but exited before acknowledging them.
+    await client.xreadgroup(config.group, config.consumer, {stream: ">"})
+
+    async def stop_when_idle() -> None:
+        while len(delivered) < 5:  # noqa: ASYNC110
+            await asyncio.sleep(0.01)
+        consumer.stop()
+
+    await asyncio.wait_for(asyncio.gather(consumer.run(), stop_when_idle()), timeout=5)
+
+    assert delivered == [str(seq) for seq in range(5)]
+    assert (await client.xpending(stream, config.group))["pending"] == 0
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_reclaim_leaves_entries_this_consumer_still_holds(redis_url: str) -> None:
+    """Test that an entry handled past claim_idle_ms is not delivered again."""
+    prefix = f"test:{uuid.uuid4().hex}"
+    client = _client(redis_url)
+    config = _config(prefix, claim_idle_ms=20, consumer="busy")
+    stream = config.stream(config.partition_for("+1"))
+    held: list[QueuedMessage] = []
+
+    async def enqueue(queued_message: QueuedMessage) -> None:
+        # The local pool keeps the message well past claim_idle_ms.
+        held.append(queued_message)
+
+    consumer = RedisStreamConsumer(client, config, enqueue)
+    await consumer.ensure_groups()
+    publisher = RedisStreamPublisher(client, config, MessageParser())
+    await publisher.publish([QueuedMessage(raw="{}", enqueued_at=0.0, recipient="+1")])
+    reader = asyncio.create_task(consumer.run())
+    deadline = time.monotonic() + 5
+    while not held and time.monotonic() < deadline:  # noqa: ASYNC110
+        await asyncio.sleep(0.01)
+    # Several reclaim rounds pass while the entry is still held.
+    await asyncio.sleep(0.2)
+
+    assert len(held) == 1
+    assert held[0].ack is not None
+    held[0].ack()
+    consumer.stop()
+    await asyncio.wait_for(reader, timeout=5)
+
+    assert len(held) == 1
+    assert (await client.xpending(stream, config.group))["pending"] == 0
+    await client.aclose()
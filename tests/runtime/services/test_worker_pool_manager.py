@@ -12,7 +12,8 @@ import pytest
 
 from signal_client import SignalClient
 from signal_client.adapters.api.schemas.message import Message
-from signal_client.core.command import Command, command
+from signal_client.adapters.storage.memory import MemoryStorage
+from signal_client.core.command import Command, batch_command, command
 from signal_client.core.context import Context
 from signal_client.core.context_deps import ContextDependencies
 from signal_client.exceptions import RateLimitError
@@ -23,9 +24,10 @@ from signal_client.observability.metrics import (
     MESSAGE_QUEUE_LATENCY,
     SHARD_QUEUE_DEPTH,
 )
-from signal_client.runtime.command_router import CommandRouter
+from signal_client.runtime.command_router import CommandRouter, _RegexIndex
 from signal_client.runtime.listener import MessageService
 from signal_client.runtime.models import QueuedMessage
+from signal_client.runtime.services.checkpoint_store import IngestCheckpointStore
 from signal_client.runtime.services.message_parser import MessageParser
 from signal_client.runtime.worker_pool import Worker, WorkerConfig, WorkerPool
 
@@ -58,11 +60,16 @@ def mock_command():
     return command
 
 
-def _build_worker_pool(
+def _build_worker_pool(  # noqa: PLR0913
     bot: SignalClient,
     *,
     pool_size: int = 1,
     shard_count: int | None = None,
+    direct_enqueue: bool = False,
+    work_stealing: bool = False,
+    max_inflight: int = 1,
+    conversation_max_inflight: int = 1,
+    process_executor: MagicMock | None = None,
 ) -> tuple[WorkerPool, asyncio.Queue[QueuedMessage]]:
     """Helper to build a WorkerPool instance."""
     queue: asyncio.Queue[QueuedMessage] = asyncio.Queue()
@@ -103,6 +110,11 @@ def _build_worker_pool(
         pool_size=pool_size,
         shard_count=shard_count,
         lock_manager=lock_manager,
+        direct_enqueue=direct_enqueue,
+        work_stealing=work_stealing,
+        max_inflight=max_inflight,
+        conversation_max_inflight=conversation_max_inflight,
+        process_executor=process_executor,
     )
     return manager, queue
 
@@ -200,6 +212,358 @@ def test_command_router_respects_registration_order_and_case():
     assert trigger == "!ping"
 
 
+def test_command_router_prefers_earliest_registered_prefix():
+    """Test that overlapping prefixes resolve by registration order, not length."""
+    router = CommandRouter()
+    short = Command(triggers=["!p"])
+    long = Command(triggers=["!PING"], case_sensitive=True)
+    router.register(short)
+    router.register(long)
+
+    assert router.match("!PING") == (short, "!p")
+    assert router.match("hello") == (None, None)
+
+    router = CommandRouter()
+    router.register(long)
+    router.register(short)
+    assert router.match("!PING") == (long, "!PING")
+    assert router.match("!ping") == (short, "!p")
+
+
+def test_command_router_rebuilds_index_after_register():
+    """Test that commands registered after a lookup are matched."""
+    router = CommandRouter()
+    router.register(Command(triggers=["!help"]))
+    assert router.match("!status") == (None, None)
+
+    status = Command(triggers=["!status"])
+    router.register(status)
+
+    assert router.match("!STATUS please") == (status, "!status")
+
+
+def test_command_router_regex_prefers_earliest_registered_pattern():
+    """Test that a regex registered first wins over one matching further left."""
+    router = CommandRouter()
+    late = Command(triggers=[re.compile(r"world")])
+    early = Command(triggers=[re.compile(r"hello")])
+    router.register(late)
+    router.register(early)
+
+    assert router.match("hello world") == (late, "world")
+    assert router.match("hello there") == (early, "hello")
+    assert router.match("nothing here") == (None, None)
+
+
+def test_command_router_regex_keeps_pattern_flags_and_groups():
+    """Test that flags, named groups and backreferences survive combination."""
+    router = CommandRouter()
+    shout = Command(triggers=[re.compile(r"^ping$", re.IGNORECASE)])
+    verbose = Command(
+        triggers=[re.compile(r"deploy \s+ (?P<env>\w+)  # target", re.VERBOSE)]
+    )
+    repeat = Command(triggers=[re.compile(r"(?P<word>\w+) (?P=word)")])
+    numbered = Command(triggers=[re.compile(r"(\d)-\1")])
+    for cmd in (shout, verbose, repeat, numbered):
+        router.register(cmd)
+
+    assert router.match("PING")[0] is shout
+    assert router.match("please deploy prod")[0] is verbose
+    assert router.match("again again")[0] is repeat
+    assert router.match("7-7")[0] is numbered
+    assert router.match("7-8") == (None, None)
+
+
+def test_command_router_regex_checks_global_inline_flags_individually():
+    """Test that a leading "(?x)" cannot leak into other patterns' branches."""
+    verbose = re.compile(r"(?x) deploy \s+ now")
+    spaced = re.compile(r"hello world")
+    router = CommandRouter()
+    verbose_command = Command(triggers=[verbose])
+    spaced_command = Command(triggers=[spaced])
+    router.register(verbose_command)
+    router.register(spaced_command)
+
+    index = _RegexIndex([(verbose, verbose_command), (spaced, spaced_command)])
+    assert index._eligible == [False, True]
+    assert router.match("say hello world")[0] is spaced_command
+    assert router.match("deploy   now")[0] is verbose_command
+
+
+def test_command_router_regex_index_rebuilds_after_register():
+    """Test that regex commands registered after a lookup are matched."""
+    router = CommandRouter()
+    router.register(Command(triggers=[re.compile(r"^alpha")]))
+    assert router.match("beta") == (None, None)
+
+    beta = Command(triggers=[re.compile(r"^beta")])
+    router.register(beta)
+
+    assert router.match("beta") == (beta, "^beta")
+
+
+@pytest.mark.asyncio
+async def test_worker_prefilter_skips_parsing_non_command_messages(
+    mock_context_factory, mock_command
+):
+    """Test that the prefilter checkpoints non-commands without a Context."""
+    router = CommandRouter()
+    router.register(mock_command)
+    queue: asyncio.Queue[QueuedMessage] = asyncio.Queue()
+    message_parser = MessageParser()
+    message_parser.event_from_envelope = MagicMock(  # type: ignore[method-assign]
+        wraps=message_parser.event_from_envelope
+    )
+    checkpoint_store = IngestCheckpointStore(MemoryStorage(), "checkpoints")
+    worker = Worker(
+        WorkerConfig(
+            context_factory=mock_context_factory,
+            queue=queue,
+            message_parser=message_parser,
+            router=router,
+            middleware=[],
+            checkpoint_store=checkpoint_store,
+            prefilter_commands=True,
+        )
+    )
+    acked: list[int] = []
+
+    def raw(text: str, timestamp: int) -> str:
+        return json.dumps(
+            {
+                "envelope": {
+                    "source": "+1",
+                    "timestamp": timestamp,
+                    "dataMessage": {"message": text},
+                }
+            }
+        )
+
+    for timestamp, text in ((1, "just chatting"), (2, "!test now")):
+        queue.put_nowait(
+            QueuedMessage(
+                raw=raw(text, timestamp),
+                enqueued_at=time.perf_counter(),
+                ack=lambda ts=timestamp: acked.append(ts),
+            )
+        )
+    mock_context_factory.return_value.message.message = "!test now"
+
+    task = asyncio.create_task(worker.process_messages())
+    await asyncio.wait_for(queue.join(), timeout=1)
+    worker.stop()
+    await asyncio.wait_for(task, timeout=2)
+
+    assert acked == [1, 2]
+    assert await checkpoint_store.is_duplicate("+1", 1)
+    assert await checkpoint_store.is_duplicate("+1", 2)
+    message_parser.event_from_envelope.assert_called_once()
+    mock_context_factory.assert_called_once()
+    mock_command.handle.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_worker_batch_mode_groups_batch_commands(make_raw_message) -> None:
+    """Test that a drained batch reaches a batch handler in one call."""
+    archived: list[list[str | None]] = []
+    pinged: list[int] = []
+
+    @batch_command("!log")
+    async def archive(contexts: list[Context]) -> None:
+        archived.append([ctx.message.message for ctx in contexts])
+
+    @command("!ping")
+    async def ping(ctx: Context) -> None:
+        pinged.append(ctx.message.timestamp)
+
+    router = CommandRouter()
+    router.register(archive)
+    router.register(ping)
+    queue: asyncio.Queue[QueuedMessage] = asyncio.Queue()
+    checkpoint_store = IngestCheckpointStore(MemoryStorage(), "checkpoints")
+    checkpoint_store.mark_processed = AsyncMock(  # type: ignore[method-assign]
+        wraps=checkpoint_store.mark_processed
+    )
+    checkpoint_store.mark_processed_many = AsyncMock(  # type: ignore[method-assign]
+        wraps=checkpoint_store.mark_processed_many
+    )
+    middleware_calls: list[int] = []
+
+    async def record(ctx: Context, nxt) -> None:
+        middleware_calls.append(ctx.message.timestamp)
+        await nxt(ctx)
+
+    worker = Worker(
+        WorkerConfig(
+            context_factory=lambda message: MagicMock(message=message),
+            queue=queue,
+            message_parser=MessageParser(),
+            router=router,
+            middleware=[record],
+            checkpoint_store=checkpoint_store,
+            batch_size=10,
+        )
+    )
+    frames = [(1, "!log a"), (2, "!ping"), (3, "!log b"), (4, "hello"), (1, "!log a")]
+    for timestamp, text in frames:
+        queue.put_nowait(
+            QueuedMessage(
+                raw=make_raw_message(text, timestamp=timestamp),
+                enqueued_at=time.perf_counter(),
+            )
+        )
+
+    task = asyncio.create_task(worker.process_messages())
+    await asyncio.wait_for(queue.join(), timeout=1)
+    worker.stop()
+    await asyncio.wait_for(task, timeout=2)
+
+    assert archived == [["!log a", "!log b"]]
+    assert pinged == [2]
+    assert middleware_calls == [2, 1, 3]
+    checkpoint_store.mark_processed.assert_not_awaited()
+    checkpoint_store.mark_processed_many.assert_awaited_once()
+    for timestamp in (1, 2, 3, 4):
+        assert await checkpoint_store.is_duplicate("+1234567890", timestamp)
+
+
+@pytest.mark.asyncio
+async def test_worker_batch_failure_releases_checkpoints(make_raw_message) -> None:
+    """Test that a failing batch handler sends every message to the DLQ."""
+
+    @batch_command("!log")
+    async def archive(contexts: list[Context]) -> None:
+        raise RuntimeError
+
+    router = CommandRouter()
+    router.register(archive)
+    queue: asyncio.Queue[QueuedMessage] = asyncio.Queue()
+    checkpoint_store = IngestCheckpointStore(MemoryStorage(), "checkpoints")
+    dead_letter_queue = MagicMock()
+    dead_letter_queue.send = AsyncMock()
+    worker = Worker(
+        WorkerConfig(
+            context_factory=lambda message: MagicMock(message=message),
+            queue=queue,
+            message_parser=MessageParser(),
+            router=router,
+            middleware=[],
+            dead_letter_queue=dead_letter_queue,
+            checkpoint_store=checkpoint_store,
+            batch_size=4,
+        )
+    )
+
+    await worker.process_batch(
+        [
+            QueuedMessage(
+                raw=make_raw_message("!log", timestamp=timestamp),
+                enqueued_at=time.perf_counter(),
+            )
+            for timestamp in (1, 2)
+        ]
+    )
+
+    assert dead_letter_queue.send.await_count == 2
+    assert _command_count("archive", "failure") >= 2
+    assert not await checkpoint_store.is_duplicate("+1234567890", 1)
+    assert not await checkpoint_store.is_duplicate("+1234567890", 2)
+
+
+@pytest.mark.asyncio
+async def test_worker_stop_wakes_idle_worker(mock_context_factory) -> None:
+    """Test that stopping an idle worker does not wait for a poll timeout."""
+    worker = Worker(
+        WorkerConfig(
+            context_factory=mock_context_factory,
+            queue=asyncio.Queue(),
+            message_parser=MessageParser(),
+            router=CommandRouter(),
+            middleware=[],
+        )
+    )
+    task = asyncio.create_task(worker.process_messages())
+    await asyncio.sleep(0)
+
+    worker.stop()
+
+    await asyncio.wait_for(task, timeout=0.1)
+    assert not task.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_worker_propagates_external_cancellation(mock_context_factory) -> None:
+    """Test that only the worker's own stop is swallowed on an idle queue."""
+    worker = Worker(
+        WorkerConfig(
+            context_factory=mock_context_factory,
+            queue=asyncio.Queue(),
+            message_parser=MessageParser(),
+            router=CommandRouter(),
+            middleware=[],
+        )
+    )
+    task = asyncio.create_task(worker.process_messages())
+    await asyncio.sleep(0)
+
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_shutdown_drains_within_deadline(
+    worker_pool_components,
+    make_raw_message,
+) -> None:
+    """Test that shutdown drains queued messages but honours its deadline."""
+    manager, queue = worker_pool_components
+    release = asyncio.Event()
+    handled: list[str | None] = []
+
+    @command("!slow")
+    async def slow(ctx: Context) -> None:
+        handled.append(ctx.message.message)
+        await release.wait()
+
+    @command("!fast")
+    async def fast(ctx: Context) -> None:
+        handled.append(ctx.message.message)
+
+    manager.register(slow)
+    manager.register(fast)
+    manager.start()
+    for timestamp, text in enumerate(("!fast", "!fast"), start=1):
+        await queue.put(
+            QueuedMessage(
+                raw=make_raw_message(text, timestamp=timestamp),
+                enqueued_at=time.perf_counter(),
+            )
+        )
+    await queue.put(
+        QueuedMessage(
+            raw=make_raw_message("!slow", timestamp=3),
+            enqueued_at=time.perf_counter(),
+        )
+    )
+    await queue.put(
+        QueuedMessage(
+            raw=make_raw_message("!fast", timestamp=4),
+            enqueued_at=time.perf_counter(),
+        )
+    )
+
+    shutdown = asyncio.create_task(manager.shutdown(drain_timeout=0.05))
+    await asyncio.sleep(0.1)
+    assert not shutdown.done()
+    release.set()
+    drained = await asyncio.wait_for(shutdown, timeout=1)
+
+    assert handled == ["!fast", "!fast", "!slow"]
+    assert drained is False
+
+
 @pytest.mark.asyncio
 async def test_worker_process_matches_insensitive_trigger(
     mock_context_factory, mock_queue, mock_message_parser, mock_command
@@ -350,6 +714,241 @@ async def test_worker_pool_end_to_end(
     mock_command.handle.assert_called_once()
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("prefilter", "validations"), [(False, 2), (True, 1)])
+async def test_worker_pool_decodes_each_frame_once(
+    mock_command: AsyncMock,
+    worker_pool_components,
+    make_raw_message,
+    prefilter: bool,  # noqa: FBT001
+    validations: int,
+) -> None:
+    """Test that the distributor and worker share one decode and validation."""
+    manager, queue = worker_pool_components
+    manager.register(mock_command)
+    manager._prefilter_commands = prefilter
+    parser = manager._message_parser
+    parser.decode = MagicMock(wraps=parser.decode)  # type: ignore[method-assign]
+    parser.event_from_envelope = MagicMock(  # type: ignore[method-assign]
+        wraps=parser.event_from_envelope
+    )
+
+    manager.start()
+    for text in ("!test", "hello"):
+        await queue.put(
+            QueuedMessage(raw=make_raw_message(text), enqueued_at=time.perf_counter())
+        )
+    await queue.join()
+    manager.stop()
+    await manager.join()
+
+    assert parser.decode.call_count == 2
+    assert parser.event_from_envelope.call_count == validations
+    mock_command.handle.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_direct_enqueue_skips_distributor(
+    mock_command: AsyncMock,
+    bot: SignalClient,
+    make_raw_message,
+) -> None:
+    """Test that producers can put messages straight into shard queues."""
+    await bot.app.initialize()
+    manager, queue = _build_worker_pool(bot, pool_size=2, direct_enqueue=True)
+    manager.register(mock_command)
+    manager.start()
+
+    targets: dict[str, asyncio.Queue[QueuedMessage]] = {}
+    for source in ("+1", "+2", "+1"):
+        queued = QueuedMessage(
+            raw=make_raw_message("!test", source=source),
+            enqueued_at=time.perf_counter(),
+        )
+        target = manager.select_queue(queued)
+        assert queued.recipient == source
+        assert targets.setdefault(source, target) is target
+        await target.put(queued)
+    await asyncio.wait_for(manager.wait_idle(), timeout=1)
+    await manager.shutdown()
+
+    assert manager._distributor_task is None
+    assert queue.empty()
+    assert mock_command.handle.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_work_stealing_unblocks_shared_shard(
+    bot: SignalClient,
+    make_raw_message,
+) -> None:
+    """Test that a slow conversation does not hold up others on its shard."""
+    await bot.app.initialize()
+    # "+1" and "+2" hash to shard 0 of 2, so without stealing they would
+    # queue behind each other on one worker.
+    manager, queue = _build_worker_pool(
+        bot, pool_size=2, shard_count=2, work_stealing=True
+    )
+    release = asyncio.Event()
+    other_handled = asyncio.Event()
+    handled: list[tuple[str, int]] = []
+
+    @command("!test")
+    async def handler(context: Context) -> None:
+        if context.message.source == "+1" and not release.is_set():
+            await release.wait()
+        handled.append((context.message.source, context.message.timestamp))
+        if context.message.source == "+2":
+            other_handled.set()
+
+    manager.register(handler)
+    manager.start()
+    for source, timestamp in (("+1", 1), ("+1", 2), ("+2", 3)):
+        await queue.put(
+            QueuedMessage(
+                raw=make_raw_message("!test", source=source, timestamp=timestamp),
+                enqueued_at=time.perf_counter(),
+            )
+        )
+
+    await asyncio.wait_for(other_handled.wait(), timeout=1)
+    assert handled == [("+2", 3)]
+    release.set()
+    await asyncio.wait_for(manager.wait_idle(), timeout=1)
+    await manager.shutdown()
+
+    assert handled == [("+2", 3), ("+1", 1), ("+1", 2)]
+    assert manager.queue_depth() == 0
+
+
+@pytest.mark.asyncio
+async def test_worker_overlaps_handlers_of_different_conversations(
+    bot: SignalClient,
+    make_raw_message,
+) -> None:
+    """Test that one worker runs another chat while a slow handler waits."""
+    await bot.app.initialize()
+    manager, queue = _build_worker_pool(bot, max_inflight=2)
+    release = asyncio.Event()
+    other_handled = asyncio.Event()
+    handled: list[str] = []
+
+    @command("!test")
+    async def handler(context: Context) -> None:
+        if context.message.source == "+1":
+            await release.wait()
+        else:
+            other_handled.set()
+        handled.append(context.message.source)
+
+    manager.register(handler)
+    manager.start()
+    for source in ("+1", "+2"):
+        await queue.put(
+            QueuedMessage(
+                raw=make_raw_message("!test", source=source),
+                enqueued_at=time.perf_counter(),
+            )
+        )
+
+    await asyncio.wait_for(other_handled.wait(), timeout=1)
+    release.set()
+    await asyncio.wait_for(manager.wait_idle(), timeout=1)
+    await manager.shutdown()
+
+    assert handled == ["+2", "+1"]
+
+
+@pytest.mark.asyncio
+async def test_worker_keeps_conversation_order_with_concurrent_handlers(
+    bot: SignalClient,
+    make_raw_message,
+) -> None:
+    """Test that concurrent handlers still run one conversation in order."""
+    await bot.app.initialize()
+    manager, queue = _build_worker_pool(bot, max_inflight=4)
+    active: set[str] = set()
+    handled: list[tuple[str, int]] = []
+
+    @command("!test")
+    async def handler(context: Context) -> None:
+        source = context.message.source
+        assert source not in active
+        active.add(source)
+        # Earlier messages take longer, so any reordering would show up.
+        await asyncio.sleep(0.01 * (4 - context.message.timestamp % 4))
+        active.discard(source)
+        handled.append((source, context.message.timestamp))
+
+    manager.register(handler)
+    manager.start()
+    for timestamp in range(1, 4):
+        for source in ("+1", "+2"):
+            await queue.put(
+                QueuedMessage(
+                    raw=make_raw_message("!test", source=source, timestamp=timestamp),
+                    enqueued_at=time.perf_counter(),
+                )
+            )
+    await asyncio.wait_for(manager.wait_idle(), timeout=2)
+    await manager.shutdown()
+
+    for source in ("+1", "+2"):
+        assert [ts for src, ts in handled if src == source] == [1, 2, 3]
+    assert manager._workers[0]._conversation_gates == {}
+
+
+@pytest.mark.asyncio
+async def test_worker_routes_process_commands_to_executor(
+    bot: SignalClient,
+    make_raw_message,
+) -> None:
+    """Test that process commands run through the process executor."""
+    await bot.app.initialize()
+    executor = MagicMock()
+    executor.run = AsyncMock()
+    manager, queue = _build_worker_pool(bot, process_executor=executor)
+    process_command = Command(triggers=["!cpu"], executor="process")
+    process_command.handle = AsyncMock()
+    manager.register(process_command)
+    manager.start()
+
+    await queue.put(
+        QueuedMessage(raw=make_raw_message("!cpu"), enqueued_at=time.perf_counter())
+    )
+    await asyncio.wait_for(manager.wait_idle(), timeout=1)
+    await manager.shutdown()
+
+    executor.run.assert_awaited_once()
+    assert executor.run.await_args.args[0] is process_command
+    process_command.handle.assert_not_awaited()
+    executor.shutdown.assert_called_once_with()
+
+
+def test_worker_pool_rejects_work_stealing_with_direct_enqueue() -> None:
+    """Test that work stealing requires the distributor."""
+    with pytest.raises(ValueError, match="work_stealing"):
+        WorkerPool(
+            context_factory=MagicMock(),
+            queue=asyncio.Queue(),
+            message_parser=MessageParser(),
+            direct_enqueue=True,
+            work_stealing=True,
+        )
+
+
+def test_worker_pool_rejects_concurrent_handlers_with_batches() -> None:
+    """Test that concurrent handlers and batch mode are mutually exclusive."""
+    with pytest.raises(ValueError, match="max_inflight"):
+        WorkerPool(
+            context_factory=MagicMock(),
+            queue=asyncio.Queue(),
+            message_parser=MessageParser(),
+            batch_size=8,
+            max_inflight=4,
+        )
+
+
 @pytest.mark.asyncio
 async def test_worker_pool_handles_regex_triggers(
     worker_pool_components,
@@ -0,0 +1,80 @@
+"""Opt-in queue consumption benchmark: `wait_for` polling versus a parked get.
+
+Set RUN_PERFORMANCE_TESTS=1 and run with `pytest -m performance -s` to see the
+per-message scheduling cost of the worker loops, both when the consumer parks
+on an empty queue for every message and when it finds the queue backlogged.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from collections.abc import Awaitable, Callable
+
+import pytest
+
+from signal_client.runtime.worker_pool import _QueueWaiter
+
+pytestmark = [
+    pytest.mark.performance,
+    pytest.mark.skipif(
+        bool(os.environ.get("CI")),
+        reason="Performance benchmark is disabled on CI runners.",
+    ),
+    pytest.mark.skipif(
+        not bool(os.environ.get("RUN_PERFORMANCE_TESTS")),
+        reason=(
+            "Performance benchmark is opt-in; set RUN_PERFORMANCE_TESTS=1 to enable."
+        ),
+    ),
+]
+
+NUM_MESSAGES = 20000
+
+Consumer = Callable[["asyncio.Queue[object]"], Awaitable[None]]
+
+
+async def _polling_consumer(queue: asyncio.Queue[object]) -> None:
+    for _ in range(NUM_MESSAGES):
+        await asyncio.wait_for(queue.get(), timeout=1.0)
+        queue.task_done()
+
+
+async def _waiter_consumer(queue: asyncio.Queue[object]) -> None:
+    waiter = _QueueWaiter(queue)  # type: ignore[arg-type]
+    for _ in range(NUM_MESSAGES):
+        await waiter.get()
+        queue.task_done()
+
+
+async def _microseconds_per_message(consumer: Consumer, *, backlogged: bool) -> float:
+    queue: asyncio.Queue[object] = asyncio.Queue()
+    if backlogged:
+        for index in range(NUM_MESSAGES):
+            queue.put_nowait(index)
+    start = time.perf_counter()
+    task = asyncio.create_task(consumer(queue))
+    if not backlogged:
+        for index in range(NUM_MESSAGES):
+            queue.put_nowait(index)
+            # Let the consumer take the message and park on the empty queue.
+            await asyncio.sleep(0)
+    await task
+    return (time.perf_counter() - start) / NUM_MESSAGES * 1_000_000
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backlogged", [False, True])
+async def test_parked_get_reduces_scheduling_overhead(
+    backlogged: bool,  # noqa: FBT001
+) -> None:
+    """Compare the old polling loop with the parked get used by workers."""
+    polling = await _microseconds_per_message(_polling_consumer, backlogged=backlogged)
+    parked = await _microseconds_per_message(_waiter_consumer, backlogged=backlogged)
+
+    print(
+        f"\nbacklogged={backlogged}: wait_for polling {polling:.2f}us/msg, "
+        f"parked get {parked:.2f}us/msg ({polling / parked:.1f}x)"
+    )
+    assert parked < polling
@@ -0,0 +1,138 @@
+"""Tests for write-behind buffering of storage writes."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+from signal_client.adapters.storage.memory import MemoryStorage
+from signal_client.app import Application
+from signal_client.core.config import Settings
+from signal_client.runtime.services.checkpoint_store import IngestCheckpointStore
+from signal_client.runtime.services.persistent_queue import PersistentQueue
+from signal_client.runtime.services.write_behind import (
+    WriteBehindBuffer,
+    WriteBehindConfig,
+)
+
+
+@pytest.mark.asyncio
+async def test_buffer_flushes_when_record_bound_is_reached() -> None:
+    """Test that a full buffer is flushed as a single batch."""
+    batches: list[list[dict[str, Any]]] = []
+
+    async def flush(records: list[dict[str, Any]]) -> None:
+        batches.append(records)
+
+    buffer = WriteBehindBuffer(flush, WriteBehindConfig(max_records=3, max_delay=60))
+    for idx in range(3):
+        await buffer.add({"idx": idx})
+
+    assert batches == [[{"idx": 0}, {"idx": 1}, {"idx": 2}]]
+    assert buffer.pending_count == 0
+    await buffer.close()
+
+
+@pytest.mark.asyncio
+async def test_buffer_flushes_after_delay() -> None:
+    """Test that pending records are flushed once the delay elapses."""
+    flush = AsyncMock()
+    buffer = WriteBehindBuffer(flush, WriteBehindConfig(max_records=10, max_delay=0.01))
+
+    await buffer.add({"idx": 1})
+    await buffer.add({"idx": 2})
+    flush.assert_not_awaited()
+
+    await asyncio.sleep(0.05)
+    flush.assert_awaited_once_with([{"idx": 1}, {"idx": 2}])
+
+
+@pytest.mark.asyncio
+async def test_buffer_keeps_records_when_flush_fails() -> None:
+    """Test that a failed batch is retried ahead of newer records."""
+    flush = AsyncMock(side_effect=[RuntimeError("boom"), None])
+    buffer = WriteBehindBuffer(flush, WriteBehindConfig(max_records=10, max_delay=60))
+    await buffer.add({"idx": 1})
+
+    with pytest.raises(RuntimeError):
+        await buffer.flush()
+    await buffer.add({"idx": 2})
+    await buffer.close()
+
+    assert flush.await_args_list[-1].args == ([{"idx": 1}, {"idx": 2}],)
+
+
+@pytest.mark.asyncio
+async def test_persistent_queue_batches_appends() -> None:
+    """Test that buffered queue appends reach storage in one call."""
+    storage = MemoryStorage()
+    storage.append = AsyncMock(wraps=storage.append)  # type: ignore[method-assign]
+    storage.append_many = AsyncMock(wraps=storage.append_many)  # type: ignore[method-assign]
+    queue = PersistentQueue(
+        storage,
+        "ingest",
+        write_behind=WriteBehindConfig(max_records=2, max_delay=60),
+    )
+
+    await queue.append("one", enqueued_at=1.0)
+    assert await storage.read_all("ingest") == []
+    await queue.append("two", enqueued_at=2.0)
+
+    storage.append.assert_not_awaited()
+    storage.append_many.assert_awaited_once()
+    assert [record["raw"] for record in await storage.read_all("ingest")] == [
+        "one",
+        "two",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_store_flushes_on_close() -> None:
+    """Test that buffered checkpoints are persisted when the store closes."""
+    storage = MemoryStorage()
+    store = IngestCheckpointStore(
+        storage,
+        "checkpoints",
+        incremental=True,
+        write_behind=WriteBehindConfig(max_records=100, max_delay=60),
+    )
+    await store.mark_processed("+1", 1)
+    await store.mark_processed("+1", 2)
+    assert await storage.read_all("checkpoints") == []
+    assert await store.is_duplicate("+1", 2)
+
+    await store.close()
+
+    stored = await storage.read_all("checkpoints")
+    assert [record["timestamp"] for record in stored] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_application_shutdown_flushes_pending_writes() -> None:
+    """Test that Application.shutdown flushes buffered durable queue writes."""
+    settings = Settings.from_sources(
+        config={
+            "phone_number": "+15550000001",
+            "signal_service": "http://localhost:8080",
+            "base_url": "http://localhost:8080",
+            "durable_queue_enabled": True,
+            "write_behind_enabled": True,
+            "write_behind_max_records": 100,
+            "write_behind_max_delay_ms": 60000,
+        }
+    )
+    app = Application(settings)
+    await app.initialize()
+    assert app.persistent_queue is not None
+    flushed = AsyncMock()
+    app.storage.append_many = flushed  # type: ignore[method-assign]
+
+    await app.persistent_queue.append("pending", enqueued_at=1.0)
+    flushed.assert_not_awaited()
+    await app.shutdown()
+
+    flushed.assert_awaited_once()
+    assert flushed.await_args.args[0] == settings.ingest_queue_name